@@ -0,0 +1,129 @@
+"""
+Benchmark de colisão: o CollisionProcessor real e a broadphase (SpatialHash).
+
+Uso:
+    python -m benchmarks.bench_collision [--sizes 1000 10000 50000]
+
+Cenário A: `CollisionProcessor.process` de uma GameScene headless com N tiros
+    vivos no PatternEngine, longe do player (pior caso: varredura completa, sem
+    acerto). A coluna "ingênuo" é a versão anterior da Parte 3 (um
+    `pygame.Rect` por tiro e `collidelist`), medida sobre as mesmas posições.
+Cenário B: N lasers contra N/100 alvos (Parte 4, com muitos alvos na tela).
+    O tempo da grade inclui a reconstrução completa a cada frame.
+"""
+
+import argparse
+import random
+import time
+
+import esper
+import pygame
+
+from src.core.components import Invincibility, Sprite, Transform
+from src.core.patterns import PatternEngine
+from src.core.resources import PLAYER
+from src.core.scene import SceneManager
+from src.core.spatial import SpatialHash
+from src.headless import setup_headless_display
+from src.scenes.game import GameScene
+from src.settings import COLLISION_CELL_SIZE, WINDOW_HEIGHT, WINDOW_WIDTH
+
+
+def _random_rects(rng: random.Random, count: int, w: int, h: int) -> list:
+    return [
+        pygame.Rect(rng.uniform(0, WINDOW_WIDTH), rng.uniform(0, WINDOW_HEIGHT), w, h)
+        for _ in range(count)
+    ]
+
+
+def _best_of(fn, repeat: int) -> float:
+    """Menor tempo (ms) entre `repeat` execuções, para reduzir ruído."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _fill_bullets(bullets: PatternEngine, rng: random.Random, count: int):
+    """`count` tiros parados na metade de cima da tela (o player fica embaixo)."""
+    bullets.clear()
+    bullets.on_full = "grow"
+    for _ in range(count):
+        x = rng.uniform(0, WINDOW_WIDTH)
+        y = rng.uniform(0, WINDOW_HEIGHT / 2)
+        bullets.add("linear", x, y, 0.0, 0.0)
+
+
+def bench_player_vs_bullets(scene: GameScene, count: int, repeat: int, rng):
+    esper.switch_world(scene.world_name)
+    bullets = scene.bullets
+    _fill_bullets(bullets, rng, count)
+    trans, sprite, inv = scene.resources.components(
+        PLAYER, Transform, Sprite, Invincibility
+    )
+    player = pygame.Rect(trans.x, trans.y, sprite.width, sprite.height)
+    w, h = bullets.sprite.width, bullets.sprite.height
+
+    def naive():
+        xs, ys = bullets.positions()
+        rects = [pygame.Rect(x, y, w, h) for x, y in zip(xs.tolist(), ys.tolist())]
+        player.collidelist(rects)
+
+    def real():
+        inv.is_active = False  # Player sempre vulnerável: a Parte 3 testa os tiros
+        scene.collision_processor.process(0.0)
+
+    naive_ms, real_ms = _best_of(naive, repeat), _best_of(real, repeat)
+    assert len(bullets) == count, "algum tiro acertou o player"
+    return naive_ms, real_ms
+
+
+def bench_lasers_vs_targets(lasers: list, targets: list, repeat: int):
+    def naive():
+        for laser in lasers:
+            for target in targets:
+                if laser.colliderect(target):
+                    break
+
+    grid = SpatialHash(COLLISION_CELL_SIZE)
+
+    def hashed():
+        grid.clear()
+        for i, rect in enumerate(targets):
+            grid.insert(rect, i)
+        for laser in lasers:
+            grid.first_hit(laser)
+
+    return _best_of(naive, repeat), _best_of(hashed, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_headless_display()
+    manager = SceneManager()
+    scene = GameScene(manager, seed=args.seed)
+    manager.switch_to(scene)
+    rng = random.Random(args.seed)
+
+    print(f"{'cenário':<22}{'N':>8}{'ingênuo (ms)':>15}{'novo (ms)':>13}{'ganho':>8}")
+    for n in args.sizes:
+        naive, hashed = bench_player_vs_bullets(scene, n, args.repeat, rng)
+        print(f"{'A: player x tiros':<22}{n:>8}{naive:>15.2f}{hashed:>13.2f}", end="")
+        print(f"{naive / hashed:>7.1f}x")
+
+        lasers = _random_rects(rng, n, 4, 10)
+        targets = _random_rects(rng, max(1, n // 100), 64, 64)
+        naive, hashed = bench_lasers_vs_targets(lasers, targets, args.repeat)
+        print(f"{'B: lasers x alvos':<22}{n:>8}{naive:>15.2f}{hashed:>13.2f}", end="")
+        print(f"{naive / hashed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark do vencimento dos tiros: coluna de prazos contra min-heap.
+
+Uso:
+    python -m benchmarks.bench_expiry [--sizes 1000 10000 50000]
+
+Regime estável com N tiros vivos a 60 passos/s: a cada passo os tiros vencidos
+saem e o mesmo número entra, com vidas de 1 a 10 s. Mede, por passo, só o
+custo do vencimento (agendar os novos, achar os vencidos e compactar a coluna
+de controle), igual nos dois lados:
+
+- coluna: o que o PatternEngine faz (`deadline[:n] <= clock`, vetorizado).
+- heap: a versão anterior, um `heapq` de (prazo, série) com busca binária
+  da série nos slots vivos. O(vencidos) na busca, mas um push/pop em Python
+  por tiro e uma tupla por tiro na memória.
+"""
+
+import argparse
+import heapq
+import time
+
+import numpy as np
+
+STEP = 1.0 / 60
+
+
+class ColumnDeadlines:
+    """Prazos numa coluna paralela aos slots (PatternEngine)."""
+
+    def __init__(self):
+        self.deadline = np.zeros(0)
+
+    def schedule(self, deadlines: np.ndarray):
+        self.deadline = np.concatenate([self.deadline, deadlines])
+
+    def due(self, clock: float) -> np.ndarray:
+        return np.flatnonzero(self.deadline <= clock)
+
+    def remove(self, keep: np.ndarray):
+        self.deadline = self.deadline[keep]
+
+
+class HeapDeadlines:
+    """Prazos num min-heap; a série acha o slot (slots em ordem de disparo)."""
+
+    def __init__(self):
+        self.heap: list[tuple[float, int]] = []
+        self.serial = np.zeros(0, dtype=np.int64)
+        self.next_serial = 0
+
+    def schedule(self, deadlines: np.ndarray):
+        count = len(deadlines)
+        serials = np.arange(self.next_serial, self.next_serial + count)
+        self.next_serial += count
+        self.serial = np.concatenate([self.serial, serials])
+        push = heapq.heappush
+        for serial, deadline in zip(serials.tolist(), deadlines.tolist()):
+            push(self.heap, (deadline, serial))
+
+    def due(self, clock: float) -> np.ndarray:
+        heap = self.heap
+        wanted = []
+        while heap and heap[0][0] <= clock:
+            wanted.append(heapq.heappop(heap)[1])
+        return np.searchsorted(self.serial, np.asarray(wanted, dtype=np.int64))
+
+    def remove(self, keep: np.ndarray):
+        self.serial = self.serial[keep]
+
+
+def bench(tracker, size: int, steps: int, rng: np.random.Generator) -> float:
+    """ms médios por passo com `size` tiros vivos."""
+    clock = 0.0
+    tracker.schedule(rng.uniform(1.0, 10.0, size))
+    # Aquece até o regime estável (prazos espalhados, não todos do spawn inicial)
+    total = 0.0
+    for step in range(steps * 2):
+        start = time.perf_counter()
+        clock += STEP
+        due = tracker.due(clock)
+        if len(due):
+            keep = np.ones(size, dtype=bool)
+            keep[due] = False
+            tracker.remove(keep)
+            tracker.schedule(clock + rng.uniform(1.0, 10.0, len(due)))
+        if step >= steps:
+            total += time.perf_counter() - start
+    return total / steps * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--steps", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'N':>8}{'coluna (ms)':>14}{'heap (ms)':>12}{'ganho':>8}")
+    for size in args.sizes:
+        rng = np.random.default_rng(args.seed)
+        column = bench(ColumnDeadlines(), size, args.steps, rng)
+        rng = np.random.default_rng(args.seed)  # Mesma sequência de vidas
+        heap = bench(HeapDeadlines(), size, args.steps, rng)
+        print(f"{size:>8}{column:>14.3f}{heap:>12.3f}{heap / column:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
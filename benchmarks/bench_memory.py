@@ -0,0 +1,92 @@
+"""
+Benchmark de memória: bytes por tiro inimigo vivo.
+
+Uso:
+    python -m benchmarks.bench_memory [--count 50000]
+
+Cria `count` tiros com `create_enemy_bullet` em um mundo esper próprio e mede o
+que foi alocado: a memória residente do processo (RSS) e, numa segunda rodada, o
+tracemalloc (bytes Python por tiro). Os tiros não são entidades: também lista os
+arrays do PatternEngine e quantos bytes cada um ocupa por slot.
+"""
+
+import argparse
+import gc
+import math
+import tracemalloc
+
+import esper
+
+from benchmarks.bench_restarts import resident_mb
+from src.core.patterns import PatternEngine
+from src.core.resources import world_resources
+from src.core.worlds import destroy_world
+from src.entities import create_enemy_bullet, create_enemy_bullets
+from src.headless import setup_headless_display
+
+WORLD = "bench_memory"
+
+
+def spawn_bullets(count: int):
+    create_enemy_bullets(WORLD).on_full = "grow"  # Cabe tudo, sem reciclar
+    for i in range(count):
+        angle = i * 2 * math.pi / count
+        create_enemy_bullet(WORLD, 450.0, 100.0, "sine", angle, 100.0 + i % 50)
+
+
+def measure_rss(count: int) -> float:
+    """MB residentes a mais com `count` tiros vivos (sem o custo do tracemalloc)."""
+    gc.collect()
+    before = resident_mb()
+    spawn_bullets(count)
+    gc.collect()
+    return resident_mb() - before
+
+
+def measure_traced(count: int) -> int:
+    """Bytes alocados pelo Python para criar `count` tiros."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    spawn_bullets(count)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before
+
+
+def print_columns():
+    esper.switch_world(WORLD)
+    bullets = world_resources()[PatternEngine]
+    print(f"{'array':<12}{'bytes/slot':>12}")
+    total = 0
+    for name in ("kind", *PatternEngine._FLOAT_FIELDS):
+        itemsize = getattr(bullets, name).itemsize
+        total += itemsize
+        print(f"{name:<12}{itemsize:>12}")
+    print(f"{'total':<12}{total:>12}")
+    print(f"slots: {len(bullets)} vivos / {bullets.capacity} alocados")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória por tiro inimigo")
+    parser.add_argument("--count", type=int, default=50000)
+    args = parser.parse_args()
+
+    setup_headless_display()
+    spawn_bullets(1)  # Aquece caches (atlas, região do tiro) fora da medição
+    destroy_world(WORLD)
+
+    rss = measure_rss(args.count)
+    print(f"tiros vivos: {args.count}")
+    print(f"RSS: {rss:+.1f} MB ({rss * 2**20 / args.count:.0f} B/tiro)")
+    print_columns()
+    destroy_world(WORLD)
+
+    traced = measure_traced(args.count)
+    print(f"tracemalloc: {traced / 2**20:.1f} MB ({traced / args.count:.0f} B/tiro)")
+    destroy_world(WORLD)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark de reinícios: memória residente depois de N partidas seguidas.
+
+Uso:
+    python -m benchmarks.bench_restarts [--restarts 100] [--frames 120]
+
+Cada ciclo joga `frames` frames de uma GameScene (com draw) e volta ao menu, como
+um quiosque reiniciando o jogo. A quantidade de objetos Python depois do 1º ciclo
+deve ser a mesma depois do último, a memória residente (RSS) só sobe alguns MB nos
+primeiros ciclos (aquecimento do alocador) e o relatório final não deve mostrar
+mundos de partidas antigas.
+"""
+
+import argparse
+import gc
+import os
+
+from src.core.input import STRAFE_SCRIPT, ScriptedInput
+from src.core.scene import SceneManager
+from src.core.worlds import format_report, world_report
+from src.headless import setup_headless_display
+from src.scenes.game import GameScene
+from src.scenes.menu import MenuScene
+from src.settings import FPS
+
+
+def resident_mb() -> float:
+    """Memória residente atual do processo (MB); Linux via /proc."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+
+        # Fora do Linux: pico de memória (ainda acusa crescimento contínuo)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def play_once(manager: SceneManager, seed: int, frames: int):
+    manager.switch_to(GameScene(manager, ScriptedInput(STRAFE_SCRIPT), seed=seed))
+    for _ in range(frames):
+        manager.run(1.0 / FPS)
+    manager.switch_to(MenuScene)
+    manager.update(1.0 / FPS)  # Fim do update: cenas que saíram são destruídas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória após reinícios")
+    parser.add_argument("--restarts", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    setup_headless_display()
+    manager = SceneManager()
+
+    play_once(manager, 0, args.frames)
+    gc.collect()
+    first, first_objects = resident_mb(), len(gc.get_objects())
+    print(f"após 1 partida: {first:.1f} MB, {first_objects} objetos Python")
+
+    for restart in range(1, args.restarts):
+        play_once(manager, restart, args.frames)
+    gc.collect()
+    last, last_objects = resident_mb(), len(gc.get_objects())
+    print(
+        f"após {args.restarts} partidas: {last:.1f} MB ({last - first:+.1f} MB), "
+        f"{last_objects} objetos Python ({last_objects - first_objects:+d})"
+    )
+    print(format_report(world_report()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark do spawn de rajadas: custo do frame em que o inimigo dispara.
+
+Uso:
+    python -m benchmarks.bench_volley [--sizes 8 100 500 1000]
+
+Para cada tamanho, compila um golpe em anel com N tiros e mede, numa GameScene
+headless, o spawn em lote (`spawn_volley`) no PatternEngine do mundo. Os slots
+crescem sob demanda ("grow") para que cada rajada entre inteira. "Frio" é a
+primeira rajada; "quente" é a média das seguintes, com os tiros anteriores vivos.
+"""
+
+import argparse
+import time
+
+from src.core.patterns import compile_volley
+from src.core.scene import SceneManager
+from src.entities import spawn_volley
+from src.headless import setup_headless_display
+from src.scenes.game import GameScene
+
+
+def bench_volley(size: int, repeat: int) -> tuple[float, float]:
+    manager = SceneManager()
+    scene = GameScene(manager, seed=0)
+    manager.switch_to(scene)
+    scene.bullets.on_full = "grow"
+    volley = compile_volley(
+        {"name": "bench", "type": "sine", "ring": {"count": size}, "speed": [50, 150]}
+    )
+
+    def fire() -> float:
+        start = time.perf_counter()
+        spawn_volley(scene.world_name, volley, 450, 100, scene.rng)
+        return (time.perf_counter() - start) * 1000
+
+    cold = fire()
+    warm = sum(fire() for _ in range(repeat)) / repeat
+    return cold, warm
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de rajadas")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 100, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_headless_display()
+    print(f"{'tiros':>8}{'frio (ms)':>12}{'quente (ms)':>13}")
+    for size in args.sizes:
+        cold, warm = bench_volley(size, args.repeat)
+        print(f"{size:>8}{cold:>12.2f}{warm:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
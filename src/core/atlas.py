@@ -0,0 +1,205 @@
+"""
+Atlas de sprites: frames e sprites procedurais empacotados em poucas Surfaces.
+
+Em vez de uma Surface (ou subsurface) por frame e por projétil, cada imagem é\
+    copiada uma vez para uma "página" grande e passa a ser referida por um par\
+        (página, área). O RenderProcessor desenha com o argumento `area` do `blits`,\
+            então a lista de um frame inteiro aponta para um punhado de Surfaces.
+
+As regiões são indexadas por chave: pedir de novo a mesma chave devolve a mesma\
+    região, sem copiar pixels. Variantes (piscar/flash) são feitas por página\
+        inteira, com as mesmas áreas, e descartadas quando a página ganha imagens.
+"""
+
+from collections.abc import Hashable, Sequence
+from typing import NamedTuple
+
+import pygame
+
+from src.core.variants import variants
+from src.settings import ATLAS_PADDING, ATLAS_PAGE_SIZE
+
+
+class AtlasRegion(NamedTuple):
+    """Imagem dentro de uma página do atlas (desempacota como `surface, area`)."""
+
+    surface: pygame.Surface
+    area: pygame.Rect
+
+    @property
+    def width(self) -> int:
+        return self.area.width
+
+    @property
+    def height(self) -> int:
+        return self.area.height
+
+
+class ShelfPacker:
+    """
+    Empacotador de retângulos por prateleiras.
+
+    Cada prateleira tem a altura do primeiro retângulo que a abriu; os seguintes
+    entram na prateleira de menor sobra de altura onde couberem. Inserir em ordem
+    decrescente de altura (como faz `Atlas.add_many`) deixa pouco espaço perdido.
+    """
+
+    def __init__(self, width: int, height: int, padding: int = 0):
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.used_area = 0
+        # [y, altura, próximo x livre]
+        self._shelves: list[list[int]] = []
+        self._next_y = 0
+
+    @property
+    def occupancy(self) -> float:
+        """Fração da página ocupada por pixels de imagens."""
+        return self.used_area / (self.width * self.height)
+
+    def insert(self, w: int, h: int) -> tuple[int, int] | None:
+        """
+        Reserva um retângulo `w` x `h`.
+
+        Returns:
+            tuple[int, int] | None: Canto superior esquerdo, ou None se não cabe.
+        """
+        pw, ph = w + self.padding, h + self.padding
+        best: list[int] | None = None
+        for shelf in self._shelves:
+            y, shelf_h, x = shelf
+            if ph <= shelf_h and x + pw <= self.width:
+                if best is None or shelf_h < best[1]:
+                    best = shelf
+
+        if best is None:
+            if pw > self.width or self._next_y + ph > self.height:
+                return None
+            best = [self._next_y, ph, 0]
+            self._shelves.append(best)
+            self._next_y += ph
+
+        pos = (best[2], best[0])
+        best[2] += pw
+        self.used_area += w * h
+        return pos
+
+
+class Atlas:
+    """Páginas de tamanho fixo com as regiões de todos os sprites do jogo."""
+
+    def __init__(self, page_size: int = ATLAS_PAGE_SIZE, padding: int = ATLAS_PADDING):
+        """
+        Args:
+            page_size (int): Lado (px) de cada página.
+            padding (int): Espaço (px) entre regiões vizinhas.
+        """
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: list[pygame.Surface] = []
+        self._packers: list[ShelfPacker] = []
+        self._regions: dict[Hashable, AtlasRegion] = {}
+        self._animations: dict[Hashable, list[AtlasRegion]] = {}
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._regions
+
+    def stats(self) -> dict[str, float]:
+        """Contadores para debug/benchmarks."""
+        return {
+            "pages": len(self.pages),
+            "regions": len(self._regions),
+            "occupancy": (
+                sum(p.occupancy for p in self._packers) / len(self._packers)
+                if self._packers
+                else 0.0
+            ),
+        }
+
+    def _new_page(self) -> int:
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()  # Mesmo formato dos frames do jogo
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self._packers.append(ShelfPacker(self.page_size, self.page_size, self.padding))
+        return len(self.pages) - 1
+
+    def _place(self, w: int, h: int) -> tuple[int, tuple[int, int]]:
+        for index, packer in enumerate(self._packers):
+            pos = packer.insert(w, h)
+            if pos is not None:
+                return index, pos
+        index = self._new_page()
+        return index, self._packers[index].insert(w, h)
+
+    def add_many(
+        self, items: Sequence[tuple[Hashable, pygame.Surface]]
+    ) -> list[AtlasRegion]:
+        """
+        Copia as imagens ainda ausentes para o atlas (as mais altas primeiro).
+
+        Args:
+            items (Sequence[tuple[Hashable, pygame.Surface]]): Pares (chave,
+                imagem). A imagem não é guardada: pode ser descartada depois.
+
+        Returns:
+            list[AtlasRegion]: Uma região por item, na ordem pedida.
+        """
+        missing = {key: surf for key, surf in items if key not in self._regions}
+        touched: set[int] = set()
+        for key, surface in sorted(missing.items(), key=lambda i: -i[1].get_height()):
+            w, h = surface.get_size()
+            if w > self.page_size or h > self.page_size:
+                raise ValueError(
+                    f"Imagem {w}x{h} maior que a página do atlas ({self.page_size})"
+                )
+            index, (x, y) = self._place(w, h)
+            # Área transparente: o blit copia os pixels (e o alfa) exatamente
+            self.pages[index].blit(surface, (x, y))
+            self._regions[key] = AtlasRegion(self.pages[index], pygame.Rect(x, y, w, h))
+            touched.add(index)
+
+        # Variantes antigas não têm as imagens novas
+        for index in touched:
+            variants.invalidate(self.pages[index])
+        return [self._regions[key] for key, _ in items]
+
+    def add(self, key: Hashable, surface: pygame.Surface) -> AtlasRegion:
+        return self.add_many([(key, surface)])[0]
+
+    def frames(
+        self, key: Hashable, surfaces: Sequence[pygame.Surface]
+    ) -> list[AtlasRegion]:
+        """
+        Copia os frames de uma animação (chaves `(key, 0)`, `(key, 1)`, ...).
+
+        Returns:
+            list[AtlasRegion]: Lista compartilhada (não alterar), também
+                devolvida depois por `animation(key)`.
+        """
+        regions = self.add_many([((key, i), s) for i, s in enumerate(surfaces)])
+        self._animations[key] = regions
+        return regions
+
+    def animation(self, key: Hashable) -> list[AtlasRegion] | None:
+        """Frames já copiados com `frames(key, ...)`, ou None."""
+        return self._animations.get(key)
+
+    def solid(self, size: tuple[int, int], color) -> AtlasRegion:
+        """Retângulo de cor sólida (projéteis), compartilhado por chave."""
+        key = ("solid", tuple(size), str(color))
+        region = self._regions.get(key)
+        if region is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            region = self.add(key, surface)
+        return region
+
+
+# Atlas único do processo (como o cache de assets)
+atlas = Atlas()
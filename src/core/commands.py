@@ -0,0 +1,105 @@
+"""
+Buffer de comandos: mudanças estruturais adiadas para um ponto de sincronização.
+
+Durante o frame os sistemas só enfileiram spawns, despawns e adições/remoções de\
+    componentes; `flush()` aplica tudo de uma vez no fim do update. Assim nenhum\
+        sistema altera o mundo enquanto outro itera, não é preciso checar\
+            `entity_exists` antes de cada remoção e despawns repetidos viram um só.
+"""
+
+from typing import Any
+
+import esper
+
+from src.core.pool import despawn
+from src.core.query import add_components
+
+# Tipos de operação enfileirada
+_SPAWN, _ADD, _REMOVE = 0, 1, 2
+
+
+class CommandBuffer:
+    """
+    Fila de mudanças estruturais de um mundo esper.
+
+    A ordem de enfileiramento é preservada para spawns e adições/remoções; os
+    despawns (sem duplicatas) são aplicados por último, de modo que componentes
+    adicionados a uma entidade que morre no mesmo frame não deixam resto.
+    """
+
+    def __init__(self):
+        self._ops: list[tuple[int, Any, tuple]] = []
+        # Entidades que recebem componentes no próximo flush (ex: tiros do pool
+        # já reservados, que ainda não aparecem nas consultas)
+        self.pending_adds: set[int] = set()
+        # Dicionário preserva a ordem e descarta despawns repetidos
+        self._despawns: dict[int, None] = {}
+        self.applied_last_flush = 0
+
+    def __len__(self) -> int:
+        return len(self._ops) + len(self._despawns)
+
+    def spawn(self, *components: Any):
+        """Cria uma entidade com os componentes no próximo `flush`."""
+        self._ops.append((_SPAWN, None, components))
+
+    def add(self, ent: int, *components: Any):
+        """Adiciona (ou substitui) componentes de `ent` no próximo `flush`."""
+        self._ops.append((_ADD, ent, components))
+        self.pending_adds.add(ent)
+
+    def remove(self, ent: int, *component_types: type):
+        """Remove componentes de `ent` no próximo `flush` (ausentes são ignorados)."""
+        self._ops.append((_REMOVE, ent, component_types))
+
+    def despawn(self, ent: int):
+        """Remove `ent` do jogo no próximo `flush` (volta ao pool se for reciclável)."""
+        self._despawns[ent] = None
+
+    def cancel_despawn(self, ent: int):
+        """Desfaz um despawn pendente (ex: entidade reaproveitada no mesmo frame)."""
+        self._despawns.pop(ent, None)
+
+    def is_pending_despawn(self, ent: int) -> bool:
+        return ent in self._despawns
+
+    def flush(self) -> int:
+        """
+        Aplica todas as mudanças enfileiradas no mundo ativo.
+
+        Returns:
+            int: Quantidade de operações aplicadas.
+        """
+        ops, despawns = self._ops, self._despawns
+        if not ops and not despawns:
+            self.applied_last_flush = 0
+            return 0
+
+        create_entity = esper.create_entity
+        has_component = esper.has_component
+        remove_component = esper.remove_component
+        entity_exists = esper.entity_exists
+
+        for kind, ent, payload in ops:
+            if kind == _SPAWN:
+                create_entity(*payload)
+            elif not entity_exists(ent):
+                continue
+            elif kind == _ADD:
+                add_components(ent, payload)
+            else:
+                for component_type in payload:
+                    # Sem `try_remove_component` (só existe a partir do esper 3.6)
+                    if has_component(ent, component_type):
+                        remove_component(ent, component_type)
+
+        for ent in despawns:
+            despawn(ent)
+
+        applied = len(ops) + len(despawns)
+        # Novas listas: um sistema pode enfileirar de novo durante o flush
+        self._ops = []
+        self._despawns = {}
+        self.pending_adds = set()
+        self.applied_last_flush = applied
+        return applied
@@ -1,17 +1,36 @@
-from dataclasses import dataclass
+"""
+Componentes: dados puros, sem lógica de sistema.
+
+Todos usam `slots=True`: sem `__dict__` por instância, o que pesa com dezenas de\
+    milhares de tiros vivos (cada um com vários componentes). Atributos precisam\
+        estar declarados como campos.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
 
 import pygame
 
 
-@dataclass
+@dataclass(slots=True)
 class Transform:
     """Representa a posição espacial."""
 
     x: float
     y: float
 
+    # Posição no passo de simulação anterior (interpolação da renderização)
+    prev_x: float | None = None
+    prev_y: float | None = None
+
+    def __post_init__(self):
+        if self.prev_x is None:
+            self.prev_x = self.x
+        if self.prev_y is None:
+            self.prev_y = self.y
+
 
-@dataclass
+@dataclass(slots=True)
 class Velocity:
     """Representa o vetor do movimento."""
 
@@ -19,45 +38,55 @@ class Velocity:
     y: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Sprite:
-    """Representa a parte visual."""
+    """
+    Representa a parte visual: uma Surface inteira ou uma área dela (região de
+    uma página do atlas, ver src/core/atlas.py). `Sprite(*regiao, layer=2)`.
+    """
 
     image: pygame.Surface
+    area: pygame.Rect | None = None  # None = Surface inteira
     layer: int = 0  # 0 = Fundo, 1 = Chão, 2 = Player, etc
 
     # Metadados úteis para colisão simples sem retângulos complexos
+    width: int = field(default=0, init=False)
+    height: int = field(default=0, init=False)
+
     def __post_init__(self):
-        if self.image:
+        if self.area is not None:
+            self.width = self.area.width
+            self.height = self.area.height
+        elif self.image:
             self.width = self.image.get_width()
             self.height = self.image.get_height()
 
 
-@dataclass
+@dataclass(slots=True)
 class Animation:
     """Guarda a lista de frames e o timer para troca."""
 
-    frames: list[pygame.Surface]
+    frames: list[Any]  # Regiões do atlas (AtlasRegion: surface, area)
     frame_duration: float = 0.1
     timer: float = 0.0
     current_index: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerTag:
     """Componente vazio (Tag) apenas para identificar quem é o jogador."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyTag:
     """Identifica entidades que são inimigos."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Invincibility:
     """Controla o estado de dano/invunerabilidade."""
 
@@ -67,7 +96,7 @@ class Invincibility:
     blink_interval: float = 0.1  # Velocidade da piscada
 
 
-@dataclass
+@dataclass(slots=True)
 class Health:
     current: int
     maximum: int
@@ -79,14 +108,14 @@ class Health:
         return max(0.0, min(1.0, self.current / self.maximum))
 
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     """Marcar a entidade como um tiro e guardar quanto dano ela causa."""
 
     damage: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class Gun:
     """Anexar ao player e controlar o tempo entre disparos."""
 
@@ -95,24 +124,66 @@ class Gun:
     start_delay: float = 0.0  # Cronômetro para começar a atirar
 
 
-@dataclass
-class EnemyProjectile:
-    """Lasers do inimigo."""
+@dataclass(slots=True)
+class RenderState:
+    """
+    Escolhe uma variante pré-calculada do sprite (ver src/core/variants.py).
 
-    damage: int = 10
+    `variant` é o estado contínuo (ex: "blink" na invencibilidade, None = imagem
+    original); enquanto `flash_timer` > 0 o flash de acerto tem prioridade.
+    """
+
+    variant: str | None = None
+    flash_timer: float = 0.0
 
 
-@dataclass
-class MovePattern:
-    """Padrão de movimento dos lasers."""
+@dataclass(slots=True)
+class Lifetime:
+    """Idade máxima de um projétil (removido pelo LifetimeProcessor)."""
 
-    pattern_type: str = "linear"
-    start_x: float = 0.0
-    start_y: float = 0.0
-    time: float = 0.0
+    max_age: float = 10.0  # Segundos até expirar
+    age: float = 0.0  # Tempo de vida atual
 
-    # Parâmetros matemáticos
-    speed: float = 200.0  # Velocidade base
-    angle: float = 0.0  # Ângulo base (radianos)
-    amplitude: float = 50.0  # Largura do zig-zag
-    frequency: float = 5.0  # Velocidade do zig-zag
+
+@dataclass(slots=True)
+class Pooled:
+    """Marca entidades reaproveitadas por um ProjectilePool (nunca é removido)."""
+
+    pool: Any
+
+
+# --- Recursos de mundo (singletons em `resources`, não ficam em entidades) ---
+
+
+@dataclass(slots=True)
+class EnemyAttack:
+    """Ritmo de tiro do chefe: timer, intervalo e próximo padrão."""
+
+    cooldown: float
+    timer: float = 0.0
+    pattern: int = 0
+
+
+@dataclass(slots=True)
+class Score:
+    """Pontuação da partida (dano causado ao inimigo)."""
+
+    points: int = 0
+
+
+# Todos os tipos de componente (usado pelo overlay de debug para contagens)
+ALL_COMPONENTS = (
+    Transform,
+    Velocity,
+    Sprite,
+    Animation,
+    PlayerTag,
+    EnemyTag,
+    Invincibility,
+    Health,
+    Projectile,
+    Gun,
+    RenderState,
+    Lifetime,
+    Pooled,
+)
@@ -0,0 +1,162 @@
+"""
+Fontes de input para as cenas de gameplay.
+
+A cena pergunta o estado das teclas a uma `InputSource` em vez de chamar\
+    `pygame.key.get_pressed()` diretamente. Assim o mesmo código roda com teclado\
+        real, com um roteiro determinístico (headless/benchmark) ou com um replay.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+import numpy as np
+import pygame
+
+from src.core.components import Sprite, Transform
+from src.core.patterns import PatternEngine
+from src.core.resources import BOSS, PLAYER, world_resources
+
+
+class KeyState:
+    """Estado das teclas indexável por constantes do pygame (como get_pressed)."""
+
+    def __init__(self, pressed: Iterable[int] = ()):
+        self._pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._pressed
+
+    def __iter__(self):
+        return iter(self._pressed)
+
+
+class InputSource(ABC):
+    """Interface: devolve o estado das teclas do frame atual."""
+
+    @abstractmethod
+    def get_pressed(self):
+        """Teclas do frame atual, indexáveis por constantes do pygame."""
+        ...
+
+    def advance(self):
+        """Chamado uma vez por frame de simulação (fontes roteirizadas avançam)."""
+        pass
+
+
+class KeyboardInput(InputSource):
+    """Teclado real (padrão do jogo)."""
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput(InputSource):
+    """
+    Roteiro determinístico de teclas: lista de (frames, teclas pressionadas).
+
+    Exemplo: `ScriptedInput([(60, {pygame.K_a}), (60, {pygame.K_d})])` anda um
+    segundo para a esquerda e um para a direita (a 60 FPS), em loop.
+    """
+
+    def __init__(self, script: list[tuple[int, Iterable[int]]], loop: bool = True):
+        """
+        Args:
+            script (list[tuple[int, Iterable[int]]]): Passos (duração, teclas).
+            loop (bool): Recomeça o roteiro ao terminar (senão solta as teclas).
+        """
+        if not script:
+            raise ValueError("O roteiro precisa de ao menos um passo")
+        self._steps = [(frames, KeyState(keys)) for frames, keys in script]
+        self._loop = loop
+        self._index = 0
+        self._frame = 0
+        self._released = KeyState()
+
+    def get_pressed(self):
+        if self._index >= len(self._steps):
+            return self._released
+        return self._steps[self._index][1]
+
+    def advance(self):
+        if self._index >= len(self._steps):
+            return
+        self._frame += 1
+        if self._frame >= self._steps[self._index][0]:
+            self._frame = 0
+            self._index += 1
+            if self._loop and self._index >= len(self._steps):
+                self._index = 0
+
+
+class DodgeBot(InputSource):
+    """
+    Jogador automático para simulações em lote: foge dos tiros próximos e, sem
+    ameaça, alinha-se embaixo do chefe (o tiro do player sobe em linha reta).
+
+    Lê o mundo ativo a cada frame, então só faz sentido dentro do update da cena.
+    Não tem estado aleatório: a mesma partida sempre gera as mesmas teclas.
+    """
+
+    def __init__(self, danger_radius: float = 120.0, home_y: float = 500.0):
+        """
+        Args:
+            danger_radius (float): Distância (px) a partir da qual um tiro é ameaça.
+            home_y (float): Altura em que o bot fica quando não há ameaça.
+        """
+        self.danger_radius = danger_radius
+        self.home_y = home_y
+
+    def get_pressed(self):
+        res = world_resources()
+        player = res.components(PLAYER, Transform, Sprite)
+        if player is None:
+            return KeyState()
+        trans, sprite = player
+        px = trans.x + sprite.width / 2
+        py = trans.y + sprite.height / 2
+
+        # Repulsão: soma das direções de fuga, pesada pelo inverso da distância²
+        # (vetorizada sobre as posições do PatternEngine)
+        fx = fy = 0.0
+        bullets = res.get(PatternEngine)
+        if bullets is not None and len(bullets):
+            xs, ys = bullets.positions()
+            ox, oy = px - xs, py - ys
+            dist2 = ox * ox + oy * oy
+            near = (dist2 > 0) & (dist2 < self.danger_radius * self.danger_radius)
+            if near.any():
+                fx = float(np.sum(ox[near] / dist2[near]))
+                fy = float(np.sum(oy[near] / dist2[near]))
+
+        if fx or fy:
+            threshold = 0.2 * max(abs(fx), abs(fy))
+            return KeyState(self._keys_toward(fx, fy, threshold))
+
+        # Sem ameaça: volta para a altura de espera, embaixo do chefe
+        target_x = px
+        boss = res.components(BOSS, Transform, Sprite)
+        if boss is not None:
+            target_x = boss[0].x + boss[1].width / 2
+        return KeyState(self._keys_toward(target_x - px, self.home_y - py, 8.0))
+
+    @staticmethod
+    def _keys_toward(dx: float, dy: float, threshold: float) -> list[int]:
+        keys = []
+        if dx > threshold:
+            keys.append(pygame.K_d)
+        elif dx < -threshold:
+            keys.append(pygame.K_a)
+        if dy > threshold:
+            keys.append(pygame.K_s)
+        elif dy < -threshold:
+            keys.append(pygame.K_w)
+        return keys
+
+
+# Roteiro padrão do modo headless: desvia de um lado para o outro
+STRAFE_SCRIPT = [
+    (45, {pygame.K_a}),
+    (30, {pygame.K_a, pygame.K_w}),
+    (45, {pygame.K_d}),
+    (30, {pygame.K_d, pygame.K_s}),
+]
@@ -0,0 +1,540 @@
+"""
+Motor vetorizado de padrões de movimento e rajadas compiladas.
+
+Mantém todos os tiros com padrão matemático em arrays contíguos do NumPy (sem uma\
+    entidade por tiro) e avalia cada tipo de padrão ("linear", "sine", "spiral")\
+        para todos os tiros vivos em uma única passada, em vez de um loop escalar.
+
+Os golpes do inimigo são declarados em TOML (`assets/patterns.toml`) e compilados\
+    uma vez em `Volley`s: arrays de ângulos já em radianos, prontos para gerar a\
+        rajada inteira de uma vez.
+"""
+
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+from src.core.components import Sprite
+from src.core.pool import EXHAUSTED_GROW, EXHAUSTED_POLICIES, EXHAUSTED_RECYCLE
+
+# Códigos inteiros para evitar comparação de strings no loop quente
+PATTERN_KINDS = {"linear": 0, "sine": 1, "spiral": 2}
+LINEAR, SINE, SPIRAL = 0, 1, 2
+
+
+def exit_times(
+    kind: np.ndarray,
+    start_x: np.ndarray,
+    start_y: np.ndarray,
+    cos_a: np.ndarray,
+    sin_a: np.ndarray,
+    speed: np.ndarray,
+    amplitude: np.ndarray,
+    bounds: tuple[float, float, float, float],
+) -> np.ndarray:
+    """
+    Tempo (desde o spawn) a partir do qual cada trajetória fica fora de `bounds`
+    para sempre, calculado em forma fechada.
+
+    - linear: primeiro cruzamento de borda na direção do movimento (exato).
+    - sine: idem, com a borda afastada pela amplitude projetada em cada eixo (a
+      oscilação nunca passa de `amplitude` da linha central).
+    - spiral: quando o raio passa da maior distância da origem a um canto.
+
+    Args:
+        kind (np.ndarray): Códigos LINEAR/SINE/SPIRAL.
+        start_x, start_y (np.ndarray): Origem de cada tiro.
+        cos_a, sin_a (np.ndarray): Direção base.
+        speed (np.ndarray): Velocidade (px/s).
+        amplitude (np.ndarray): Amplitude do zig-zag.
+        bounds (tuple): (min_x, min_y, max_x, max_y) da área válida.
+
+    Returns:
+        np.ndarray: Segundos até sair (inf se nunca sai, ex: velocidade 0).
+    """
+    min_x, min_y, max_x, max_y = bounds
+    sine = kind == SINE
+    pad_x = np.where(sine, amplitude * np.abs(sin_a), 0.0)
+    pad_y = np.where(sine, amplitude * np.abs(cos_a), 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vx = cos_a * speed
+        vy = sin_a * speed
+        tx = np.where(
+            vx > 0,
+            (max_x + pad_x - start_x) / vx,
+            np.where(vx < 0, (min_x - pad_x - start_x) / vx, np.inf),
+        )
+        ty = np.where(
+            vy > 0,
+            (max_y + pad_y - start_y) / vy,
+            np.where(vy < 0, (min_y - pad_y - start_y) / vy, np.inf),
+        )
+        line = np.minimum(tx, ty)
+
+        # Espiral: fora da área quando o raio supera o canto mais distante
+        reach = np.hypot(
+            np.maximum(np.abs(start_x - min_x), np.abs(max_x - start_x)),
+            np.maximum(np.abs(start_y - min_y), np.abs(max_y - start_y)),
+        )
+        spiral = np.where(speed > 0, reach / speed, np.inf)
+
+    return np.maximum(np.where(kind == SPIRAL, spiral, line), 0.0)
+
+
+class PatternEngine:
+    """
+    Tiros com padrão matemático guardados inteiros em arrays (Structure of Arrays).
+
+    Os tiros não são entidades do esper: cada um é um slot nos arrays de
+    parâmetros e de posição (`x`/`y` e `prev_x`/`prev_y`, a posição do passo
+    anterior para a interpolação). `step` avalia todos os padrões numa passada e
+    escreve as posições no lugar; render, colisão e checksum leem dos arrays.
+    Os slots vivos ficam densos em `[:len(self)]`, na ordem de disparo: a
+    remoção compacta os arrays preservando a ordem.
+
+    Com `bounds`, o momento em que cada tiro sai da área para sempre (ou atinge
+    `max_age`) é calculado no disparo e fica na coluna `deadline`; `expire()`
+    compara só essa coluna com o relógio, sem testar posições a cada frame.
+    A comparação é O(N) por passo, de propósito: `step` já passa por todos os
+    slots, e um min-heap (O(vencidos) na busca) paga um push/pop em Python e uma
+    tupla por tiro: empata com ~1k tiros e fica 2-5x mais lento de 10k a 50k
+    (`benchmarks/bench_expiry.py`).
+
+    Sem slots livres, `on_full` decide como no ProjectilePool: "grow" dobra a
+    capacidade, "drop" recusa os tiros excedentes e "recycle" descarta os mais
+    antigos.
+    """
+
+    _FLOAT_FIELDS = (
+        "start_x",
+        "start_y",
+        "time",
+        "speed",
+        "angle",
+        "amplitude",
+        "frequency",
+        "cos_a",
+        "sin_a",
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+        "deadline",  # Instante (no `clock`) do vencimento; inf = nunca
+    )
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        bounds: tuple[float, float, float, float] | None = None,
+        max_age: float = float("inf"),
+        on_full: str = EXHAUSTED_GROW,
+        sprite: Sprite | None = None,
+        damage: int = 0,
+    ):
+        """
+        Inicializa o motor com `capacity` slots pré-alocados.
+
+        Args:
+            capacity (int): Quantidade de slots pré-alocados.
+            bounds (tuple | None): (min_x, min_y, max_x, max_y) da área válida;
+                None desliga o agendamento de saída.
+            max_age (float): Idade máxima (s) de um tiro, mesmo dentro da área.
+            on_full (str): "grow", "drop" ou "recycle".
+            sprite (Sprite | None): Aparência e tamanho comuns a todos os tiros
+                (None = não são desenhados nem colidem).
+            damage (int): Dano de cada tiro.
+        """
+        if on_full not in EXHAUSTED_POLICIES:
+            raise ValueError(f"Política de slots desconhecida: {on_full}")
+
+        self.bounds = bounds
+        self.max_age = max_age
+        self.on_full = on_full
+        self.sprite = sprite
+        self.damage = damage
+        self.clock = 0.0  # Tempo acumulado de simulação do motor
+        self.expired_last_step = 0
+        self.dropped = 0  # Tiros recusados pela política "drop"
+        self._size = 0
+        self._capacity = 0
+        self.kind = np.zeros(0, dtype=np.int8)
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=np.float64))
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def _columns(self) -> list[np.ndarray]:
+        return [self.kind] + [getattr(self, name) for name in self._FLOAT_FIELDS]
+
+    def _grow(self, capacity: int):
+        """Realoca os arrays para a nova capacidade preservando os dados."""
+        n = self._size
+        for name in ("kind", *self._FLOAT_FIELDS):
+            old = getattr(self, name)
+            arr = np.zeros(capacity, dtype=old.dtype)
+            arr[:n] = old[:n]
+            setattr(self, name, arr)
+        self._capacity = capacity
+
+    def _reserve(self, count: int) -> int:
+        """Abre espaço para `count` tiros conforme `on_full`; devolve quantos cabem."""
+        free = self._capacity - self._size
+        if count <= free:
+            return count
+        if self.on_full == EXHAUSTED_GROW:
+            capacity = self._capacity
+            while capacity - self._size < count:
+                capacity *= 2
+            self._grow(capacity)
+            return count
+        if self.on_full == EXHAUSTED_RECYCLE:
+            count = min(count, self._capacity)
+            self._discard_oldest(count - free)
+            return count
+        self.dropped += count - free
+        return free
+
+    def _discard_oldest(self, count: int):
+        """Remove os `count` tiros mais antigos (o começo dos arrays)."""
+        n = self._size
+        for arr in self._columns():
+            arr[: n - count] = arr[count:n]
+        self._size = n - count
+
+    def add(
+        self,
+        pattern_type: str,
+        x: float,
+        y: float,
+        angle: float,
+        speed: float,
+        frequency: float = 5.0,
+        amplitude: float = 30.0,
+    ) -> bool:
+        """
+        Dispara um único tiro.
+
+        Args:
+            pattern_type (str): "linear", "sine" ou "spiral".
+            x (float): Origem X.
+            y (float): Origem Y.
+            angle (float): Ângulo base (radianos).
+            speed (float): Velocidade (px/s).
+            frequency (float): Frequência do zig-zag/giro.
+            amplitude (float): Largura do zig-zag.
+
+        Returns:
+            bool: False se a política "drop" recusou o tiro.
+        """
+        kind = PATTERN_KINDS.get(pattern_type)
+        if kind is None:
+            raise ValueError(f"Padrão desconhecido: {pattern_type}")
+        added = self.add_many(
+            kind,
+            x,
+            y,
+            np.asarray([angle], dtype=np.float64),
+            np.asarray([speed], dtype=np.float64),
+            frequency,
+            amplitude,
+        )
+        return added == 1
+
+    def add_many(
+        self,
+        kind: int,
+        start_x: float,
+        start_y: float,
+        angles: np.ndarray,
+        speeds: np.ndarray,
+        frequency: float,
+        amplitude: float,
+    ) -> int:
+        """
+        Dispara uma rajada inteira (mesmo tipo e origem) com escrita vetorizada.
+
+        Args:
+            kind (int): Código do padrão (LINEAR, SINE ou SPIRAL).
+            start_x (float): Origem X comum.
+            start_y (float): Origem Y comum.
+            angles (np.ndarray): Ângulo (rad) de cada tiro.
+            speeds (np.ndarray): Velocidade de cada tiro.
+            frequency (float): Frequência comum.
+            amplitude (float): Amplitude comum.
+
+        Returns:
+            int: Tiros disparados (menos que `len(angles)` com a política "drop").
+        """
+        count = self._reserve(len(angles))
+        if count == 0:
+            return 0
+
+        lo = self._size
+        hi = lo + count
+        slots = slice(lo, hi)
+        angles = angles[:count]
+        self.kind[slots] = kind
+        self.start_x[slots] = start_x
+        self.start_y[slots] = start_y
+        self.time[slots] = 0.0
+        self.speed[slots] = speeds[:count]
+        self.angle[slots] = angles
+        self.amplitude[slots] = amplitude
+        self.frequency[slots] = frequency
+        # Seno/cosseno do ângulo base são constantes: calcula uma vez só
+        self.cos_a[slots] = np.cos(angles)
+        self.sin_a[slots] = np.sin(angles)
+        self.x[slots] = self.prev_x[slots] = start_x
+        self.y[slots] = self.prev_y[slots] = start_y
+        self._size = hi
+        self._schedule(slots)
+        return count
+
+    def _schedule(self, slots: slice):
+        """Agenda o vencimento (saída da área ou idade máxima) dos `slots`."""
+        if self.bounds is None and self.max_age == float("inf"):
+            self.deadline[slots] = np.inf
+            return
+        t = self.time[slots]
+        remaining = self.max_age - t
+        if self.bounds is not None:
+            exits = exit_times(
+                self.kind[slots],
+                self.start_x[slots],
+                self.start_y[slots],
+                self.cos_a[slots],
+                self.sin_a[slots],
+                self.speed[slots],
+                self.amplitude[slots],
+                self.bounds,
+            )
+            remaining = np.minimum(remaining, exits - t)
+
+        self.deadline[slots] = self.clock + np.maximum(remaining, 0.0)
+
+    def expire(self) -> int:
+        """
+        Remove os tiros cujo vencimento já passou (saíram da área ou envelheceram).
+
+        Returns:
+            int: Quantidade de tiros removidos.
+        """
+        due = np.flatnonzero(self.deadline[: self._size] <= self.clock)
+        self.remove(due)
+        self.expired_last_step = len(due)
+        return len(due)
+
+    def remove(self, slots):
+        """
+        Remove os tiros dos `slots`, compactando os arrays na mesma ordem.
+
+        Args:
+            slots: Índices em `[:len(self)]` (array ou sequência de ints).
+        """
+        if len(slots) == 0:
+            return
+        n = self._size
+        keep = np.ones(n, dtype=bool)
+        keep[slots] = False
+        # O que vem antes do primeiro removido não sai do lugar
+        first = int(np.argmin(keep))
+        tail = keep[first:]
+        size = first + int(np.count_nonzero(tail))
+        for arr in self._columns():
+            arr[first:size] = arr[first:n][tail]
+        self._size = size
+
+    def clear(self):
+        """Remove todos os tiros."""
+        self._size = 0
+
+    def step(self, dt: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Avança o tempo de todos os padrões e calcula as novas posições.
+
+        Args:
+            dt (float): Tempo em segundos desde o último frame.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Views (x, y) das `len(self)` posições.
+        """
+        self.clock += dt
+        n = self._size
+        if n == 0:
+            return self.x[:0], self.y[:0]
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        t = self.time[:n]
+        t += dt
+
+        kind = self.kind[:n]
+        cos_a = self.cos_a[:n]
+        sin_a = self.sin_a[:n]
+
+        # Base comum a todos os padrões: avanço radial na direção do ângulo,
+        # escrita direto nos arrays de posição
+        dist = self.speed[:n] * t
+        xs = np.multiply(cos_a, dist, out=self.x[:n])
+        xs += self.start_x[:n]
+        ys = np.multiply(sin_a, dist, out=self.y[:n])
+        ys += self.start_y[:n]
+
+        # Zig-Zag: oscila na perpendicular ao ângulo (-sin, cos). O seno só é
+        # calculado nos slots SINE (`where`), sem copiar os slots para fora e de
+        # volta; nos demais o deslocamento é zero e a posição não muda
+        sine = kind == SINE
+        if sine.any():
+            offset = np.zeros(n)
+            np.multiply(t, self.frequency[:n], out=offset, where=sine)
+            np.sin(offset, out=offset, where=sine)
+            offset *= self.amplitude[:n]
+            xs -= sin_a * offset
+            ys += cos_a * offset
+
+        # Espiral: o ângulo gira com o tempo, o raio cresce com a velocidade
+        spiral = kind == SPIRAL
+        if spiral.any():
+            freq = self.frequency[:n][spiral]
+            current_angle = self.angle[:n][spiral] + t[spiral] * freq
+            radius = dist[spiral]
+            xs[spiral] = self.start_x[:n][spiral] + np.cos(current_angle) * radius
+            ys[spiral] = self.start_y[:n][spiral] + np.sin(current_angle) * radius
+
+        return xs, ys
+
+    def first_hit(self, rect: pygame.Rect) -> int | None:
+        """
+        Primeiro tiro (na ordem de disparo) que encosta em `rect`.
+
+        Mesmo resultado de `rect.collidelist` com um `pygame.Rect(x, y, w, h)` por
+        tiro (posição truncada como o Rect faz), mas vetorizado sobre os arrays:
+        nenhum Rect é criado.
+
+        Args:
+            rect (pygame.Rect): Área testada (ex: o player).
+
+        Returns:
+            int | None: Slot do tiro, ou None se nenhum encosta (ou sem `sprite`).
+        """
+        n = self._size
+        if n == 0 or self.sprite is None:
+            return None
+        w, h = self.sprite.width, self.sprite.height
+        xs = np.trunc(self.x[:n])
+        ys = np.trunc(self.y[:n])
+        hits = (xs < rect.right) & (xs + w > rect.x)
+        hits &= (ys < rect.bottom) & (ys + h > rect.y)
+        slot = int(np.argmax(hits))
+        return slot if hits[slot] else None
+
+    def positions(self, alpha: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Posições (x, y) dos tiros vivos, interpoladas com o passo anterior.
+
+        Args:
+            alpha (float): Fração do passo fixo (1.0 = posição atual, sem cópia).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Arrays com `len(self)` posições.
+        """
+        n = self._size
+        xs, ys = self.x[:n], self.y[:n]
+        if alpha >= 1.0:
+            return xs, ys
+        prev_x, prev_y = self.prev_x[:n], self.prev_y[:n]
+        return prev_x + (xs - prev_x) * alpha, prev_y + (ys - prev_y) * alpha
+
+
+@dataclass(frozen=True)
+class Volley:
+    """Golpe do inimigo compilado: uma rajada com todos os ângulos já prontos."""
+
+    name: str
+    pattern_type: str
+    kind: int
+    angles: np.ndarray  # Radianos, um por tiro
+    speed_min: float
+    speed_max: float
+    frequency: float
+    amplitude: float
+
+    def __len__(self) -> int:
+        return len(self.angles)
+
+    def sample_speeds(self, rng: np.random.Generator) -> np.ndarray:
+        """Sorteia a velocidade de todos os tiros da rajada de uma vez."""
+        return rng.uniform(self.speed_min, self.speed_max, len(self.angles))
+
+
+def compile_volley(spec: dict) -> Volley:
+    """
+    Converte um `[[pattern]]` do TOML em um `Volley`.
+
+    Args:
+        spec (dict): Tabela do TOML (ver o cabeçalho de assets/patterns.toml).
+
+    Returns:
+        Volley: Rajada pronta para spawn em lote.
+    """
+    name = spec.get("name", "?")
+    pattern_type = spec.get("type", "linear")
+    kind = PATTERN_KINDS.get(pattern_type)
+    if kind is None:
+        raise ValueError(f"Padrão '{name}': tipo desconhecido '{pattern_type}'")
+
+    if "angles" in spec:
+        degrees = np.asarray(spec["angles"], dtype=np.float64)
+    elif "ring" in spec:
+        ring = spec["ring"]
+        degrees = np.linspace(
+            ring.get("start", 0.0),
+            ring.get("stop", 360.0),
+            int(ring["count"]),
+            endpoint=False,
+        )
+    else:
+        raise ValueError(f"Padrão '{name}': informe 'angles' ou 'ring'")
+    if degrees.size == 0:
+        raise ValueError(f"Padrão '{name}': rajada sem tiros")
+
+    speed_min, speed_max = spec["speed"]
+    angles = np.radians(degrees)
+    angles.setflags(write=False)
+    return Volley(
+        name=name,
+        pattern_type=pattern_type,
+        kind=kind,
+        angles=angles,
+        speed_min=float(speed_min),
+        speed_max=float(speed_max),
+        frequency=float(spec.get("frequency", 5.0)),
+        amplitude=float(spec.get("amplitude", 30.0)),
+    )
+
+
+def load_volleys(path: Path) -> list[Volley]:
+    """
+    Lê e compila todos os golpes de um arquivo TOML.
+
+    Args:
+        path (Path): Arquivo com uma lista `[[pattern]]`.
+
+    Returns:
+        list[Volley]: Golpes na ordem do arquivo.
+    """
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    volleys = [compile_volley(spec) for spec in data.get("pattern", [])]
+    if not volleys:
+        raise ValueError(f"Nenhum padrão definido em {path}")
+    return volleys
@@ -0,0 +1,186 @@
+"""
+Pool de projéteis: entidades e componentes pré-alocados e reciclados.
+
+Em vez de criar uma entidade, uma Surface e vários componentes a cada tiro (e\
+    deletar tudo ao sair da tela), o pool mantém as entidades vivas. Desativar\
+        remove os componentes do mundo (ficando só o `Pooled`), reativar devolve as\
+            mesmas instâncias, sem alocação no caminho quente.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import esper
+
+from src.core.components import Pooled
+from src.core.query import add_components
+
+if TYPE_CHECKING:
+    from src.core.commands import CommandBuffer
+
+# Políticas quando não há entidade livre
+EXHAUSTED_GROW = "grow"  # Aloca uma entidade nova (o pool cresce)
+EXHAUSTED_DROP = "drop"  # Recusa o disparo (acquire retorna None)
+EXHAUSTED_RECYCLE = "recycle"  # Reaproveita o projétil ativo mais antigo
+EXHAUSTED_POLICIES = (EXHAUSTED_GROW, EXHAUSTED_DROP, EXHAUSTED_RECYCLE)
+
+
+class ProjectilePool:
+    """
+    Pool de entidades de um mesmo tipo de projétil dentro de um mundo esper.
+
+    Os métodos `acquire`/`release` assumem que o mundo do pool já é o mundo ativo
+    (o GameScene garante isso no update), evitando `switch_world` por tiro.
+    """
+
+    def __init__(
+        self,
+        world_name: str,
+        factory: Callable[[], tuple],
+        capacity: int,
+        on_exhausted: str = EXHAUSTED_GROW,
+    ):
+        """
+        Pré-aloca `capacity` entidades inativas.
+
+        Args:
+            world_name (str): Mundo esper onde as entidades vivem.
+            factory (Callable[[], tuple]): Cria o conjunto de componentes de uma
+                entidade (chamada só na pré-alocação ou ao crescer).
+            capacity (int): Quantidade inicial de entidades.
+            on_exhausted (str): "grow", "drop" ou "recycle".
+        """
+        if on_exhausted not in EXHAUSTED_POLICIES:
+            raise ValueError(f"Política de pool desconhecida: {on_exhausted}")
+
+        self.world_name = world_name
+        self.factory = factory
+        self.on_exhausted = on_exhausted
+        self.capacity = 0
+        self.dropped = 0  # Disparos recusados pela política "drop"
+
+        self._bundles: dict[int, tuple] = {}
+        self._free: list[int] = []
+        # Dicionário preserva ordem de ativação: o primeiro é o mais antigo
+        self._active: dict[int, None] = {}
+
+        esper.switch_world(world_name)
+        for _ in range(capacity):
+            self._allocate()
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    @property
+    def free_count(self) -> int:
+        return len(self._free)
+
+    def _allocate(self):
+        ent = esper.create_entity(Pooled(self))
+        self._bundles[ent] = self.factory()
+        self._free.append(ent)
+        self.capacity += 1
+
+    def acquire(
+        self, commands: CommandBuffer | None = None
+    ) -> tuple[int, tuple] | None:
+        """
+        Ativa uma entidade e devolve seus componentes para o chamador configurar.
+
+        Args:
+            commands (CommandBuffer | None): Se informado, os componentes só
+                entram no mundo no próximo `flush` (a reserva é imediata).
+
+        Returns:
+            tuple[int, tuple] | None: (entidade, componentes) ou None se o pool
+                estiver esgotado com a política "drop".
+        """
+        if not self._free:
+            if self.on_exhausted == EXHAUSTED_GROW:
+                self._allocate()
+            elif self.on_exhausted == EXHAUSTED_RECYCLE and self._active:
+                oldest = next(iter(self._active))
+                if commands is not None:
+                    # Reaproveita no lugar: já está no mundo, sem mudança
+                    # estrutural (e cancela um despawn pendente dele)
+                    commands.cancel_despawn(oldest)
+                    del self._active[oldest]
+                    self._active[oldest] = None
+                    return oldest, self._bundles[oldest]
+                self.release(oldest)
+            else:
+                self.dropped += 1
+                return None
+
+        ent = self._free.pop()
+        components = self._bundles[ent]
+        if commands is not None:
+            commands.add(ent, *components)
+        else:
+            add_components(ent, components)
+        self._active[ent] = None
+        return ent, components
+
+    def acquire_many(
+        self, count: int, commands: CommandBuffer | None = None
+    ) -> list[tuple[int, tuple]]:
+        """
+        Ativa até `count` entidades de uma vez (rajadas).
+
+        Com a política "drop" pode devolver menos que `count`.
+
+        Args:
+            count (int): Quantidade desejada.
+            commands (CommandBuffer | None): Igual a `acquire`.
+
+        Returns:
+            list[tuple[int, tuple]]: Pares (entidade, componentes).
+        """
+        # Cresce uma vez só em vez de alocar tiro a tiro no meio da rajada
+        if self.on_exhausted == EXHAUSTED_GROW:
+            for _ in range(count - len(self._free)):
+                self._allocate()
+
+        acquired = []
+        acquire = self.acquire
+        for _ in range(count):
+            entry = acquire(commands)
+            if entry is None:
+                break
+            acquired.append(entry)
+        return acquired
+
+    def release(self, ent: int):
+        """
+        Desativa a entidade (remove os componentes do mundo). Chamadas repetidas
+        para a mesma entidade são ignoradas.
+
+        Args:
+            ent (int): Entidade ativa deste pool.
+        """
+        if ent not in self._active:
+            return
+
+        del self._active[ent]
+        for component in self._bundles[ent]:
+            esper.remove_component(ent, type(component))
+        self._free.append(ent)
+
+
+def despawn(ent: int):
+    """
+    Remove uma entidade do jogo: devolve ao pool se for reciclável ou deleta.
+
+    Args:
+        ent (int): Entidade a remover.
+    """
+    if not esper.entity_exists(ent):
+        return  # Já removida (no esper 3.4 `try_component` falha nela)
+    pooled = esper.try_component(ent, Pooled)
+    if pooled is not None:
+        pooled.pool.release(ent)
+    else:
+        esper.delete_entity(ent, immediate=True)
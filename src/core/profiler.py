@@ -0,0 +1,170 @@
+"""
+Instrumentação por frame: tempo de cada processador/etapa e overlay de debug.
+
+A coleta é só um par de `perf_counter` por chamada instrumentada, guardado em ring\
+    buffers (`deque(maxlen=...)`). Percentis, contagem de entidades e o texto do\
+        overlay só são calculados quando o overlay está visível, e no máximo algumas\
+            vezes por segundo.
+"""
+
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+
+import esper
+import pygame
+
+from src.core.patterns import PatternEngine
+from src.core.render import RenderBackend
+from src.core.resources import world_resources
+from src.core.text import fonts
+
+FRAME_KEY = "frame"
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Percentil por vizinho mais próximo (suficiente para o overlay)."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+class FrameProfiler:
+    """
+    Acumula tempos por nome (processador ou etapa da cena) a cada frame.
+
+    `history` frames ficam nos ring buffers; `totals` soma a execução inteira
+    (usado pelo runner headless).
+    """
+
+    def __init__(self, history: int = 240):
+        self.history = history
+        self.samples: dict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=history)
+        )
+        self.totals: dict[str, float] = defaultdict(float)
+        self.frames = 0
+        self._current: dict[str, float] = defaultdict(float)
+        self._last_tick: float | None = None
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        """Devolve `fn` cronometrado, acumulando em `name` (ms)."""
+        current = self._current
+        perf = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                current[name] += (perf() - start) * 1000
+
+        return timed
+
+    def instrument_processor(self, processor: esper.Processor):
+        """Substitui `processor.process` pela versão cronometrada."""
+        processor.process = self.wrap(type(processor).__name__, processor.process)
+
+    def instrument_method(self, obj: object, method_name: str):
+        """Substitui um método da instância pela versão cronometrada."""
+        setattr(obj, method_name, self.wrap(method_name, getattr(obj, method_name)))
+
+    def tick(self):
+        """
+        Fecha o frame anterior: registra o intervalo real entre ticks (tempo de
+        frame completo, incluindo draw e flip) e os tempos acumulados.
+        """
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            self.samples[FRAME_KEY].append((now - self._last_tick) * 1000)
+        self._last_tick = now
+
+        if self._current:
+            self.frames += 1
+            for name, ms in self._current.items():
+                self.samples[name].append(ms)
+                self.totals[name] += ms
+            self._current.clear()
+
+    def frame_percentiles(self, pcts=(50, 95, 99)) -> dict[int, float]:
+        frame_times = self.samples.get(FRAME_KEY, ())
+        return {p: percentile(frame_times, p) for p in pcts}
+
+    def averages(self) -> dict[str, float]:
+        """Média (ms/frame) de cada etapa no histórico, sem o tempo de frame."""
+        return {
+            name: sum(values) / len(values)
+            for name, values in self.samples.items()
+            if name != FRAME_KEY and values
+        }
+
+
+class DebugOverlay:
+    """
+    Painel com percentis de frame, tempo por etapa e entidades por componente.
+
+    O texto é re-renderizado a cada `refresh` segundos; nos demais frames o
+    overlay custa um único blit.
+    """
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        component_types: Iterable[type],
+        visible: bool = True,
+        refresh: float = 0.25,
+    ):
+        self.profiler = profiler
+        self.component_types = tuple(component_types)
+        self.visible = visible
+        self.refresh = refresh
+        self._panel: pygame.Surface | None = None
+        self._last_refresh = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._panel = None
+
+    def _lines(self) -> list[str]:
+        pct = self.profiler.frame_percentiles()
+        lines = [f"frame p50 {pct[50]:.1f}  p95 {pct[95]:.1f}  p99 {pct[99]:.1f} ms"]
+        averages = self.profiler.averages()
+        for name, ms in sorted(averages.items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<22}{ms:6.2f} ms")
+        lines.append(f"mundos vivos: {len(esper.list_worlds())}")
+        bullets = world_resources().get(PatternEngine)
+        if bullets is not None:
+            lines.append(f"tiros (PatternEngine): {len(bullets)}")
+        lines.append("entidades:")
+        for comp_type in self.component_types:
+            count = len(esper.get_component(comp_type))
+            if count:
+                lines.append(f"  {comp_type.__name__:<20}{count:6d}")
+        return lines
+
+    def _render_panel(self) -> pygame.Surface:
+        # Texto muda a cada refresh: render direto, sem poluir o cache de textos
+        font = fonts.get("debug")
+        rendered = [font.render(line, True, (230, 230, 230)) for line in self._lines()]
+        width = max(s.get_width() for s in rendered) + 12
+        line_h = font.get_linesize()
+        panel = pygame.Surface((width, line_h * len(rendered) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, surf in enumerate(rendered):
+            panel.blit(surf, (6, 4 + i * line_h))
+        return panel
+
+    def draw(self, surface: RenderBackend) -> pygame.Rect | None:
+        """Desenha o painel no canto superior direito e devolve a área usada."""
+        if not self.visible or not pygame.font.get_init():
+            return None
+
+        now = time.perf_counter()
+        if self._panel is None or now - self._last_refresh >= self.refresh:
+            self._panel = self._render_panel()
+            self._last_refresh = now
+
+        pos = (surface.get_width() - self._panel.get_width(), 0)
+        return surface.blit(self._panel, pos)
@@ -0,0 +1,351 @@
+"""
+Consultas de componentes cacheadas e atualizadas incrementalmente.
+
+O esper descarta *todos* os caches de consulta a cada mudança estrutural (qualquer\
+    add/remove de componente ou entidade), então cada `get_components` volta a\
+        intersectar os conjuntos do zero. Aqui cada assinatura (tupla de tipos) é\
+            registrada uma vez e mantém seu próprio conjunto de resultados, que só é\
+                tocado quando uma entidade ganha ou perde um dos tipos da assinatura.
+
+Os ganchos envolvem `esper.create_entity`, `add_component`, `remove_component`,\
+    `try_remove_component`, `delete_entity`, `clear_database` e `delete_world`, de\
+        modo que todo o código continua chamando a API do esper normalmente. Eles\
+            não são instalados na importação: quem sobe o jogo chama\
+                `queries.install()` uma vez (`main.py`, `setup_headless_display`);\
+                    sem isso `Query.get()` levanta erro.
+"""
+
+from collections.abc import Callable, Iterator
+from operator import is_
+from typing import Any
+
+import esper
+
+
+class _Entry:
+    """
+    Resultado de uma assinatura em um mundo: a lista entregue às iterações e a
+    posição de cada entidade nela, atualizadas no lugar a cada mudança.
+    """
+
+    __slots__ = ("types", "single", "items", "slots", "listeners")
+
+    def __init__(self, types: tuple[type, ...]):
+        self.types = types
+        self.single = len(types) == 1
+        self.items: list[tuple[int, Any]] = []
+        self.slots: dict[int, int] = {}  # Entidade -> índice em `items`
+        # Avisados de cada entrada/troca/saída: listener(ent, valor ou None)
+        self.listeners: list[Callable[[int, Any], None]] = []
+
+    def build(self):
+        """Preenche os membros varrendo o mundo ativo (primeiro uso no mundo)."""
+        if self.single:
+            self.items = list(esper.get_component(self.types[0]))
+        else:
+            self.items = [
+                (ent, tuple(comps)) for ent, comps in esper.get_components(*self.types)
+            ]
+        self.slots = {ent: i for i, (ent, _) in enumerate(self.items)}
+
+    def refresh(self, ent: int):
+        """Re-testa uma entidade que ganhou um dos tipos da assinatura."""
+        if self.single:
+            value = esper.try_component(ent, self.types[0])
+        else:
+            value = esper.try_components(ent, *self.types)
+        if value is None:
+            self.discard(ent)
+        else:
+            self.put(ent, value if self.single else tuple(value))
+
+    def put(self, ent: int, value: Any):
+        """Entidade entra (no fim da lista) ou troca de componentes (no lugar)."""
+        slot = self.slots.get(ent)
+        if slot is None:
+            self.slots[ent] = len(self.items)
+            self.items.append((ent, value))
+        else:
+            old = self.items[slot][1]
+            # Mesmas instâncias (ex: ganhou um tipo de fora da assinatura): nada muda
+            if old is value or (not self.single and all(map(is_, old, value))):
+                return
+            self.items[slot] = (ent, value)
+        for listener in self.listeners:
+            listener(ent, value)
+
+    def discard(self, ent: int):
+        """Entidade sai: o último item da lista ocupa o lugar dela."""
+        slot = self.slots.pop(ent, None)
+        if slot is None:
+            return
+        last = self.items.pop()
+        if slot < len(self.items):
+            self.items[slot] = last
+            self.slots[last[0]] = slot
+        for listener in self.listeners:
+            listener(ent, None)
+
+
+class _WorldIndex:
+    """Assinaturas materializadas em um mundo esper."""
+
+    __slots__ = ("entries", "by_type", "archetypes")
+
+    def __init__(self):
+        self.entries: dict[tuple[type, ...], _Entry] = {}
+        self.by_type: dict[type, list[_Entry]] = {}
+        # Conjunto de tipos de uma entidade -> assinaturas que ela satisfaz
+        self.archetypes: dict[frozenset[type], list[_Entry]] = {}
+
+    def entry(self, types: tuple[type, ...]) -> _Entry:
+        entry = self.entries.get(types)
+        if entry is None:
+            entry = self.entries[types] = _Entry(types)
+            entry.build()
+            for comp_type in types:
+                self.by_type.setdefault(comp_type, []).append(entry)
+            self.archetypes.clear()
+        return entry
+
+    def matching(self, archetype: frozenset[type]) -> list[_Entry]:
+        """Assinaturas satisfeitas por uma entidade com exatamente esses tipos."""
+        entries = self.archetypes.get(archetype)
+        if entries is None:
+            entries = self.archetypes[archetype] = [
+                entry
+                for entry in self.entries.values()
+                if archetype.issuperset(entry.types)
+            ]
+        return entries
+
+
+class Query:
+    """
+    Assinatura registrada. `get()` devolve a lista de resultados do mundo ativo.
+
+    O formato é o do esper: `(ent, comp)` para um tipo e `(ent, (c1, c2, ...))`
+    para vários. A lista é sempre a mesma e é atualizada no lugar (entradas no
+    fim, saídas trocadas pelo último item), então não deve ser alterada por quem
+    itera, e criar/remover entidades ou componentes da assinatura durante a
+    iteração pula ou repete itens: use o CommandBuffer ou colete antes.
+    """
+
+    __slots__ = ("types", "_cache")
+
+    def __init__(self, cache: "QueryCache", types: tuple[type, ...]):
+        self.types = types
+        self._cache = cache
+
+    def get(self) -> list:
+        return self._cache.world().entry(self.types).items
+
+    def __iter__(self) -> Iterator:
+        return iter(self.get())
+
+    def watch(self, listener: Callable[[int, Any], None]) -> bool:
+        """
+        Inscreve `listener` nas mudanças desta assinatura no mundo ativo.
+
+        A cada entidade que entra ou troca de componentes o listener recebe
+        `(ent, valor)` (no formato de `get()`); quando ela sai, `(ent, None)`.
+        Chamar de novo com o mesmo listener não duplica a inscrição, então pode
+        ser feito a cada frame: o índice do mundo é descartado por
+        `clear_database` e a inscrição some junto.
+
+        Args:
+            listener (Callable[[int, Any], None]): Chamado a cada mudança.
+
+        Returns:
+            bool: True se a inscrição é nova; quem inscreve deve então montar o
+                próprio estado a partir de `get()`.
+        """
+        listeners = self._cache.world().entry(self.types).listeners
+        if listener in listeners:
+            return False
+        listeners.append(listener)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._cache.world().entry(self.types).items)
+
+    def __repr__(self) -> str:
+        names = ", ".join(t.__name__ for t in self.types)
+        return f"Query({names})"
+
+
+class QueryCache:
+    """
+    Registro de assinaturas e índices por mundo (segue `esper.switch_world`).
+
+    Os índices de um mundo são criados no primeiro uso de cada assinatura naquele
+    mundo e, a partir daí, mantidos pelos ganchos instalados no esper.
+    """
+
+    _HOOKED = (
+        "create_entity",
+        "add_component",
+        "remove_component",
+        "try_remove_component",
+        "delete_entity",
+        "clear_database",
+        "delete_world",
+    )
+
+    def __init__(self):
+        self._queries: dict[tuple[type, ...], Query] = {}
+        self._worlds: dict[str, _WorldIndex] = {}
+        self._originals: dict[str, Callable] = {}
+
+    def register(self, *types: type) -> Query:
+        """
+        Registra (uma vez) a assinatura e devolve seu handle.
+
+        Args:
+            *types (type): Tipos de componente exigidos.
+
+        Returns:
+            Query: Handle compartilhado por todos que pedem a mesma assinatura.
+        """
+        if not types:
+            raise ValueError("Uma consulta precisa de pelo menos um tipo")
+        query = self._queries.get(types)
+        if query is None:
+            query = self._queries[types] = Query(self, types)
+        return query
+
+    def world(self) -> _WorldIndex:
+        """Índice do mundo ativo (criado vazio na primeira vez)."""
+        index = self._worlds.get(esper.current_world)
+        if index is None:
+            if not self._originals:
+                raise RuntimeError(
+                    "Consultas sem ganchos no esper: chame queries.install() "
+                    "na inicialização",
+                )
+            index = self._worlds[esper.current_world] = _WorldIndex()
+        return index
+
+    def signatures(self, world_name: str) -> int:
+        """Quantas assinaturas estão materializadas em um mundo."""
+        index = self._worlds.get(world_name)
+        return len(index.entries) if index is not None else 0
+
+    def _active(self) -> _WorldIndex | None:
+        return self._worlds.get(esper.current_world)
+
+    def add_components(self, entity: int, components: tuple):
+        """
+        Adiciona vários componentes e atualiza as consultas uma vez só.
+
+        Equivale a chamar `esper.add_component` para cada componente, mas as
+        assinaturas satisfeitas são resolvidas pelo conjunto de tipos da entidade
+        (cacheado por "arquétipo"), sem re-testar cada consulta a cada
+        componente. É o caminho dos spawns em lote (pools, CommandBuffer).
+
+        Args:
+            entity (int): Entidade existente.
+            components (tuple): Instâncias a adicionar (sem `type_alias`).
+        """
+        add = self._originals.get("add_component", esper.add_component)
+        for component in components:
+            add(entity, component)
+
+        index = self._active()
+        if index is None:
+            return
+        comp_map = {type(c): c for c in esper.components_for_entity(entity)}
+        for entry in index.matching(frozenset(comp_map)):
+            types = entry.types
+            entry.put(
+                entity,
+                comp_map[types[0]] if entry.single else tuple(map(comp_map.get, types)),
+            )
+
+    # --- Ganchos -------------------------------------------------------------
+
+    def install(self):
+        """
+        Envolve as funções estruturais do esper (idempotente).
+
+        Chamado uma vez na inicialização (`main.py`, `setup_headless_display`);
+        até lá as consultas não podem ser usadas. Funções que a versão instalada
+        do esper não tem (ex: `try_remove_component` no 3.4) são puladas.
+        """
+        if self._originals:
+            return
+        for name in self._HOOKED:
+            original = getattr(esper, name, None)
+            if original is None:
+                continue  # `try_remove_component` só existe a partir do esper 3.6
+            self._originals[name] = original
+            setattr(esper, name, getattr(self, f"_hook_{name}"))
+
+    def uninstall(self):
+        """Restaura as funções originais do esper e descarta os índices."""
+        for name, original in self._originals.items():
+            setattr(esper, name, original)
+        self._originals.clear()
+        self._worlds.clear()
+
+    def _hook_create_entity(self, *components: Any) -> int:
+        ent = self._originals["create_entity"](*components)
+        index = self._active()
+        if index is not None:
+            seen = set()
+            for component in components:
+                for entry in index.by_type.get(type(component), ()):
+                    if id(entry) not in seen:
+                        seen.add(id(entry))
+                        entry.refresh(ent)
+        return ent
+
+    def _hook_add_component(
+        self, entity: int, component_instance: Any, type_alias: type | None = None
+    ):
+        self._originals["add_component"](entity, component_instance, type_alias)
+        index = self._active()
+        if index is not None:
+            comp_type = type_alias or type(component_instance)
+            for entry in index.by_type.get(comp_type, ()):
+                entry.refresh(entity)
+
+    def _hook_remove_component(self, entity: int, component_type: type) -> Any:
+        component = self._originals["remove_component"](entity, component_type)
+        self._discard(entity, component_type)
+        return component
+
+    def _hook_try_remove_component(self, entity: int, component_type: type) -> Any:
+        component = self._originals["try_remove_component"](entity, component_type)
+        if component is not None:
+            self._discard(entity, component_type)
+        return component
+
+    def _discard(self, entity: int, component_type: type):
+        index = self._active()
+        if index is not None:
+            for entry in index.by_type.get(component_type, ()):
+                entry.discard(entity)
+
+    def _hook_delete_entity(self, entity: int, immediate: bool = False):
+        # Sem `immediate` o esper só apaga no próximo `process()`; para as
+        # consultas a entidade já deixa de existir agora
+        self._originals["delete_entity"](entity, immediate)
+        index = self._active()
+        if index is not None:
+            for entry in index.entries.values():
+                entry.discard(entity)
+
+    def _hook_clear_database(self):
+        self._originals["clear_database"]()
+        self._worlds.pop(esper.current_world, None)
+
+    def _hook_delete_world(self, name: str):
+        self._originals["delete_world"](name)
+        self._worlds.pop(name, None)
+
+
+# Registro único do processo (ganchos instalados por quem sobe o jogo)
+queries = QueryCache()
+query = queries.register
+add_components = queries.add_components
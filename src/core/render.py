@@ -0,0 +1,322 @@
+"""
+Backends de renderização: o destino de desenho das cenas e do RenderProcessor.
+
+As cenas desenham em `self.display`, que é um backend com a mesma interface da\
+    Surface usada pelo jogo (`fill`, `blit`, `blits`, `copy`, `get_size`...) mais\
+        `draw_rect` e `present`. O backend é escolhido na inicialização\
+            (settings.RENDER_BACKEND ou `SceneManager(renderer=...)`):
+
+- "immediate": cada chamada vira um blit na tela, na hora (um `blit` por sprite).
+- "batched": blits seguidos são acumulados e enviados em um único `Surface.blits`.
+- "recording": grava as chamadas de desenho (testes/benchmarks) e repassa a outro\
+    backend (padrão: "null").
+- "null": não desenha nada; o SceneManager nem chama o `draw` das cenas.
+"""
+
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, NamedTuple
+
+import pygame
+
+from src.settings import RENDER_BACKEND, WINDOW_HEIGHT, WINDOW_WIDTH
+
+_EMPTY = pygame.Rect(0, 0, 0, 0)
+
+
+class RenderBackend(ABC):
+    """Destino de desenho de um frame (tela ou Surface fora da tela)."""
+
+    # False = descarta todo desenho; o SceneManager pula o draw das cenas
+    rasterizes: bool = True
+
+    # Surface com os pixels (None quando o backend não desenha)
+    surface: pygame.Surface | None = None
+
+    def __init__(self, size: tuple[int, int]):
+        self.size = size
+
+    def get_size(self) -> tuple[int, int]:
+        return self.size
+
+    def get_width(self) -> int:
+        return self.size[0]
+
+    def get_height(self) -> int:
+        return self.size[1]
+
+    def get_rect(self, **kwargs) -> pygame.Rect:
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)  # Como Surface.get_rect(center=...)
+        return rect
+
+    def begin_frame(self):
+        """Chamado pelo SceneManager antes de desenhar um frame."""
+        pass
+
+    def end_frame(self):
+        """Chamado pelo SceneManager depois de desenhar: os pixels ficam prontos."""
+        pass
+
+    @abstractmethod
+    def fill(self, color, rect=None) -> pygame.Rect:
+        """Preenche a tela (ou `rect`) com uma cor."""
+        ...
+
+    @abstractmethod
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags=0):
+        """Desenha `source` (ou a `area` dela) em `dest`; devolve a área alterada."""
+        ...
+
+    @abstractmethod
+    def blits(self, blit_sequence, doreturn: bool = True) -> list[pygame.Rect] | None:
+        """Vários blits, como `Surface.blits` (itens `(source, dest[, area])`)."""
+        ...
+
+    @abstractmethod
+    def draw_rect(self, color, rect, width: int = 0) -> pygame.Rect:
+        """Retângulo cheio (ou só a borda, com `width`), como `pygame.draw.rect`."""
+        ...
+
+    @abstractmethod
+    def copy(self) -> pygame.Surface | None:
+        """Cópia dos pixels atuais (quadros congelados/fades); None se não há."""
+        ...
+
+    @abstractmethod
+    def offscreen(self, size: tuple[int, int] | None = None) -> "RenderBackend":
+        """Backend do mesmo tipo sobre uma Surface nova (ex: fundo pré-composto)."""
+        ...
+
+    @abstractmethod
+    def present(self, dirty_rects: list[pygame.Rect] | None = None):
+        """Publica o frame na janela: as áreas de `dirty_rects` ou tudo (None)."""
+        ...
+
+
+class ImmediateBackend(RenderBackend):
+    """Desenha direto na Surface, uma chamada do pygame por blit."""
+
+    def __init__(self, surface: pygame.Surface):
+        super().__init__(surface.get_size())
+        self.surface = surface
+
+    def fill(self, color, rect=None) -> pygame.Rect:
+        return self.surface.fill(color, rect)
+
+    def blit(self, source, dest, area=None, special_flags=0) -> pygame.Rect:
+        return self.surface.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> list[pygame.Rect] | None:
+        blit = self.surface.blit
+        drawn = [blit(*item) for item in blit_sequence]
+        return drawn if doreturn else None
+
+    def draw_rect(self, color, rect, width: int = 0) -> pygame.Rect:
+        return pygame.draw.rect(self.surface, color, rect, width)
+
+    def copy(self) -> pygame.Surface:
+        return self.surface.copy()
+
+    def offscreen(self, size: tuple[int, int] | None = None) -> RenderBackend:
+        return type(self)(_new_surface(size or self.size))
+
+    def present(self, dirty_rects: list[pygame.Rect] | None = None):
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
+
+class BatchedBackend(ImmediateBackend):
+    """
+    Acumula os blits seguidos e envia todos em um único `Surface.blits`.
+
+    A fila é descarregada antes de qualquer outra operação (fill, retângulo,
+    cópia, present) e no fim do frame, então a ordem de desenho é a mesma do
+    modo imediato. Uma Surface enfileirada não deve ser alterada antes disso.
+    """
+
+    def __init__(self, surface: pygame.Surface):
+        super().__init__(surface)
+        self._queue: list[tuple] = []
+        self._clip = surface.get_rect()
+
+    def flush(self):
+        """Envia os blits pendentes."""
+        if self._queue:
+            self.surface.blits(self._queue, doreturn=False)
+            self._queue = []
+
+    def end_frame(self):
+        self.flush()
+
+    def blit(self, source, dest, area=None, special_flags=0) -> pygame.Rect:
+        self._queue.append((source, dest, area, special_flags))
+        # Mesma área que o blit devolveria (destino recortado pela tela)
+        size = source.get_size() if area is None else pygame.Rect(area).size
+        return pygame.Rect((dest[0], dest[1]), size).clip(self._clip)
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> list[pygame.Rect] | None:
+        self.flush()
+        return self.surface.blits(blit_sequence, doreturn=doreturn)
+
+    def fill(self, color, rect=None) -> pygame.Rect:
+        self.flush()
+        return super().fill(color, rect)
+
+    def draw_rect(self, color, rect, width: int = 0) -> pygame.Rect:
+        self.flush()
+        return super().draw_rect(color, rect, width)
+
+    def copy(self) -> pygame.Surface:
+        self.flush()
+        return super().copy()
+
+    def present(self, dirty_rects: list[pygame.Rect] | None = None):
+        self.flush()
+        super().present(dirty_rects)
+
+
+class NullBackend(RenderBackend):
+    """Descarta todo desenho (servidores de simulação, benchmarks de lógica)."""
+
+    rasterizes = False
+
+    def __init__(self, size: tuple[int, int] = (WINDOW_WIDTH, WINDOW_HEIGHT)):
+        super().__init__(size)
+
+    def fill(self, color, rect=None) -> pygame.Rect:
+        return _EMPTY.copy()
+
+    def blit(self, source, dest, area=None, special_flags=0) -> pygame.Rect:
+        return _EMPTY.copy()
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> list[pygame.Rect] | None:
+        return [] if doreturn else None
+
+    def draw_rect(self, color, rect, width: int = 0) -> pygame.Rect:
+        return _EMPTY.copy()
+
+    def copy(self) -> None:
+        return None
+
+    def offscreen(self, size: tuple[int, int] | None = None) -> RenderBackend:
+        return NullBackend(size or self.size)
+
+    def present(self, dirty_rects: list[pygame.Rect] | None = None):
+        pass
+
+
+class DrawCall(NamedTuple):
+    """Chamada de desenho gravada: nome do método e argumentos."""
+
+    op: str
+    args: tuple[Any, ...]
+
+
+class RecordingBackend(RenderBackend):
+    """
+    Grava as chamadas de desenho e repassa cada uma a outro backend.
+
+    `calls` guarda as chamadas do frame atual (zerada em `begin_frame`), `totals`
+    conta as chamadas por método desde a criação e `frames` os frames desenhados.
+    """
+
+    def __init__(self, inner: RenderBackend | None = None):
+        """
+        Args:
+            inner (RenderBackend | None): Quem desenha de fato (padrão: NullBackend).
+        """
+        self.inner = inner or NullBackend()
+        super().__init__(self.inner.size)
+        self.calls: list[DrawCall] = []
+        self.totals: Counter[str] = Counter()
+        self.frames = 0
+
+    @property
+    def surface(self) -> pygame.Surface | None:
+        return self.inner.surface
+
+    def _record(self, op: str, *args):
+        self.calls.append(DrawCall(op, args))
+        self.totals[op] += 1
+
+    def count(self, op: str) -> int:
+        """Chamadas de `op` no frame atual."""
+        return sum(1 for call in self.calls if call.op == op)
+
+    def begin_frame(self):
+        self.calls = []
+        self.frames += 1
+        self.inner.begin_frame()
+
+    def end_frame(self):
+        self.inner.end_frame()
+
+    def fill(self, color, rect=None) -> pygame.Rect:
+        self._record("fill", color, rect)
+        return self.inner.fill(color, rect)
+
+    def blit(self, source, dest, area=None, special_flags=0) -> pygame.Rect:
+        self._record("blit", source, dest, area, special_flags)
+        return self.inner.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> list[pygame.Rect] | None:
+        batch = list(blit_sequence)
+        self._record("blits", batch)
+        return self.inner.blits(batch, doreturn)
+
+    def draw_rect(self, color, rect, width: int = 0) -> pygame.Rect:
+        self._record("draw_rect", color, rect, width)
+        return self.inner.draw_rect(color, rect, width)
+
+    def copy(self) -> pygame.Surface | None:
+        return self.inner.copy()
+
+    def offscreen(self, size: tuple[int, int] | None = None) -> RenderBackend:
+        return RecordingBackend(self.inner.offscreen(size))
+
+    def present(self, dirty_rects: list[pygame.Rect] | None = None):
+        self._record("present", dirty_rects)
+        self.inner.present(dirty_rects)
+
+
+BACKENDS: dict[str, type[RenderBackend]] = {
+    "immediate": ImmediateBackend,
+    "batched": BatchedBackend,
+    "recording": RecordingBackend,
+    "null": NullBackend,
+}
+
+
+def _new_surface(size: tuple[int, int]) -> pygame.Surface:
+    surface = pygame.Surface(size)
+    # Mesmo formato da tela: blits sem conversão de pixels
+    return surface.convert() if pygame.display.get_surface() is not None else surface
+
+
+def create_backend(name: str = RENDER_BACKEND) -> RenderBackend:
+    """
+    Cria o backend `name` para a janela atual.
+
+    Args:
+        name (str): "immediate", "batched", "recording" ou "null".
+
+    Returns:
+        RenderBackend: "immediate"/"batched" desenham na tela de
+            `pygame.display.set_mode()`; "recording" grava sobre um "null".
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Backend de render desconhecido: {name}")
+    if name in ("null", "recording"):
+        return BACKENDS[name]()
+
+    surface = pygame.display.get_surface()
+    if surface is None:
+        raise RuntimeError(
+            "Erro Crítico: Tentativa de criar o backend de render antes de "
+            "pygame.display.set_mode()",
+        )
+    return BACKENDS[name](surface)
@@ -0,0 +1,203 @@
+"""
+Gravação compacta de partidas (replay) e checksums de estado.
+
+A simulação é determinística dados a semente do RNG do mundo, o `dt` de cada passo\
+    e as teclas lidas pelo movimento. O replay guarda só isso: por frame, o `dt`\
+        (float64, para repetir os mesmos valores) e um bitmask das teclas WASD;\
+            a cada N frames, um CRC32 do estado do mundo para validar a reprodução.
+
+Formato do arquivo (little-endian):
+    cabeçalho  "SSRP" | versão u16 | intervalo de checksum u32 | semente u64 |
+               frames u32 | checksums u32
+    corpo      zlib( frames x (dt f64, teclas u8) + checksums x (frame u32, crc u32) )
+
+Com `dt` fixo o corpo comprime para poucos bytes por segundo de jogo: 30 minutos
+de partida cabem em algumas dezenas de KB.
+"""
+
+import struct
+import zlib
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+import pygame
+
+from src.core.components import Health, Score, Transform
+from src.core.input import InputSource, KeyState
+from src.core.patterns import PatternEngine
+from src.core.query import query
+from src.core.resources import world_resources
+
+MAGIC = b"SSRP"
+VERSION = 2  # 2: checksum inclui os tiros do PatternEngine (não são entidades)
+
+# Teclas lidas por GameScene._handle_movement_input (bit i = TRACKED_KEYS[i])
+TRACKED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+_HEADER = struct.Struct("<4sHIQII")
+_FRAME = struct.Struct("<dB")
+_CHECKSUM = struct.Struct("<II")
+
+
+def encode_keys(keys) -> int:
+    """Bitmask das teclas monitoradas em um estado estilo `get_pressed()`."""
+    mask = 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask: int) -> KeyState:
+    return KeyState(key for bit, key in enumerate(TRACKED_KEYS) if mask >> bit & 1)
+
+
+def world_checksum() -> int:
+    """
+    CRC32 do estado relevante do mundo ativo: posições, vida e pontuação.
+
+    Entidades entram na ordem das consultas, que é determinística para a mesma
+    sequência de operações, e os tiros do PatternEngine na ordem de disparo;
+    qualquer divergência na simulação muda o valor.
+
+    Returns:
+        int: Checksum de 32 bits.
+    """
+    pack = struct.pack
+    crc = 0
+    for ent, trans in query(Transform).get():
+        crc = zlib.crc32(pack("<Idd", ent, trans.x, trans.y), crc)
+    for ent, health in query(Health).get():
+        crc = zlib.crc32(pack("<Iii", ent, health.current, health.maximum), crc)
+    res = world_resources()
+    bullets = res.get(PatternEngine)
+    if bullets is not None:
+        for column in bullets.positions():
+            crc = zlib.crc32(column.astype("<f8").tobytes(), crc)
+    score = res.get(Score)
+    if score is not None:
+        crc = zlib.crc32(pack("<q", score.points), crc)
+    return crc
+
+
+class Replay:
+    """Log de uma partida: semente, `dt` e teclas por frame, checksums periódicos."""
+
+    def __init__(
+        self,
+        seed: int,
+        checksum_interval: int,
+        dts: Iterable[float] = (),
+        keys: Iterable[int] = (),
+        checksums: dict[int, int] | None = None,
+    ):
+        self.seed = seed
+        self.checksum_interval = checksum_interval
+        self.dts = array("d", dts)
+        self.keys = array("B", keys)
+        # Frames já simulados -> checksum do mundo naquele ponto
+        self.checksums: dict[int, int] = checksums or {}
+
+    def __len__(self) -> int:
+        return len(self.dts)
+
+    @property
+    def duration(self) -> float:
+        """Tempo de jogo gravado (s)."""
+        return sum(self.dts)
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.checksum_interval,
+            self.seed,
+            len(self.dts),
+            len(self.checksums),
+        )
+        body = bytearray()
+        for dt, mask in zip(self.dts, self.keys):
+            body += _FRAME.pack(dt, mask)
+        for frame, crc in self.checksums.items():
+            body += _CHECKSUM.pack(frame, crc)
+        return header + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        magic, version, interval, seed, frames, checksums = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Arquivo não é um replay")
+        if version != VERSION:
+            raise ValueError(f"Versão de replay não suportada: {version}")
+
+        body = zlib.decompress(data[_HEADER.size :])
+        split = frames * _FRAME.size
+        if len(body) != split + checksums * _CHECKSUM.size:
+            raise ValueError("Replay truncado ou corrompido")
+
+        replay = cls(seed, interval)
+        for dt, mask in _FRAME.iter_unpack(body[:split]):
+            replay.dts.append(dt)
+            replay.keys.append(mask)
+        replay.checksums = dict(_CHECKSUM.iter_unpack(body[split:]))
+        return replay
+
+    def save(self, path: str | Path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Replay":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class ReplayRecorder:
+    """Acumula frames e checksums de uma partida em andamento."""
+
+    def __init__(self, seed: int, checksum_interval: int):
+        """
+        Args:
+            seed (int): Semente do RNG do mundo da partida.
+            checksum_interval (int): A cada quantos frames guardar um checksum.
+        """
+        self.replay = Replay(seed, checksum_interval)
+
+    @property
+    def frames(self) -> int:
+        return len(self.replay.dts)
+
+    def record_frame(self, dt: float, keys):
+        """Registra o `dt` do passo e as teclas lidas pelo movimento."""
+        self.replay.dts.append(dt)
+        self.replay.keys.append(encode_keys(keys))
+
+    def wants_checksum(self) -> bool:
+        """Se o frame recém-gravado fecha um intervalo de checksum."""
+        interval = self.replay.checksum_interval
+        return interval > 0 and self.frames % interval == 0
+
+    def record_checksum(self, checksum: int):
+        self.replay.checksums[self.frames] = checksum
+
+
+class ReplayInput(InputSource):
+    """Fonte de input que devolve as teclas gravadas, um frame por `advance`."""
+
+    def __init__(self, replay: Replay):
+        self._keys = replay.keys
+        # Só existem 2^len(TRACKED_KEYS) estados: um KeyState por bitmask
+        self._states = [decode_keys(mask) for mask in range(1 << len(TRACKED_KEYS))]
+        self._index = 0
+
+    @property
+    def finished(self) -> bool:
+        return self._index >= len(self._keys)
+
+    def get_pressed(self):
+        if self.finished:
+            return self._states[0]
+        return self._states[self._keys[self._index]]
+
+    def advance(self):
+        self._index += 1
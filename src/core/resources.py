@@ -0,0 +1,126 @@
+"""
+Recursos por mundo: singletons e estado compartilhado fora das consultas.
+
+Entidades únicas (player, chefe) e estado global da partida (câmera, pontuação,\
+    timer de ataque, RNG) ficam em um dicionário do mundo esper ativo, com acesso\
+        O(1). Handles de entidade são invalidados automaticamente: se a entidade\
+            não existe mais, `entity()` devolve None e descarta o handle.
+"""
+
+from typing import Any
+
+import esper
+
+# Nomes dos handles de entidade usados pelo jogo
+PLAYER = "player"
+BOSS = "boss"
+
+_MISSING = object()
+
+
+class Resources:
+    """
+    Recursos de um mundo. Chaves são tipos (um valor por tipo) ou nomes (str).
+    """
+
+    __slots__ = ("_values", "_entities")
+
+    def __init__(self):
+        self._values: dict[Any, Any] = {}
+        self._entities: dict[str, int] = {}
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def insert(self, value: Any, key: Any = None) -> Any:
+        """
+        Guarda (ou substitui) um recurso.
+
+        Args:
+            value (Any): Valor do recurso.
+            key (Any): Chave; por padrão o tipo do valor.
+
+        Returns:
+            Any: O próprio valor (para encadear na criação).
+        """
+        self._values[type(value) if key is None else key] = value
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            name = key.__name__ if isinstance(key, type) else key
+            raise KeyError(f"Recurso não registrado no mundo: {name}")
+        return value
+
+    def remove(self, key: Any) -> Any:
+        return self._values.pop(key, None)
+
+    def set_entity(self, name: str, ent: int):
+        """Associa um nome (ex: PLAYER) a uma entidade do mundo."""
+        self._entities[name] = ent
+
+    def entity(self, name: str) -> int | None:
+        """
+        Entidade registrada com `name`, ou None se não existe (ou já morreu).
+
+        Args:
+            name (str): Nome do handle.
+
+        Returns:
+            int | None: ID da entidade viva.
+        """
+        ent = self._entities.get(name)
+        if ent is None:
+            return None
+        if not esper.entity_exists(ent):
+            # IDs não são reaproveitados pelo esper: o handle morreu de vez
+            del self._entities[name]
+            return None
+        return ent
+
+    def components(self, name: str, *component_types: type) -> tuple | None:
+        """
+        Componentes da entidade `name` (O(1), sem consulta).
+
+        Returns:
+            tuple | None: Componentes na ordem pedida, ou None se a entidade não
+                existe ou não tem todos eles.
+        """
+        ent = self.entity(name)
+        if ent is None:
+            return None
+        return esper.try_components(ent, *component_types)
+
+
+class ResourceRegistry:
+    """Um `Resources` por mundo esper, seguindo `esper.switch_world`."""
+
+    def __init__(self):
+        self._worlds: dict[str, Resources] = {}
+
+    def current(self) -> Resources:
+        """Recursos do mundo ativo (criados vazios na primeira vez)."""
+        res = self._worlds.get(esper.current_world)
+        if res is None:
+            res = self._worlds[esper.current_world] = Resources()
+        return res
+
+    def get(self, world_name: str) -> Resources | None:
+        """Recursos de um mundo qualquer, sem criá-los (ex: relatórios)."""
+        return self._worlds.get(world_name)
+
+    def drop(self, world_name: str):
+        """Descarta os recursos de um mundo (ex: ao destruí-lo)."""
+        self._worlds.pop(world_name, None)
+
+
+# Registro único do processo
+resources = ResourceRegistry()
+world_resources = resources.current
@@ -7,10 +7,22 @@ Esse código implementa um padrão de cenas (Scene / SceneManager) para organiza
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Type, Union
+from typing import Protocol, Type, Union
 
 import pygame
 
+from src.core.profiler import FrameProfiler
+from src.core.render import RenderBackend, create_backend
+from src.settings import PRELOAD_FRAME_BUDGET
+
+
+class Preparation(Protocol):
+    """Trabalho em andamento que deixa uma cena pronta (ex: `utils.Preload`)."""
+
+    def poll(self, budget: float) -> bool:
+        """Avança até `budget` segundos; True quando terminou."""
+        ...
+
 
 class Scene(ABC):
     """
@@ -20,6 +32,13 @@ class Scene(ABC):
         SceneManager para permitir transições e acesso a recursos compartilhados.
     """
 
+    # Áreas alteradas no último draw (modo dirty-rect); None = tela inteira
+    dirty_rects: list[pygame.Rect] | None = None
+
+    # Cena cujo desenho não muda enquanto está no topo (ex: Pause). O manager
+    # compõe o resultado uma vez e depois só repete o quadro pronto
+    static: bool = False
+
     def __init__(self, manager: SceneManager):
         """
         Inicializa a cena.
@@ -28,13 +47,8 @@ class Scene(ABC):
             manager (SceneManager): Gerenciador de cenas que controla transições.
         """
         self.manager = manager
-        surface = pygame.display.get_surface()
-        if surface is None:
-            raise RuntimeError(
-                "Erro Crítico: Tentativa de criar Cena antes de "
-                "pygame.display.set_mode()",
-            )
-        self.display: pygame.Surface = surface
+        # Destino de desenho: o backend de render do manager (interface de Surface)
+        self.display: RenderBackend = manager.renderer
 
     @abstractmethod
     def process_input(self, event: pygame.event.Event):
@@ -78,6 +92,39 @@ class Scene(ABC):
         """Executando quando a cena sai do topo da pilha."""
         pass
 
+    def on_frame(self):
+        """
+        Executado uma vez por frame exibido (antes do draw), com a cena no topo.
+
+        Para trabalho que deve ser espalhado por frames e não por passos de
+        simulação (ex: avançar um `preload`): num catch-up vários `update` cabem
+        no mesmo frame, este hook não.
+        """
+        pass
+
+    @classmethod
+    def preload(cls) -> Preparation | None:
+        """
+        Começa a preparar o que a cena precisa antes de existir (assets pesados).
+
+        Pode ser chamado várias vezes (ex: pelo menu, para adiantar o trabalho);
+        o que já está pronto não é refeito.
+
+        Returns:
+            Preparation | None: Trabalho a avançar a cada frame, ou None se a cena
+                não tem nada a preparar.
+        """
+        return None
+
+    def on_destroy(self):
+        """
+        Executado uma vez quando a cena sai da pilha de vez (switch_to/pop).
+
+        Libera o que a cena mantém fora dela mesma (ex: o mundo esper da partida).
+        Chamado depois do update/input em que a troca aconteceu, nunca no meio dele.
+        """
+        pass
+
 
 class SceneManager:
     """
@@ -85,71 +132,274 @@ class SceneManager:
 
     Suporta trocar por nova cena, empilhar/estourar cenas (push/pop) e de chamadas de\
         input/update/draw para a cena atual. As cenas podem implementar hooks opcionais\
-            `on_enter()` e `on_exit()` para inicialização/limpeza.
+            `on_enter()`, `on_exit()` e `on_destroy()` para inicialização/limpeza.
     """
 
-    def __init__(self):
-        """Inicializa o gerenciador com pilha vazia."""
+    def __init__(
+        self,
+        renderer: RenderBackend | None = None,
+        profiler: FrameProfiler | None = None,
+    ):
+        """
+        Inicializa o gerenciador com pilha vazia.
+
+        Args:
+            renderer (RenderBackend | None): Backend de render das cenas (padrão:
+                settings.RENDER_BACKEND sobre a janela atual).
+            profiler (FrameProfiler | None): Instrumentação das cenas; o manager
+                fecha um frame dela a cada `draw` (não a cada passo de update).
+        """
+        self.renderer = renderer or create_backend()
+        self.profiler = profiler
         self._stack: list[Scene] = []
+        # _frozen[i] = último quadro das cenas _stack[:i + 1], capturado quando
+        # outra cena foi empilhada por cima (as de baixo não redesenham)
+        self._frozen: list[pygame.Surface] = []
+        # Quadro final de uma cena `static` no topo (reaproveitado até mudar)
+        self._static_frame: pygame.Surface | None = None
+        # Transição em andamento: (quadro antigo, duração, tempo decorrido)
+        self._transition: tuple[pygame.Surface, float, float] | None = None
+        # Fração do passo fixo atual (0..1), lida pelas cenas para interpolar
+        self.alpha = 1.0
+        # Áreas a publicar com display.update; None = flip da tela inteira
+        self.dirty_rects: list[pygame.Rect] | None = None
+        # Cenas removidas da pilha, destruídas ao fim do update/input corrente
+        # (a cena que pediu a troca ainda termina o próprio update)
+        self._retired: list[Scene] = []
+        # Troca aguardando a preparação da próxima cena:
+        # (classe, fade, trabalho restante, instância já construída)
+        self._pending: (
+            tuple[Type[Scene], float, Preparation | None, Scene | None] | None
+        ) = None
 
     @property
     def current_scene(self) -> Scene | None:
         return self._stack[-1] if self._stack else None
 
-    def switch_to(self, scene: Union[Type[Scene], Scene]):
+    def _capture(self) -> pygame.Surface | None:
+        """Cópia do último quadro desenhado (a tela ainda guarda o frame anterior)."""
+        return self.renderer.copy() if self._stack else None
+
+    def _start_transition(self, fade: float, frame: pygame.Surface | None):
+        # Uma nova troca sem fade cancela a transição anterior
+        if fade > 0 and frame is not None:
+            self._transition = (frame, fade, 0.0)
+        else:
+            self._transition = None
+
+    def switch_to(self, scene: Union[Type[Scene], Scene], fade: float = 0.0):
         """Troca completa: Remove a atual e coloca a nova.
 
         Args:
             scene (Union[Type[Scene], Scene]): Nova cena
+            fade (float): Duração (s) do fade do quadro antigo para a nova cena.
         """
+        if self._pending is not None and self._pending[3] is not scene:
+            self._cancel_pending()  # Uma troca explícita cancela a que esperava
+        self._pending = None
+        old_frame = self._capture() if fade > 0 else None
         if self.current_scene:
             self.current_scene.on_exit()
 
         new_scene = scene(self) if isinstance(scene, type) else scene
 
+        self._retire([s for s in self._stack if s is not new_scene])
         self._stack = [new_scene]  # Limpa a pilha e define a nova
+        self._frozen.clear()
+        self._static_frame = None
         new_scene.on_enter()
+        self._start_transition(fade, old_frame)
+
+    def switch_when_ready(self, scene: Type[Scene], fade: float = 0.0):
+        """
+        Troca para `scene` quando ela estiver pronta, sem travar nenhum frame.
 
-    def push(self, scene: Union[Type[Scene], Scene]):
+        A cena atual continua rodando e desenhando enquanto, a cada frame exibido
+        (`draw`, não a cada passo de `update`), a próxima avança uma etapa:
+        assets (`preload`, até PRELOAD_FRAME_BUDGET por frame), depois a
+        construção da cena em um frame próprio e, no seguinte, a troca. Assim o
+        custo nunca se soma em um único frame, nem durante um catch-up.
+
+        Args:
+            scene (Type[Scene]): Classe da próxima cena.
+            fade (float): Duração (s) do fade quando a troca acontecer.
+        """
+        self._cancel_pending()
+        self._pending = (scene, fade, scene.preload(), None)
+
+    @property
+    def pending_scene(self) -> Type[Scene] | None:
+        """Cena esperando a preparação terminar (None se não há troca pendente)."""
+        return self._pending[0] if self._pending is not None else None
+
+    def _advance_pending(self):
+        scene, fade, work, instance = self._pending
+        if work is not None:
+            if work.poll(PRELOAD_FRAME_BUDGET):
+                self._pending = (scene, fade, None, None)
+        elif instance is None:
+            # Construída fora da pilha; entra no próximo frame
+            self._pending = (scene, fade, None, scene(self))
+        else:
+            self.switch_to(instance, fade)
+
+    def _cancel_pending(self):
+        if self._pending is not None and self._pending[3] is not None:
+            self._retire([self._pending[3]])  # Já construída: precisa ser destruída
+        self._pending = None
+
+    def push(self, scene: Union[Type[Scene], Scene], fade: float = 0.0):
         """Pausa a atual e coloca uma nova por cima (ex: Pause).
 
+        O quadro atual é congelado: enquanto a nova cena estiver por cima, as
+        cenas de baixo não são redesenhadas.
+
         Args:
             scene (Union[Type[Scene], Scene]): Nova cena
+            fade (float): Duração (s) do fade do quadro antigo para a nova cena.
         """
+        frame = self._capture()
         if self.current_scene:
             self.current_scene.on_exit()
 
         new_scene = scene(self) if isinstance(scene, type) else scene
+        if frame is not None:
+            self._frozen.append(frame)
         self._stack.append(new_scene)
+        self._static_frame = None
         new_scene.on_enter()
+        self._start_transition(fade, frame)
 
-    def pop(self):
-        """Remove a cena do topo e retoma a anterior."""
+    def pop(self, fade: float = 0.0):
+        """Remove a cena do topo e retoma a anterior.
+
+        Args:
+            fade (float): Duração (s) do fade do quadro antigo para a cena retomada.
+        """
         if not self._stack:
             return
 
+        old_frame = self._capture() if fade > 0 else None
         scene_to_remove = self._stack.pop()
         scene_to_remove.on_exit()
+        self._retire([scene_to_remove])
+        # A cena retomada volta a desenhar ao vivo: descarta seu quadro congelado
+        del self._frozen[max(0, len(self._stack) - 1) :]
+        self._static_frame = None
 
         # Retoma a cena anterior (se houver)
         if self.current_scene:
             self.current_scene.on_enter()
+        self._start_transition(fade, old_frame)
+
+    def _retire(self, scenes: list[Scene]):
+        self._retired.extend(scenes)
+
+    def destroy_retired(self):
+        """Chama `on_destroy` das cenas que saíram da pilha (idempotente)."""
+        while self._retired:
+            scene = self._retired.pop(0)
+            if scene not in self._stack:
+                scene.on_destroy()
 
     def run(self, dt: float):
         """
-        Loop reverso para desenhar transparência
+        Um passo de update seguido de um draw (sem interpolação).
 
         Args:
             dt (float): date time
         """
-        # 1. Update: Só a cena do topo recebe a lógica (o jogo ao fundo não se move)
+        self.update(dt)
+        self.draw()
+
+    def update(self, dt: float):
+        """
+        Um passo de simulação.
+
+        Args:
+            dt (float): Duração do passo em segundos.
+        """
+        # Só a cena do topo recebe a lógica (o jogo ao fundo não se move)
         if self.current_scene:
             self.current_scene.update(dt)
+        self.destroy_retired()
+
+        if self._transition is not None:
+            frame, duration, elapsed = self._transition
+            elapsed += dt
+            self._transition = (
+                None if elapsed >= duration else (frame, duration, elapsed)
+            )
+
+    def draw(self, alpha: float = 1.0):
+        """
+        Desenha a cena do topo sobre o quadro congelado das cenas de baixo.
+
+        Cenas `static` no topo são compostas uma vez; nos frames seguintes o
+        custo é zero (e `dirty_rects` fica vazio). Uma transição ativa é
+        desenhada por cima de tudo. Com um backend que não desenha ("null"), o
+        draw das cenas nem é chamado.
+
+        É chamado uma vez por frame exibido (depois dos 0..N passos de update),
+        então é aqui que rodam o `on_frame` da cena do topo e a etapa da troca
+        pendente (`switch_when_ready`), e que o profiler fecha o frame.
+
+        Args:
+            alpha (float): Fração do passo fixo para interpolar (1.0 = estado atual)
+        """
+        if self.current_scene:
+            self.current_scene.on_frame()
+        if self._pending is not None:
+            self._advance_pending()
+        self.destroy_retired()
+        self._compose(alpha)
+        if self.profiler is not None:
+            self.profiler.tick()
+
+    def _compose(self, alpha: float):
+        self.alpha = alpha
+        top = self.current_scene
+        if top is None:
+            self.dirty_rects = None
+            return
+        if not self.renderer.rasterizes:
+            self.dirty_rects = []
+            return
 
-        # 2. Draw: Desenha todas as cenas da base para o topo
-        # Isso permite menus semi-transparentes sobre o jogo
-        for scene in self._stack:
-            scene.draw()
+        display = self.renderer
+        display.begin_frame()
+        if top.static and self._static_frame is not None:
+            # Nada mudou desde o último quadro: a tela já mostra o resultado
+            self.dirty_rects = [] if self._transition is None else None
+            if self._transition is not None:
+                display.blit(self._static_frame, (0, 0))
+        else:
+            # Cenas de baixo entram como o quadro congelado (um blit só), o que
+            # permite menus semi-transparentes sobre o jogo sem redesenhá-lo
+            if self._frozen:
+                display.blit(self._frozen[-1], (0, 0))
+            top.draw()
+
+            if top.static:
+                self._static_frame = display.copy()
+                self.dirty_rects = None
+            elif len(self._stack) == 1:
+                # Dirty-rect só vale com uma única cena: sobreposições pedem a
+                # tela toda
+                self.dirty_rects = top.dirty_rects
+            else:
+                self.dirty_rects = None
+
+        if self._transition is not None:
+            self._draw_transition(display)
+        display.end_frame()
+
+    def _draw_transition(self, display: RenderBackend):
+        """Fade: o quadro antigo por cima, com opacidade decrescente."""
+        frame, duration, elapsed = self._transition
+        frame.set_alpha(round(255 * (1.0 - elapsed / duration)))
+        display.blit(frame, (0, 0))
+        self.dirty_rects = None
 
     def process_input(self, event: pygame.event.Event):
         """Delegar evento para a cena ativa
@@ -159,3 +409,4 @@ class SceneManager:
         """
         if self.current_scene:
             self.current_scene.process_input(event)
+        self.destroy_retired()
@@ -0,0 +1,143 @@
+"""
+Broadphase de colisão com grade uniforme (Spatial Hash).
+
+Cada retângulo é inserido nas células da grade que ele cobre. Uma consulta só\
+    devolve os itens das células vizinhas, de modo que apenas candidatos próximos\
+        chegam ao teste exato (`colliderect`).
+"""
+
+from typing import Any
+
+import pygame
+
+# Chave inteira da célula (mais barata que tupla): cx * _ROW + cy
+_ROW = 1 << 20
+
+
+class SpatialHash:
+    """
+    Grade uniforme esparsa: dicionário de célula -> (retângulos, itens).
+
+    Pensada para ser reconstruída a cada frame (`clear` + `insert`), o que é mais
+    barato em Python do que rastrear a célula de cada entidade incrementalmente.
+    Cada célula guarda listas paralelas para que o teste exato rode em C via
+    `Rect.collidelist`.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """
+        Inicializa a grade vazia.
+
+        Args:
+            cell_size (int): Lado da célula em pixels. Deve ser maior que os
+                objetos mais comuns (tiros) para que caibam em uma só célula.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size deve ser positivo")
+        self.cell_size = cell_size
+        self._cells: dict[int, tuple[list[pygame.Rect], list[Any]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self):
+        """Esvazia a grade (mantém a configuração)."""
+        self._cells.clear()
+        self._count = 0
+
+    def _keys(self, rect: pygame.Rect) -> list[int]:
+        """Chaves de todas as células cobertas pelo retângulo."""
+        cs = self.cell_size
+        x0 = rect.left // cs
+        y0 = rect.top // cs
+        x1 = max(x0, (rect.right - 1) // cs)
+        y1 = max(y0, (rect.bottom - 1) // cs)
+        return [cx * _ROW + cy for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, rect: pygame.Rect, item: Any):
+        """
+        Insere um item em todas as células cobertas pelo retângulo.
+
+        Args:
+            rect (pygame.Rect): Área ocupada pelo item.
+            item (Any): Dado devolvido nas consultas (ex: ID da entidade).
+        """
+        cells = self._cells
+        self._count += 1
+        for key in self._keys(rect):
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = ([rect], [item])
+            else:
+                cell[0].append(rect)
+                cell[1].append(item)
+
+    def query(self, rect: pygame.Rect) -> list[tuple[pygame.Rect, Any]]:
+        """
+        Retorna os candidatos das células cobertas por `rect` (sem teste exato).
+
+        Args:
+            rect (pygame.Rect): Área de busca.
+
+        Returns:
+            list[tuple[pygame.Rect, Any]]: Pares (retângulo, item) sem duplicatas.
+        """
+        result = []
+        seen: set[int] = set()
+        for key in self._keys(rect):
+            cell = self._cells.get(key)
+            if cell is None:
+                continue
+            for other, item in zip(*cell):
+                # Itens que cobrem várias células aparecem mais de uma vez
+                if id(other) not in seen:
+                    seen.add(id(other))
+                    result.append((other, item))
+        return result
+
+    def collide(self, rect: pygame.Rect) -> list[tuple[pygame.Rect, Any]]:
+        """
+        Retorna apenas os candidatos que realmente colidem com `rect`.
+
+        Args:
+            rect (pygame.Rect): Área de busca.
+
+        Returns:
+            list[tuple[pygame.Rect, Any]]: Pares (retângulo, item) que colidem.
+        """
+        return [entry for entry in self.query(rect) if rect.colliderect(entry[0])]
+
+    def first_hit(self, rect: pygame.Rect) -> tuple[pygame.Rect, Any] | None:
+        """
+        Retorna o primeiro item que colide com `rect`, ou None.
+
+        Caminho rápido para o loop de colisão: o teste exato de cada célula é
+        feito em C por `Rect.collidelist`.
+
+        Args:
+            rect (pygame.Rect): Área de busca.
+
+        Returns:
+            tuple[pygame.Rect, Any] | None: Par (retângulo, item) ou None.
+        """
+        cells = self._cells
+        cs = self.cell_size
+        cx, cy = rect.left // cs, rect.top // cs
+
+        # Caminho rápido: retângulo inteiro dentro de uma única célula
+        if (rect.right - 1) // cs == cx and (rect.bottom - 1) // cs == cy:
+            cell = cells.get(cx * _ROW + cy)
+            if cell is None:
+                return None
+            idx = rect.collidelist(cell[0])
+            return None if idx == -1 else (cell[0][idx], cell[1][idx])
+
+        for key in self._keys(rect):
+            cell = cells.get(key)
+            if cell is None:
+                continue
+            idx = rect.collidelist(cell[0])
+            if idx != -1:
+                return cell[0][idx], cell[1][idx]
+        return None
@@ -1,33 +1,61 @@
-import math
-
 import esper
+import numpy as np
 import pygame
 
+from src.core.commands import CommandBuffer
 from src.core.components import (
     Animation,
-    EnemyProjectile,
     EnemyTag,
     Health,
     Invincibility,
-    MovePattern,
-    PlayerTag,
+    Lifetime,
     Projectile,
+    RenderState,
+    Score,
     Sprite,
     Transform,
     Velocity,
 )
+from src.core.patterns import PatternEngine
+from src.core.pool import despawn
+from src.core.query import query
+from src.core.render import RenderBackend
+from src.core.resources import PLAYER, world_resources
+from src.core.spatial import SpatialHash
+from src.core.variants import BLINK, FLASH, variants
+from src.settings import (
+    COLLISION_CELL_SIZE,
+    DESPAWN_MARGIN,
+    HIT_FLASH_TIME,
+    WINDOW_HEIGHT,
+    WINDOW_WIDTH,
+)
+
+
+def _despawner():
+    """`despawn` adiado pelo CommandBuffer do mundo, se houver um registrado."""
+    commands = world_resources().get(CommandBuffer)
+    return despawn if commands is None else commands.despawn
 
 
 class MovementProcessor(esper.Processor):
     """
-    Atualiza a posição das entidades com Velocity.
+    Atualiza a posição das entidades com Velocity e avança os tiros inimigos.
 
-    Espera que `dt` seja o delta time em segundos (float)
+    Espera que `dt` seja o delta time em segundos (float). Os tiros com padrão
+    matemático não são entidades: vivem no `PatternEngine` do mundo (recurso),
+    são avaliados em lote (NumPy) direto nos arrays e removidos exatamente quando
+    o vencimento agendado no disparo chega (saída da área com margem ou idade
+    máxima), sem checagem de limites por frame.
 
     Args:
         esper (Processor): Base class for all Processors to inherit from
     """
 
+    def __init__(self):
+        super().__init__()
+        self._movers = query(Transform, Velocity)
+
     def process(self, dt: float):
         """Atualiza transform.x/y com base em vel.x/y.
 
@@ -35,45 +63,47 @@ class MovementProcessor(esper.Processor):
             dt (float): tempo em segundos desde o último frame
         """
         # Itera apenas sobre entidades que têm Transform e Velocity.
-        for ent, (transform, vel) in esper.get_components(Transform, Velocity):
+        for ent, (transform, vel) in self._movers.get():
             transform.x += vel.x * dt
             transform.y += vel.y * dt
 
-        # 2. Movimento Matemático Complexo (Inimigo)
-        for ent, (trans, pattern) in esper.get_components(Transform, MovePattern):
-            pattern.time += dt
-            t = pattern.time
+        # 2. Movimento Matemático Complexo (Inimigo) em lote: as posições ficam
+        # nos arrays do motor (sem cópia para Transforms) e os vencidos saem já
+        bullets = world_resources().get(PatternEngine)
+        if bullets is not None:
+            bullets.step(dt)
+            bullets.expire()
+
 
-            if pattern.pattern_type == "linear":
-                # Movimento reto baseado em ângulo
-                trans.x = pattern.start_x + math.cos(pattern.angle) * pattern.speed * t
-                trans.y = pattern.start_y + math.sin(pattern.angle) * pattern.speed * t
+class InterpolationProcessor(esper.Processor):
+    """
+    Guarda a posição de cada Transform antes de um passo de simulação.
 
-            elif pattern.pattern_type == "sine":
-                # Zig-Zag: Move na direção do ângulo, oscila na perpendicular
-                # Posição base avançando
-                base_x = pattern.start_x + math.cos(pattern.angle) * pattern.speed * t
-                base_y = pattern.start_y + math.sin(pattern.angle) * pattern.speed * t
+    O RenderProcessor interpola entre essa posição e a atual usando o `alpha` do
+    passo fixo, então o movimento fica suave mesmo com simulação em outra taxa.
 
-                # Oscilação (Seno)
-                offset = math.sin(t * pattern.frequency) * pattern.amplitude
+    Args:
+        esper (Processor): Base class for all processors to inherit from.
+    """
 
-                # Aplica offset perpendicular ao ângulo (-sin, cos)
-                trans.x = base_x - math.sin(pattern.angle) * offset
-                trans.y = base_y + math.cos(pattern.angle) * offset
+    def __init__(self):
+        super().__init__()
+        self._transforms = query(Transform)
 
-            elif pattern.pattern_type == "spiral":
-                # Espiral crescendo
-                current_radius = pattern.speed * t
-                current_angle = pattern.angle + (t * pattern.frequency)
-                trans.x = pattern.start_x + math.cos(current_angle) * current_radius
-                trans.y = pattern.start_y + math.sin(current_angle) * current_radius
+    def process(self):
+        for ent, trans in self._transforms.get():
+            trans.prev_x = trans.x
+            trans.prev_y = trans.y
 
 
 class AnimationProcessor(esper.Processor):
+    def __init__(self):
+        super().__init__()
+        self._animated = query(Animation, Sprite)
+
     def process(self, dt: float):
         # Itera sobre entidades que têm Animação E Sprite
-        for ent, (anim, sprite) in esper.get_components(Animation, Sprite):
+        for ent, (anim, sprite) in self._animated.get():
             anim.timer += dt
 
             # Se o tempo passou da duração do frame...
@@ -81,8 +111,8 @@ class AnimationProcessor(esper.Processor):
                 anim.timer -= anim.frame_duration
                 # Avança para o próximo frame (circular)
                 anim.current_index = (anim.current_index + 1) % len(anim.frames)
-                # Atualiza a imagem que está sendo desenhada
-                sprite.image = anim.frames[anim.current_index]
+                # Atualiza a imagem (página e área do atlas) que será desenhada
+                sprite.image, sprite.area = anim.frames[anim.current_index]
 
 
 class RenderProcessor(esper.Processor):
@@ -90,94 +120,338 @@ class RenderProcessor(esper.Processor):
     Renderiza entidades com Sprite e Transform.
     Suporta Câmera e Ordenação por Camadas (Z-Index)
 
+    Os sprites ficam em baldes persistentes por camada, mantidos entidade a
+    entidade pelos avisos das consultas (`Query.watch`): um spawn ou despawn mexe
+    só no próprio item. Depois de alterar `sprite.layer`, `mark_dirty()` faz o
+    próximo frame mover de balde só quem trocou de camada. Cada camada é enviada
+    em uma única chamada `Surface.blits`, sem o que estiver fora da tela.
+    Os tiros do PatternEngine (recurso do mundo, sem entidades) entram no blits da
+    camada do sprite deles, com interpolação e culling vetorizados.
+    Entidades com `RenderState` desenham a variante pré-calculada (piscar/flash)
+    da imagem atual, sem alterar a Surface compartilhada. Sprites do atlas são
+    desenhados com `area`: a variante é da página inteira, com as mesmas áreas.
+
+    Chaves opcionais do `context`: "camera", "alpha" (interpolação), "target"
+    (backend de destino, padrão: o do construtor), "min_layer"/"max_layer"
+    (faixa de camadas) e "collect_rects" (devolve os retângulos desenhados, usado
+    pelo modo dirty-rect).
+
     Args:
         esper (Processor): Base class for all processors to inherit from.
     """
 
-    def __init__(self, camera=(0.0, 0.0)):
+    def __init__(self, camera=(0.0, 0.0), target: RenderBackend | None = None):
         super().__init__()
         self.camera = camera
-
-    def process(self, context: dict | None = None):
-        display = pygame.display.get_surface()
-        if display is None:
+        self.target = target
+        self._drawables = query(Transform, Sprite)
+        self._states = query(RenderState)
+        # Camada -> {ent: item}; o dict mantém a ordem de entrada (ordem de desenho)
+        self._buckets: dict[int, dict[int, tuple[Transform, Sprite, RenderState]]] = {}
+        self._layers: list[int] = []
+        self._layer_of: dict[int, int] = {}
+        self._state_of: dict[int, RenderState] = {}
+        self._relayer = False
+
+        # Estatísticas do último frame (overlay/benchmarks)
+        self.draw_calls = 0
+        self.culled = 0
+
+    def mark_dirty(self):
+        """Confere no próximo frame a camada de cada sprite (após mudar `layer`)."""
+        self._relayer = True
+
+    def _sync_buckets(self):
+        """Inscreve-se nas consultas do mundo ativo; remonta tudo se for novo."""
+        fresh = self._drawables.watch(self._on_drawable)
+        fresh = self._states.watch(self._on_state) or fresh
+        if fresh:
+            # Primeiro frame no mundo (ou índice descartado por clear_database)
+            self._buckets = {}
+            self._layers = []
+            self._layer_of = {}
+            self._state_of = dict(self._states.get())
+            for ent, comps in self._drawables.get():
+                self._on_drawable(ent, comps)
+        elif self._relayer:
+            for ent, (transform, sprite) in self._drawables.get():
+                if sprite.layer != self._layer_of[ent]:
+                    self._on_drawable(ent, (transform, sprite))
+        self._relayer = False
+
+    def _on_drawable(self, ent: int, comps: tuple[Transform, Sprite] | None):
+        old_layer = self._layer_of.get(ent)
+        if comps is None:
+            if old_layer is not None:
+                del self._layer_of[ent]
+                del self._buckets[old_layer][ent]
             return
+        transform, sprite = comps
+        layer = sprite.layer
+        if old_layer is not None and old_layer != layer:
+            del self._buckets[old_layer][ent]
+        bucket = self._buckets.get(layer)
+        if bucket is None:
+            bucket = self._buckets[layer] = {}
+            # Menor desenha primeiro (fundo), Maior desenha por último (frente)
+            self._layers = sorted(self._buckets)
+        bucket[ent] = (transform, sprite, self._state_of.get(ent))
+        self._layer_of[ent] = layer
+
+    def _on_state(self, ent: int, state: RenderState | None):
+        if state is None:
+            self._state_of.pop(ent, None)
+        else:
+            self._state_of[ent] = state
+        layer = self._layer_of.get(ent)
+        if layer is not None:
+            transform, sprite, _ = self._buckets[layer][ent]
+            self._buckets[layer][ent] = (transform, sprite, state)
+
+    def process(self, context: dict | None = None) -> list[pygame.Rect]:
+        context = context or {}
+        display = context.get("target") or self.target
+        if display is None:
+            return []
+
+        cam_x, cam_y = context.get("camera", self.camera)
+        alpha = context.get("alpha", 1.0)
+        min_layer = context.get("min_layer")
+        max_layer = context.get("max_layer")
+        collect = context.get("collect_rects", False)
+        drawn: list[pygame.Rect] = []
+
+        self._sync_buckets()
+        get_variant = variants.get
+
+        view_w, view_h = display.get_size()
+        interpolate = alpha < 1.0
+        draw_calls = culled = 0
+
+        # Tiros do PatternEngine entram no blits da camada do sprite deles
+        layers = self._layers
+        bullets = world_resources().get(PatternEngine)
+        bullet_layer = None
+        if bullets is not None and bullets.sprite is not None and len(bullets):
+            bullet_layer = bullets.sprite.layer
+            if bullet_layer not in self._buckets:
+                layers = sorted([*layers, bullet_layer])
+
+        for layer in layers:
+            if min_layer is not None and layer < min_layer:
+                continue
+            if max_layer is not None and layer > max_layer:
+                break
+            batch = []
+            append = batch.append
+            bucket = self._buckets.get(layer)
+            for transform, sprite, state in bucket.values() if bucket else ():
+                image = sprite.image
+                if not image:
+                    continue
+                if state is not None:
+                    # Variante pré-calculada: a Surface compartilhada não muda
+                    if state.flash_timer > 0:
+                        image = get_variant(image, FLASH)
+                    elif state.variant is not None:
+                        image = get_variant(image, state.variant)
+                x, y = transform.x, transform.y
+                if interpolate:
+                    # Interpola entre o passo anterior e o atual
+                    x = transform.prev_x + (x - transform.prev_x) * alpha
+                    y = transform.prev_y + (y - transform.prev_y) * alpha
+                x -= cam_x
+                y -= cam_y
+
+                # Culling: fora da viewport não vai para o blits
+                if (
+                    x >= view_w
+                    or y >= view_h
+                    or x + sprite.width <= 0
+                    or y + sprite.height <= 0
+                ):
+                    culled += 1
+                    continue
+                append((image, (int(x), int(y)), sprite.area))
+
+            if layer == bullet_layer:
+                culled += self._append_bullets(
+                    batch, bullets, alpha, cam_x, cam_y, view_w, view_h
+                )
 
-        cam_x, cam_y = self.camera
-        if context and "camera" in context:
-            cam_x, cam_y = context["camera"]
-
-        # Coleta todas as entidades renderizáveis
-        entities: list[tuple[int, tuple[Transform, Sprite]]] = list(
-            esper.get_components(Transform, Sprite)
+            if batch:
+                if collect:
+                    drawn.extend(display.blits(batch))
+                else:
+                    display.blits(batch, doreturn=False)
+                draw_calls += 1
+
+        self.draw_calls = draw_calls
+        self.culled = culled
+        return drawn
+
+    @staticmethod
+    def _append_bullets(
+        batch: list,
+        bullets: PatternEngine,
+        alpha: float,
+        cam_x: float,
+        cam_y: float,
+        view_w: int,
+        view_h: int,
+    ) -> int:
+        """
+        Acrescenta ao `batch` os tiros visíveis do motor (interpolação e culling
+        vetorizados). Devolve quantos ficaram fora da tela.
+        """
+        sprite = bullets.sprite
+        if not sprite.image:
+            return 0
+        xs, ys = bullets.positions(alpha)
+        xs = xs - cam_x
+        ys = ys - cam_y
+        visible = (
+            (xs < view_w)
+            & (ys < view_h)
+            & (xs + sprite.width > 0)
+            & (ys + sprite.height > 0)
         )
+        # astype trunca em direção ao zero, como o int() dos sprites
+        pos_x = xs[visible].astype(np.int64).tolist()
+        pos_y = ys[visible].astype(np.int64).tolist()
+        image, area = sprite.image, sprite.area
+        batch.extend([(image, pos, area) for pos in zip(pos_x, pos_y)])
+        return len(xs) - len(pos_x)
 
-        # Ordena pelo atributo "layer" do Sprite (Z-Index)
-        # Menor desenha primeiro (fundo), Maior desenha por último (frente)
-        entities.sort(key=lambda item: getattr(item[1][1], "layer", 0))
 
-        for ent, (transform, sprite) in entities:
-            if sprite.image:
-                display.blit(
-                    sprite.image, (int(transform.x - cam_x), int(transform.y - cam_y))
-                )
+class LifetimeProcessor(esper.Processor):
+    """
+    Remove projéteis que saíram da tela (com margem) ou passaram da idade máxima.
+
+    Os expirados são coletados durante a varredura e removidos em lote no fim do
+    frame (via `despawn`, que devolve ao pool quando possível). Também mantém a
+    contagem de projéteis vivos por tipo em `live_counts` (os tiros do
+    PatternEngine entram como "PatternEngine"). Esses tiros não têm Lifetime: o
+    vencimento deles é agendado pelo próprio motor.
+
+    Args:
+        esper (Processor): Base class for all processors to inherit from.
+    """
+
+    def __init__(
+        self,
+        bounds: tuple[int, int] = (WINDOW_WIDTH, WINDOW_HEIGHT),
+        margin: float = DESPAWN_MARGIN,
+        tracked_types: tuple[type, ...] = (Projectile,),
+    ):
+        super().__init__()
+        self.bounds = bounds
+        self.margin = margin
+        self.tracked_types = tracked_types
+        self._aging = query(Transform, Lifetime)
+        self._tracked = [query(comp_type) for comp_type in tracked_types]
+        self.live_counts: dict[str, int] = {}
+        self.expired_last_frame = 0
+
+    def process(self, dt: float):
+        min_x = min_y = -self.margin
+        max_x = self.bounds[0] + self.margin
+        max_y = self.bounds[1] + self.margin
+
+        expired = []
+        for ent, (trans, life) in self._aging.get():
+            life.age += dt
+            x, y = trans.x, trans.y
+            if (
+                life.age >= life.max_age
+                or x < min_x
+                or x > max_x
+                or y < min_y
+                or y > max_y
+            ):
+                expired.append(ent)
+
+        # Remoção em lote: no flush do buffer do mundo (ou agora, sem buffer)
+        kill = _despawner()
+        for ent in expired:
+            kill(ent)
+        self.expired_last_frame = len(expired)
+
+        # Consultas incrementais: len() não varre o mundo
+        self.live_counts = {q.types[0].__name__: len(q) for q in self._tracked}
+        bullets = world_resources().get(PatternEngine)
+        if bullets is not None:
+            self.live_counts[PatternEngine.__name__] = len(bullets)
 
 
 class CollisionProcessor(esper.Processor):
+    """
+    Resolve invencibilidade e colisões (Player x Inimigo/Tiros, Laser x Inimigo).
+
+    Os inimigos vão para uma grade espacial (`SpatialHash`) reconstruída a cada
+    frame, para que cada laser só seja testado contra inimigos de células vizinhas.
+    Os tiros do inimigo são testados contra o player direto nos arrays do
+    PatternEngine (`first_hit`).
+
+    Args:
+        esper (Processor): Base class for all processors to inherit from.
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        super().__init__()
+        self.enemy_grid = SpatialHash(cell_size)
+        self._blinking = query(Invincibility, RenderState)
+        self._render_states = query(RenderState)
+        self._enemies = query(Transform, Sprite, EnemyTag)
+        self._lasers = query(Transform, Sprite, Projectile)
+
     def process(self, dt: float):
-        # Parte 1: Invincibility
-        for ent, (inv, sprite) in esper.get_components(Invincibility, Sprite):
+        # Parte 1: Invincibility e flashes (só trocam a variante a desenhar)
+        for ent, (inv, state) in self._blinking.get():
             if inv.is_active:
                 inv.timer -= dt
                 if inv.timer <= 0:
                     inv.is_active = False
-                    sprite.image.set_alpha(255)
+                    state.variant = None
+                elif (inv.timer % (inv.blink_interval * 2)) > inv.blink_interval:
+                    state.variant = BLINK
                 else:
-                    if (inv.timer % (inv.blink_interval * 2)) > inv.blink_interval:
-                        sprite.image.set_alpha(50)
-                    else:
-                        sprite.image.set_alpha(255)
-
-        # Parte 2: Coleta Inimigos
-        enemies_data = []
-        for ent, (trans, sprite, _) in esper.get_components(
-            Transform, Sprite, EnemyTag
-        ):
-            rect = pygame.Rect(trans.x, trans.y, sprite.width, sprite.height)
-            enemies_data.append((rect, ent))
+                    state.variant = None
 
-        # Parte 3: Player vs Enemy
-        enemy_projectiles = []
-        for ent, (trans, sprite, proj) in esper.get_components(
-            Transform, Sprite, EnemyProjectile
-        ):
-            rect = pygame.Rect(trans.x, trans.y, sprite.width, sprite.height)
-            enemy_projectiles.append((rect, ent, proj.damage))
+        for ent, state in self._render_states.get():
+            if state.flash_timer > 0:
+                state.flash_timer -= dt
 
-        for ent, (trans, sprite, inv, health) in esper.get_components(
-            Transform, Sprite, Invincibility, Health
-        ):
-            if not esper.has_component(ent, PlayerTag):
-                continue
-            if inv.is_active:
-                continue
+        # Parte 2: Coleta Inimigos (broadphase em grade)
+        enemy_grid = self.enemy_grid
+        enemy_grid.clear()
+        for ent, (trans, sprite, _) in self._enemies.get():
+            rect = pygame.Rect(trans.x, trans.y, sprite.width, sprite.height)
+            enemy_grid.insert(rect, ent)
 
+        # Parte 3: Player vs Enemy
+        # Com um único player a grade não compensa: os tiros são testados só se o
+        # player puder levar dano, numa passada vetorizada sobre os arrays do
+        # PatternEngine (sem um Rect por tiro)
+        # Player direto pelo handle do mundo (None se morreu ou não existe)
+        res = world_resources()
+        player = res.components(PLAYER, Transform, Sprite, Invincibility, Health)
+        if player is not None and not player[2].is_active:
+            trans, sprite, inv, health = player
             player_rect = pygame.Rect(trans.x, trans.y, sprite.width, sprite.height)
             hit_damage = 0
 
             # A. Checa colisão com corpo do Inimigo
-            for enemy_rect, enemy_ent in enemies_data:
-                if player_rect.colliderect(enemy_rect):
-                    hit_damage = 20
-                    break
-
-            # B. Checa colisão com Tiro do Inimigo
-            if hit_damage == 0:
-                for proj_rect, proj_ent, damage in enemy_projectiles:
-                    if player_rect.colliderect(proj_rect):
-                        hit_damage = damage
-                        esper.delete_entity(proj_ent, immediate=True)  # Tiro some
-                        break
+            if enemy_grid.first_hit(player_rect) is not None:
+                hit_damage = 20
+
+            # B. Checa colisão com Tiro do Inimigo (posições nos arrays do motor)
+            bullets = res.get(PatternEngine)
+            if hit_damage == 0 and bullets is not None:
+                slot = bullets.first_hit(player_rect)
+                if slot is not None:
+                    hit_damage = bullets.damage
+                    bullets.remove([slot])  # Tiro some (não é entidade: sai já)
 
             # Aplica Dano se houve colisão
             if hit_damage > 0:
@@ -187,50 +461,42 @@ class CollisionProcessor(esper.Processor):
 
         # -------------------------------------------------
         # PARTE 4: Laser vs Inimigo
-        # - Evita deletar durante iteração: acumula e deleta depois
+        # - Remoções são coletadas e aplicadas depois da iteração (pelo buffer de
+        #   comandos, se houver): despawns repetidos (inimigo atingido 2x) viram um
         # -------------------------------------------------
-        lasers_to_delete: set[int] = set()
-        enemies_to_delete: set[int] = set()
-
-        for laser_ent, (l_trans, l_sprite, l_proj) in esper.get_components(
-            Transform, Sprite, Projectile
-        ):
-            # Se o laser já está marcado para remoção, pula
-            if laser_ent in lasers_to_delete:
-                continue
+        score = res.get(Score)
+        dead: dict[int, None] = {}
 
+        for laser_ent, (l_trans, l_sprite, l_proj) in self._lasers.get():
             laser_rect = pygame.Rect(
                 l_trans.x, l_trans.y, l_sprite.width, l_sprite.height
             )
 
-            for enemy_rect, enemy_ent in enemies_data:
-                if laser_rect.colliderect(enemy_rect):
-                    if not esper.entity_exists(enemy_ent) or not esper.entity_exists(
-                        laser_ent
-                    ):
-                        continue
-
-                    # Marca o laser para remoção
-                    lasers_to_delete.add(laser_ent)
-
-                    # Aplica dano ao inimigo (se tiver componente Health)
-                    enemy_health = esper.try_component(enemy_ent, Health)
-                    if enemy_health:
-                        enemy_health.current -= l_proj.damage
-                        if enemy_health.current <= 0:
-                            enemies_to_delete.add(enemy_ent)
-                    else:
-                        # Sem componente Health = morte instantânea
-                        enemies_to_delete.add(enemy_ent)
-
-                    # Não checar mais inimigos para esse laser
-                    break
-
-        # Agora deletar todas as entidades marcadas (após iteração)
-        for ent in lasers_to_delete:
-            if esper.entity_exists(ent):
-                esper.delete_entity(ent, immediate=True)
-
-        for ent in enemies_to_delete:
-            if esper.entity_exists(ent):
-                esper.delete_entity(ent, immediate=True)
+            # Só inimigos das células vizinhas chegam ao teste exato
+            hit = enemy_grid.first_hit(laser_rect)
+            if hit is None:
+                continue
+
+            enemy_ent = hit[1]
+            dead[laser_ent] = None
+            if score is not None:
+                score.points += l_proj.damage
+
+            # Flash de acerto (variante pronta, sem tocar na Surface)
+            enemy_state = esper.try_component(enemy_ent, RenderState)
+            if enemy_state is not None:
+                enemy_state.flash_timer = HIT_FLASH_TIME
+
+            # Aplica dano ao inimigo (se tiver componente Health)
+            enemy_health = esper.try_component(enemy_ent, Health)
+            if enemy_health:
+                enemy_health.current -= l_proj.damage
+                if enemy_health.current <= 0:
+                    dead[enemy_ent] = None
+            else:
+                # Sem componente Health = morte instantânea
+                dead[enemy_ent] = None
+
+        kill = _despawner()
+        for ent in dead:
+            kill(ent)
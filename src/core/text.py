@@ -0,0 +1,105 @@
+"""
+Registro de fontes e cache de textos renderizados, compartilhados por todas as cenas.
+
+`SysFont` precisa resolver a fonte do sistema a cada chamada e `Font.render` gera\
+    uma Surface nova a cada frame. Aqui cada fonte é resolvida uma vez (por nome\
+        lógico, ex: "hud") e cada texto é renderizado uma vez por combinação\
+            (fonte, texto, cor, antialias), com descarte LRU.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from src.settings import FONTS, TEXT_CACHE_SIZE
+
+
+class FontRegistry:
+    """Fontes por nome lógico; specs iguais compartilham o mesmo objeto Font."""
+
+    def __init__(self, specs: dict[str, tuple[str, int, bool]]):
+        """
+        Args:
+            specs (dict[str, tuple[str, int, bool]]): nome -> (família, tamanho,
+                negrito), como em `settings.FONTS`.
+        """
+        self.specs = dict(specs)
+        self._fonts: dict[str, pygame.font.Font] = {}
+        self._by_spec: dict[tuple[str, int, bool], pygame.font.Font] = {}
+
+    def register(self, name: str, family: str, size: int, bold: bool = False):
+        self.specs[name] = (family, size, bold)
+        self._fonts.pop(name, None)
+
+    def get(self, name: str) -> pygame.font.Font:
+        font = self._fonts.get(name)
+        if font is None:
+            spec = self.specs[name]
+            font = self._by_spec.get(spec)
+            if font is None:
+                family, size, bold = spec
+                font = pygame.font.SysFont(family, size, bold=bold)
+                self._by_spec[spec] = font
+            self._fonts[name] = font
+        return font
+
+    def load_all(self):
+        """Resolve todas as fontes registradas (chamar no startup)."""
+        for name in self.specs:
+            self.get(name)
+
+
+class TextCache:
+    """Cache LRU de Surfaces de texto: (fonte, texto, cor, antialias) -> Surface."""
+
+    def __init__(self, registry: FontRegistry, max_entries: int = TEXT_CACHE_SIZE):
+        self.registry = registry
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def render(
+        self, font_name: str, text: str, color, antialias: bool = True
+    ) -> pygame.Surface:
+        """
+        Devolve a Surface do texto (compartilhada: não alterar).
+
+        Args:
+            font_name (str): Nome lógico da fonte (ver `settings.FONTS`).
+            text (str): Texto a renderizar.
+            color: Cor aceita pelo pygame (hex, nome ou tupla).
+            antialias (bool): Suavização das bordas.
+
+        Returns:
+            pygame.Surface: Texto renderizado.
+        """
+        key = (font_name, text, color, antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = self.registry.get(font_name).render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+
+# Instâncias únicas do processo
+fonts = FontRegistry(FONTS)
+text_cache = TextCache(fonts)
+
+
+def render_text(font_name: str, text: str, color, antialias: bool = True):
+    """Atalho para `text_cache.render`."""
+    return text_cache.render(font_name, text, color, antialias)
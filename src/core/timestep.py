@@ -0,0 +1,59 @@
+"""
+Passo fixo de simulação com acumulador (Fixed Timestep).
+
+O tempo real de cada frame entra no acumulador e a simulação avança em passos de\
+    tamanho fixo. O resto (fração de passo) vira o `alpha` usado para interpolar a\
+        renderização entre os dois últimos estados.
+"""
+
+
+class FixedTimestep:
+    """
+    Converte o `dt` variável do relógio em N passos fixos por frame.
+
+    Limita a quantidade de passos de recuperação por frame: depois de um travamento
+    longo o tempo excedente é descartado (o jogo fica "lento" por um instante em
+    vez de entrar em espiral tentando alcançar o relógio).
+    """
+
+    def __init__(self, step: float, max_steps: int = 5):
+        """
+        Args:
+            step (float): Duração de um passo de simulação (segundos).
+            max_steps (int): Máximo de passos simulados em um único frame.
+        """
+        if step <= 0:
+            raise ValueError("step deve ser positivo")
+        self.step = step
+        self.max_steps = max(1, max_steps)
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # Tempo descartado por excesso de recuperação
+
+    def advance(self, frame_dt: float) -> int:
+        """
+        Soma o tempo do frame e devolve quantos passos fixos devem rodar agora.
+
+        Args:
+            frame_dt (float): Tempo real do frame em segundos.
+
+        Returns:
+            int: Número de passos (0 se o acumulador ainda não fechou um passo).
+        """
+        self.accumulator += max(0.0, frame_dt)
+        steps = int(self.accumulator // self.step)
+
+        if steps > self.max_steps:
+            steps = self.max_steps
+            excess = self.accumulator - steps * self.step
+            # Mantém só a fração de passo para a interpolação continuar suave
+            kept = excess % self.step
+            self.dropped_time += excess - kept
+            self.accumulator = steps * self.step + kept
+
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fração (0..1) entre o estado anterior e o atual para interpolar."""
+        return self.accumulator / self.step
@@ -0,0 +1,107 @@
+"""
+Variantes de renderização pré-calculadas (piscar, flash de dano, tint).
+
+Em vez de alterar a Surface compartilhada a cada frame (`set_alpha`), cada variante\
+    é gerada uma única vez por Surface de origem, em uma cópia, e reaproveitada. O\
+        RenderProcessor só troca qual Surface envia ao `blits`, a partir do componente\
+            `RenderState` da entidade.
+"""
+
+import weakref
+from collections.abc import Callable
+
+import pygame
+
+from src.settings import BLINK_ALPHA, FLASH_COLOR, TINT_COLOR
+
+# Nomes das variantes usadas pelo jogo
+BLINK = "blink"  # Semi-transparente (i-frames)
+FLASH = "flash"  # Silhueta clara (acerto)
+TINT = "tint"  # Cor multiplicada
+
+
+def _with_alpha(surface: pygame.Surface) -> pygame.Surface:
+    """Cópia com alfa por pixel (mesmo caminho de blit dos frames convert_alpha)."""
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.copy()
+    return surface.convert_alpha()
+
+
+def _blink(surface: pygame.Surface) -> pygame.Surface:
+    variant = _with_alpha(surface)
+    variant.fill((255, 255, 255, BLINK_ALPHA), special_flags=pygame.BLEND_RGBA_MULT)
+    return variant
+
+
+def _flash(surface: pygame.Surface) -> pygame.Surface:
+    variant = _with_alpha(surface)
+    # MAX no RGB clareia tudo; alfa 0 no MAX preserva a silhueta original
+    variant.fill((*FLASH_COLOR, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    return variant
+
+
+def _tint(surface: pygame.Surface) -> pygame.Surface:
+    variant = _with_alpha(surface)
+    variant.fill((*TINT_COLOR, 255), special_flags=pygame.BLEND_RGBA_MULT)
+    return variant
+
+
+class VariantCache:
+    """
+    Variantes por Surface de origem, criadas sob demanda e guardadas para sempre
+    enquanto a origem existir (referência fraca: acompanha o cache de assets).
+    """
+
+    def __init__(self):
+        self.builders: dict[str, Callable[[pygame.Surface], pygame.Surface]] = {
+            BLINK: _blink,
+            FLASH: _flash,
+            TINT: _tint,
+        }
+        self._variants: weakref.WeakKeyDictionary[
+            pygame.Surface, dict[str, pygame.Surface]
+        ] = weakref.WeakKeyDictionary()
+        self.built = 0
+
+    def register(self, name: str, builder: Callable[[pygame.Surface], pygame.Surface]):
+        """Adiciona (ou substitui) um tipo de variante."""
+        self.builders[name] = builder
+        for per_source in self._variants.values():
+            per_source.pop(name, None)
+
+    def get(self, surface: pygame.Surface, name: str) -> pygame.Surface:
+        """
+        Variante `name` de `surface` (gerada na primeira vez).
+
+        Args:
+            surface (pygame.Surface): Surface de origem (não é alterada).
+            name (str): Nome da variante (ex: BLINK, FLASH).
+
+        Returns:
+            pygame.Surface: Surface da variante, compartilhada.
+        """
+        per_source = self._variants.get(surface)
+        if per_source is None:
+            per_source = self._variants[surface] = {}
+        variant = per_source.get(name)
+        if variant is None:
+            builder = self.builders.get(name)
+            if builder is None:
+                raise KeyError(f"Variante de renderização desconhecida: {name}")
+            variant = per_source[name] = builder(surface)
+            self.built += 1
+        return variant
+
+    def invalidate(self, surface: pygame.Surface):
+        """Descarta as variantes de `surface` (ex: página do atlas alterada)."""
+        self._variants.pop(surface, None)
+
+    def prebuild(self, surfaces: list[pygame.Surface], *names: str):
+        """Gera de antemão as variantes dos frames (evita custo no 1º uso)."""
+        for surface in surfaces:
+            for name in names:
+                self.get(surface, name)
+
+
+# Cache único do processo
+variants = VariantCache()
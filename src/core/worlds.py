@@ -0,0 +1,123 @@
+"""
+Ciclo de vida dos mundos esper: nomes únicos, destruição completa e relatório.
+
+Cada partida roda em um mundo próprio. Ao sair de vez da cena o mundo precisa ser\
+    destruído por inteiro: o contexto do esper (entidades, componentes,\
+        processadores), os recursos do mundo e os índices de consulta. Sem isso cada\
+            reinício deixa uma partida inteira para trás na memória.
+"""
+
+import itertools
+from dataclasses import dataclass
+
+import esper
+
+from src.core.query import queries
+from src.core.resources import resources
+
+DEFAULT_WORLD = "default"
+
+_world_ids = itertools.count(1)
+
+
+def new_world_name(prefix: str) -> str:
+    """Nome de mundo ainda não usado neste processo (ex: "level_3")."""
+    return f"{prefix}_{next(_world_ids)}"
+
+
+def destroy_world(name: str):
+    """
+    Apaga um mundo e tudo que é mantido por mundo (recursos e consultas).
+
+    Se for o mundo ativo, o esper volta para o mundo padrão antes (o esper não
+    apaga o mundo ativo).
+
+    Args:
+        name (str): Nome do mundo.
+    """
+    if esper.current_world == name:
+        esper.switch_world(DEFAULT_WORLD)
+    resources.drop(name)
+    if name in esper.list_worlds():
+        # O gancho de `delete_world` (src/core/query.py) descarta os índices
+        esper.delete_world(name)
+
+
+@dataclass
+class WorldStats:
+    """Tamanho de um mundo vivo."""
+
+    name: str
+    entities: int
+    processors: int
+    resources: int
+    queries: int
+
+
+# Tamanhos conhecidos da tupla de contexto do esper (`_context_map`):
+# 3.4: (contador, componentes, entidades, mortas, cache de get_component,
+#       cache de get_components, processadores, tempos, eventos)
+# 3.9: os mesmos campos com (processadores por tipo, cache sujo) depois dos
+#      processadores, antes dos tempos
+_CONTEXT_LENGTHS = (9, 11)
+_ENTITIES, _PROCESSORS = 2, 6
+
+
+def _saved_context(name: str) -> tuple[dict, list]:
+    """
+    Entidades e processadores de um mundo inativo, sem trocar o mundo ativo.
+
+    Lê o contexto privado do esper; se o formato mudar numa atualização, falha
+    aqui com uma mensagem clara em vez de contar o campo errado.
+
+    Returns:
+        tuple[dict, list]: (entidades, processadores) do mundo `name`.
+    """
+    context = esper._context_map[name]
+    entities, processors = context[_ENTITIES], context[_PROCESSORS]
+    if (
+        len(context) not in _CONTEXT_LENGTHS
+        or not isinstance(entities, dict)
+        or not isinstance(processors, list)
+    ):
+        raise RuntimeError(
+            f"Formato de contexto do esper {esper.__version__} não suportado "
+            f"({len(context)} campos): revise src/core/worlds.py"
+        )
+    return entities, processors
+
+
+def world_report() -> list[WorldStats]:
+    """
+    Mundos vivos e o que cada um mantém.
+
+    Returns:
+        list[WorldStats]: Um item por mundo (inclui o padrão do esper).
+    """
+    stats = []
+    for name in esper.list_worlds():
+        if name == esper.current_world:
+            entities, processors = esper._entities, esper._processors
+        else:
+            entities, processors = _saved_context(name)
+        world_resources = resources.get(name)
+        stats.append(
+            WorldStats(
+                name=name,
+                entities=len(entities),
+                processors=len(processors),
+                resources=len(world_resources) if world_resources else 0,
+                queries=queries.signatures(name),
+            )
+        )
+    return stats
+
+
+def format_report(stats: list[WorldStats]) -> str:
+    lines = [f"{'mundo':<16}{'entidades':>10}{'procs':>7}{'recursos':>10}{'cons.':>7}"]
+    for s in stats:
+        lines.append(
+            f"{s.name:<16}{s.entities:>10}{s.processors:>7}"
+            f"{s.resources:>10}{s.queries:>7}"
+        )
+    return "\n".join(lines)
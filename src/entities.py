@@ -1,54 +1,148 @@
-import math
+import functools
 import random
 
 import esper
+import numpy as np
 import pygame
 
+from src.core.atlas import AtlasRegion, atlas
+from src.core.commands import CommandBuffer
 from src.core.components import (
     Animation,
-    EnemyProjectile,
     EnemyTag,
     Gun,
     Health,
     Invincibility,
-    MovePattern,
+    Lifetime,
     PlayerTag,
     Projectile,
+    RenderState,
     Sprite,
     Transform,
     Velocity,
 )
+from src.core.patterns import PatternEngine, Volley, load_volleys
+from src.core.pool import ProjectilePool
+from src.core.resources import BOSS, PLAYER, world_resources
+from src.core.variants import BLINK, FLASH, variants
 from src.settings import (
     COLORS,
+    DESPAWN_MARGIN,
+    ENEMY_BULLET_COLOR,
+    ENEMY_BULLET_DAMAGE,
+    ENEMY_BULLET_MAX_AGE,
+    ENEMY_BULLET_POOL_POLICY,
+    ENEMY_BULLET_POOL_SIZE,
+    ENEMY_BULLET_SIZE,
     ENEMY_HP,
-    IMAGES_DIR,
     LASER_DAMAGE,
+    LASER_MAX_AGE,
+    LASER_POOL_POLICY,
+    LASER_POOL_SIZE,
+    LASER_SIZE,
     LASER_SPEED,
-    PATTERN_0_SPEED,
-    PATTERN_1_SPEED,
-    PATTERN_2_SPEED,
-    PATTERN_3_SPEED,
+    PATTERNS_FILE,
     PLAYER_GUN_COOLDOWN,
     PLAYER_START_DELAY,
     WINDOW_HEIGHT,
     WINDOW_WIDTH,
 )
-from src.utils import load_spritesheet
+from src.utils import assets, load_spritesheet
 
+PLAYER_IMAGE = "Main Ship - Base - Full health.png"
+ENEMY_IMAGE = "enemy.png"
+BACKGROUND_IMAGE = "background.png"
 
-def create_player(world_name):
-    esper.switch_world(world_name)
+# Imagens lidas pela GameScene (pré-carregadas enquanto o menu está na tela)
+GAME_IMAGES = (PLAYER_IMAGE, ENEMY_IMAGE, BACKGROUND_IMAGE)
+
+
+def _projectile_regions() -> tuple[AtlasRegion, AtlasRegion]:
+    # Antes dos frames: entrar numa página depois descartaria as variantes dela
+    return (
+        atlas.solid(LASER_SIZE, COLORS["laser"]),
+        atlas.solid(ENEMY_BULLET_SIZE, ENEMY_BULLET_COLOR),
+    )
 
-    filename = "Main Ship - Base - Full health.png"
+
+def _prebuild_variants(frames: list[AtlasRegion], *names: str):
+    # Variantes são por página do atlas (as áreas dos frames continuam valendo)
+    variants.prebuild(list({frame.surface: None for frame in frames}), *names)
+
+
+def _player_frames() -> list[AtlasRegion]:
     # Player geralmente tem tamanho fixo, mantemos assim
     w, h = 48, 48
 
+    frames = atlas.animation(PLAYER_IMAGE)
+    if frames is None:
+        try:
+            sheet = load_spritesheet(PLAYER_IMAGE, frame_height=h, frame_width=w)
+        except FileNotFoundError:
+            s = pygame.Surface((w, h))
+            s.fill(COLORS["player"])
+            sheet = [s]
+        frames = atlas.frames(PLAYER_IMAGE, sheet)
+    # Piscar da invencibilidade usa variantes prontas (cache por página)
+    _prebuild_variants(frames, BLINK)
+    return frames
+
+
+def _enemy_frames() -> list[AtlasRegion]:
+    # --- CONTROLE TOTAL DA ANIMAÇÃO ---
+    num_frames = 4  # Quantidade de sprites na imagem
+    scale = 2  # Tamanho final
+    h_orig = 64  # Altura original da imagem (necessário saber)
+    # ----------------------------------
+
+    frames = atlas.animation(ENEMY_IMAGE)
+    if frames is None:
+        try:
+            # Modo Inteligente: Passamos num_frames, ele calcula a largura sozinho
+            # A escala também fica no atlas: só é feita na primeira partida
+            sheet = load_spritesheet(
+                ENEMY_IMAGE, frame_height=h_orig, num_frames=num_frames, scale=scale
+            )
+
+        except FileNotFoundError:
+            s = pygame.Surface((64, 64))
+            s.fill(COLORS["enemy"])
+            sheet = [s]
+        frames = atlas.frames(ENEMY_IMAGE, sheet)
+    _prebuild_variants(frames, FLASH)
+    return frames
+
+
+def _background() -> pygame.Surface:
     try:
-        frames = load_spritesheet(filename, frame_height=h, frame_width=w)
-    except FileNotFoundError:
-        s = pygame.Surface((w, h))
-        s.fill(COLORS["player"])
-        frames = [s]
+        return assets.image(
+            BACKGROUND_IMAGE, alpha=False, size=(WINDOW_WIDTH, WINDOW_HEIGHT)
+        )
+    except Exception:
+        bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        bg.fill("#111122")
+        return bg
+
+
+def game_asset_steps() -> list:
+    """
+    Passos (thread principal) que deixam os assets da GameScene prontos no cache:
+    as mesmas chamadas que as fábricas fazem, já com as imagens decodificadas.
+    """
+    return [
+        _projectile_regions,
+        _player_frames,
+        _enemy_frames,
+        _background,
+        enemy_volleys,
+    ]
+
+
+def create_player(world_name):
+    esper.switch_world(world_name)
+
+    frames = _player_frames()
+    w = frames[0].width
 
     player = esper.create_entity()
     spawn_x = (WINDOW_WIDTH // 2) - (w // 2)
@@ -57,48 +151,26 @@ def create_player(world_name):
     esper.add_component(player, Transform(spawn_x, spawn_y))
     esper.add_component(player, Velocity(0, 0))
     esper.add_component(player, PlayerTag())
-    esper.add_component(player, Sprite(frames[0], layer=2))
+    esper.add_component(player, Sprite(*frames[0], layer=2))
     # Velocidade fixa para o player
     esper.add_component(player, Animation(frames, 0.1))
     esper.add_component(player, Invincibility(duration=2.0))
+    esper.add_component(player, RenderState())
     esper.add_component(player, Health(100, 100))
     esper.add_component(
         player, Gun(cooldown=PLAYER_GUN_COOLDOWN, start_delay=PLAYER_START_DELAY)
     )
+    world_resources().set_entity(PLAYER, player)
+    return player
 
 
 def create_enemy(world_name):
     esper.switch_world(world_name)
 
-    filename = "enemy.png"
-
-    # --- CONTROLE TOTAL DA ANIMAÇÃO ---
-    num_frames = 4  # Quantidade de sprites na imagem
     anim_speed = 0.2  # Velocidade da troca (0.2 = mais lento, 0.1 = rápido)
-    scale = 2  # Tamanho final
-    h_orig = 64  # Altura original da imagem (necessário saber)
-    # ----------------------------------
-
-    try:
-        # Modo Inteligente: Passamos num_frames, ele calcula a largura sozinho
-        raw_frames = load_spritesheet(
-            filename, frame_height=h_orig, num_frames=num_frames
-        )
+    frames = _enemy_frames()
 
-        # Escala os frames retornados
-        frames = []
-        for f in raw_frames:
-            w = f.get_width()
-            h = f.get_height()
-            scaled = pygame.transform.scale(f, (w * scale, h * scale))
-            frames.append(scaled)
-
-    except FileNotFoundError:
-        s = pygame.Surface((64, 64))
-        s.fill(COLORS["enemy"])
-        frames = [s]
-
-    final_w = frames[0].get_width()
+    final_w = frames[0].width
 
     enemy = esper.create_entity()
     spawn_x = (WINDOW_WIDTH // 2) - (final_w // 2)
@@ -106,115 +178,160 @@ def create_enemy(world_name):
     esper.add_component(enemy, Transform(spawn_x, 30))
     esper.add_component(enemy, Velocity(0, 0))
     esper.add_component(enemy, EnemyTag())
-    esper.add_component(enemy, Sprite(frames[0], layer=2))
+    esper.add_component(enemy, Sprite(*frames[0], layer=2))
 
     # AQUI ESTÁ O CONTROLE: Passamos a variável anim_speed
     esper.add_component(enemy, Animation(frames, anim_speed))
     esper.add_component(enemy, Health(ENEMY_HP, ENEMY_HP))
+    esper.add_component(enemy, RenderState())
+    world_resources().set_entity(BOSS, enemy)
+    return enemy
+
+
+def create_laser_pool(world_name) -> ProjectilePool:
+    """Pré-aloca os lasers do player (todos compartilham a mesma região do atlas)."""
+    region, _ = _projectile_regions()
+
+    def factory():
+        return (
+            Transform(0, 0),
+            Velocity(0, LASER_SPEED),
+            Sprite(*region, layer=1),
+            Projectile(damage=LASER_DAMAGE),
+            Lifetime(LASER_MAX_AGE),
+        )
 
+    return ProjectilePool(world_name, factory, LASER_POOL_SIZE, LASER_POOL_POLICY)
 
-def create_laser(world_name, player_pos: Transform, player_sprite: Sprite):
-    esper.switch_world(world_name)
 
-    w, h = 4, 10
-    surf = pygame.Surface((w, h))
-    surf.fill(COLORS["laser"])
-
-    laser = esper.create_entity()
+def create_laser(
+    world_name,
+    player_pos: Transform,
+    player_sprite: Sprite,
+    pool=None,
+    commands: CommandBuffer | None = None,
+) -> int | None:
+    """Dispara um laser. Com `commands`, a entrada no mundo fica para o flush
+    (sem pool, a entidade só existe depois dele e o retorno é None)."""
+    w, h = LASER_SIZE
     spawn_x = player_pos.x + (player_sprite.width // 2) - (w // 2)
     spawn_y = player_pos.y - h
 
-    esper.add_component(laser, Transform(spawn_x, spawn_y))
-    esper.add_component(laser, Velocity(0, LASER_SPEED))
-    esper.add_component(laser, Sprite(surf, layer=1))
-    esper.add_component(laser, Projectile(damage=LASER_DAMAGE))
+    # Caminho rápido: recicla uma entidade do pool (mundo já está ativo)
+    if pool is not None:
+        acquired = pool.acquire(commands)
+        if acquired is None:
+            return None  # Pool esgotado com política "drop"
+        laser, (trans, vel, _, _, life) = acquired
+        # prev_* também: sem isso a interpolação "arrasta" da posição antiga
+        trans.x = trans.prev_x = spawn_x
+        trans.y = trans.prev_y = spawn_y
+        vel.x, vel.y = 0, LASER_SPEED
+        life.age = 0.0
+        return laser
+
+    esper.switch_world(world_name)
+
+    components = (
+        Transform(spawn_x, spawn_y),
+        Velocity(0, LASER_SPEED),
+        Sprite(*_projectile_regions()[0], layer=1),
+        Projectile(damage=LASER_DAMAGE),
+        Lifetime(LASER_MAX_AGE),
+    )
+    if commands is not None:
+        commands.spawn(*components)
+        return None
+    return esper.create_entity(*components)
 
 
 def create_bg(world_name):
     esper.switch_world(world_name)
 
-    try:
-        bg = pygame.image.load(IMAGES_DIR / "background.png").convert()
-        bg = pygame.transform.scale(bg, (WINDOW_WIDTH, WINDOW_HEIGHT))
-    except Exception:
-        bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        bg.fill("#111122")
+    bg = _background()
 
     ent = esper.create_entity()
     esper.add_component(ent, Transform(0, 0))
     esper.add_component(ent, Sprite(bg, layer=0))
 
 
-def create_enemy_bullet(world_name, x, y, pattern_type, angle, speed, freq=5.0):
-    """Cria um único projétil inimigo com padrão matemático."""
+def create_enemy_bullets(world_name) -> PatternEngine:
+    """
+    Cria o armazenamento dos tiros do inimigo (recurso `PatternEngine` do mundo).
+
+    Os tiros não são entidades: cada disparo ocupa um slot nos arrays do motor,
+    todos com a mesma região do atlas e o mesmo dano. Saída da tela (com margem)
+    e idade máxima são agendadas no disparo, sem varredura por frame.
+    """
     esper.switch_world(world_name)
+    _, region = _projectile_regions()
+    margin = DESPAWN_MARGIN
+    bullets = PatternEngine(
+        capacity=ENEMY_BULLET_POOL_SIZE,
+        bounds=(-margin, -margin, WINDOW_WIDTH + margin, WINDOW_HEIGHT + margin),
+        max_age=ENEMY_BULLET_MAX_AGE,
+        on_full=ENEMY_BULLET_POOL_POLICY,
+        sprite=Sprite(*region, layer=1),
+        damage=ENEMY_BULLET_DAMAGE,
+    )
+    return world_resources().insert(bullets)
 
-    w, h = 8, 8
-    surf = pygame.Surface((w, h))
-    surf.fill("#ffff00")  # Amarelo
 
-    bullet = esper.create_entity()
+def create_enemy_bullet(world_name, x, y, pattern_type, angle, speed, freq=5.0) -> bool:
+    """Dispara um único projétil inimigo com padrão matemático.
 
-    # Nota: A posição será controlada pelo MovePattern, mas inicializamos o Transform
-    esper.add_component(bullet, Transform(x, y))
-    # Velocity zerada pois o MovePattern controla tudo
-    esper.add_component(bullet, Velocity(0, 0))
-    esper.add_component(bullet, Sprite(surf, layer=1))
-    esper.add_component(bullet, EnemyProjectile(damage=10))
+    O tiro entra direto no `PatternEngine` do mundo (ver `create_enemy_bullets`);
+    retorna False se a política "drop" o recusou.
+    """
+    esper.switch_world(world_name)
+    bullets = world_resources()[PatternEngine]
+    # amplitude = largura do zig-zag
+    return bullets.add(pattern_type, x, y, angle, speed, freq, amplitude=30.0)
 
-    # Componente matemático
-    esper.add_component(
-        bullet,
-        MovePattern(
-            pattern_type=pattern_type,
-            start_x=x,
-            start_y=y,
-            angle=angle,
-            speed=speed,
-            frequency=freq,
-            amplitude=30.0,  # Largura do zig-zag
-        ),
-    )
 
+@functools.cache
+def enemy_volleys() -> tuple[Volley, ...]:
+    """Golpes do inimigo, lidos de PATTERNS_FILE e compilados uma vez só."""
+    return tuple(load_volleys(PATTERNS_FILE))
 
-def spawn_enemy_pattern(world_name, enemy_x, enemy_y, pattern_idx):
-    """Gerencia qual 'golpe' o inimigo vai usar."""
 
-    # Padrão 0: Leque Simples (Fan)
-    if pattern_idx == 0:
-        angles = [60, 75, 90, 105, 120]  # Graus (90 é para baixo)
-        for deg in angles:
-            rad = math.radians(deg)
-            speed = random.uniform(PATTERN_0_SPEED[0], PATTERN_0_SPEED[1])
-            create_enemy_bullet(
-                world_name, enemy_x, enemy_y, "linear", rad, speed=speed, freq=5
-            )
+def spawn_volley(world_name, volley: Volley, x, y, rng=random) -> int:
+    """
+    Dispara uma rajada inteira em lote a partir de (x, y).
 
-    # Padrão 1: Zig-Zag Circular (360 graus)
-    elif pattern_idx == 1:
-        for deg in range(0, 360, 45):  # 8 direções
-            rad = math.radians(deg)
-            speed = random.uniform(PATTERN_1_SPEED[0], PATTERN_1_SPEED[1])
-            create_enemy_bullet(
-                world_name, enemy_x, enemy_y, "sine", rad, speed=speed, freq=5.0
-            )
+    As velocidades são sorteadas de uma vez (NumPy) e o `PatternEngine` do mundo
+    recebe a rajada numa escrita vetorizada, sem entidades por tiro.
 
-    # Padrão 2: Leque Zig-Zag (Wavy Fan)
-    elif pattern_idx == 2:
-        angles = [70, 80, 90, 100, 110]
-        for deg in angles:
-            rad = math.radians(deg)
-            speed = random.uniform(PATTERN_2_SPEED[0], PATTERN_2_SPEED[1])
-            create_enemy_bullet(
-                world_name, enemy_x, enemy_y, "sine", rad, speed=speed, freq=3.0
-            )
+    Args:
+        world_name (str): Mundo dos tiros.
+        volley (Volley): Golpe compilado.
+        x (float): Origem X.
+        y (float): Origem Y.
+        rng: Gerador do mundo (`random.Random` ou o módulo `random`).
 
-    # Padrão 3: Espiral Louca
-    elif pattern_idx == 3:
-        # Cria 4 braços de espiral
-        for deg in [0, 90, 180, 270]:
-            rad = math.radians(deg)
-            speed = random.uniform(PATTERN_3_SPEED[0], PATTERN_3_SPEED[1])
-            create_enemy_bullet(
-                world_name, enemy_x, enemy_y, "spiral", rad, speed=speed, freq=1.0
-            )
+    Returns:
+        int: Quantidade de tiros disparados.
+    """
+    speeds = volley.sample_speeds(np.random.default_rng(rng.getrandbits(64)))
+
+    esper.switch_world(world_name)
+    bullets = world_resources()[PatternEngine]
+    return bullets.add_many(
+        volley.kind,
+        x,
+        y,
+        volley.angles,
+        speeds,
+        volley.frequency,
+        volley.amplitude,
+    )
+
+
+def spawn_enemy_pattern(world_name, enemy_x, enemy_y, pattern_idx, rng=random) -> int:
+    """Gerencia qual 'golpe' o inimigo vai usar (índice em `enemy_volleys()`).
+
+    `rng` é o gerador do mundo (determinístico); o padrão é o módulo `random`.
+    """
+    volleys = enemy_volleys()
+    volley = volleys[pattern_idx % len(volleys)]
+    return spawn_volley(world_name, volley, enemy_x, enemy_y, rng)
@@ -0,0 +1,161 @@
+"""
+Execução headless (sem janela) e determinística da GameScene.
+
+Usa o driver de vídeo "dummy" do SDL, `dt` fixo, `random` semeado e um roteiro de\
+    teclas no lugar do teclado. Roda N frames o mais rápido possível e informa os\
+        frames simulados por segundo e o tempo gasto em cada processador.
+
+Com `--render null` o frame não é desenhado (só a simulação é medida); com
+`--render recording` o relatório traz as chamadas de desenho por tipo.
+
+Uso:
+    python -m src.headless --frames 3600 --seed 42 [--render null] [--json rel.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+
+import pygame
+
+from src.core.input import STRAFE_SCRIPT, ScriptedInput
+from src.core.profiler import FrameProfiler
+from src.core.query import queries
+from src.core.render import BACKENDS, RecordingBackend, create_backend
+from src.core.scene import SceneManager
+from src.core.text import fonts
+from src.scenes.game import GameScene
+from src.settings import FPS, RENDER_BACKEND, WINDOW_HEIGHT, WINDOW_WIDTH
+
+
+@dataclass
+class HeadlessReport:
+    """Resultado de uma execução headless."""
+
+    frames: int
+    dt: float
+    seed: int
+    wall_time: float  # Segundos reais gastos no loop
+    renderer: str = RENDER_BACKEND
+    matches: list[str] = field(default_factory=list)  # Cena final de cada partida
+    processor_ms: dict[str, float] = field(default_factory=dict)  # Total por etapa
+    draw_calls: dict[str, int] = field(default_factory=dict)  # Só com "recording"
+
+    @property
+    def sim_fps(self) -> float:
+        """Frames simulados por segundo real."""
+        return self.frames / self.wall_time if self.wall_time > 0 else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"frames: {self.frames}  dt: {self.dt:.4f}s  seed: {self.seed}  "
+            f"render: {self.renderer}",
+            f"tempo real: {self.wall_time:.3f}s  FPS simulado: {self.sim_fps:.1f}",
+            f"partidas encerradas: {len(self.matches)} {self.matches}",
+            f"{'etapa':<24}{'total (ms)':>12}{'ms/frame':>10}",
+        ]
+        for name, total in sorted(self.processor_ms.items(), key=lambda i: -i[1]):
+            lines.append(f"{name:<24}{total:>12.1f}{total / self.frames:>10.3f}")
+        if self.draw_calls:
+            calls = "  ".join(f"{op}: {n}" for op, n in sorted(self.draw_calls.items()))
+            lines.append(f"chamadas de desenho: {calls}")
+        return "\n".join(lines)
+
+
+def setup_headless_display():
+    """Inicializa o pygame com drivers dummy (sem janela nem áudio) e as consultas."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    queries.install()
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    fonts.load_all()
+
+
+def run_headless(
+    frames: int = 3600,
+    dt: float = 1.0 / FPS,
+    seed: int = 0,
+    script: list | None = None,
+    renderer: str = RENDER_BACKEND,
+) -> HeadlessReport:
+    """
+    Simula `frames` frames da GameScene com passo fixo.
+
+    Quando uma partida termina (GameOver/Vitória), uma nova começa e a contagem
+    continua, então o custo de reinício também entra na medição.
+
+    Args:
+        frames (int): Quantidade de frames simulados.
+        dt (float): Passo fixo em segundos.
+        seed (int): Semente dos RNGs de mundo (padrões de tiro do inimigo).
+        script (list | None): Roteiro do ScriptedInput (padrão: STRAFE_SCRIPT).
+        renderer (str): Backend de render (ver src/core/render.py).
+
+    Returns:
+        HeadlessReport: Métricas da execução.
+    """
+    setup_headless_display()
+    random.seed(seed)
+
+    backend = create_backend(renderer)
+    profiler = FrameProfiler()
+    manager = SceneManager(backend, profiler)
+    report = HeadlessReport(
+        frames=frames, dt=dt, seed=seed, wall_time=0.0, renderer=renderer
+    )
+
+    def new_match() -> GameScene:
+        # Cada partida tem seu RNG de mundo, derivado da semente da execução
+        scene = GameScene(
+            manager,
+            ScriptedInput(script or STRAFE_SCRIPT),
+            seed=seed + len(report.matches),
+        )
+        if scene.debug_overlay is not None:
+            scene.debug_overlay.visible = False  # Não mede o custo do painel
+        manager.switch_to(scene)
+        return scene
+
+    scene = new_match()
+    start = time.perf_counter()
+    for _ in range(frames):
+        if manager.current_scene is not scene:
+            report.matches.append(type(manager.current_scene).__name__)
+            scene = new_match()
+        manager.run(dt)
+    report.wall_time = time.perf_counter() - start
+
+    report.processor_ms = dict(profiler.totals)
+    if isinstance(backend, RecordingBackend):
+        report.draw_calls = dict(backend.totals)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação headless da GameScene")
+    parser.add_argument("--frames", type=int, default=3600)
+    parser.add_argument("--dt", type=float, default=1.0 / FPS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--render", choices=BACKENDS, default=RENDER_BACKEND)
+    parser.add_argument("--json", help="Salva o relatório em JSON neste caminho")
+    args = parser.parse_args()
+
+    report = run_headless(
+        frames=args.frames, dt=args.dt, seed=args.seed, renderer=args.render
+    )
+    print(report.format())
+
+    if args.json:
+        data = asdict(report)
+        data["sim_fps"] = report.sim_fps
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
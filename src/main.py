@@ -2,27 +2,45 @@ import asyncio
 
 import pygame
 
+from src.core.profiler import FrameProfiler
+from src.core.query import queries
 from src.core.scene import SceneManager
+from src.core.text import fonts
+from src.core.timestep import FixedTimestep
 from src.scenes.menu import MenuScene
-from src.settings import FPS, TITLE, WINDOW_HEIGHT, WINDOW_WIDTH
+from src.settings import (
+    DEBUG_MODE,
+    FPS,
+    MAX_CATCHUP_STEPS,
+    SIM_HZ,
+    TITLE,
+    WINDOW_HEIGHT,
+    WINDOW_WIDTH,
+)
 
 
 async def main():
     # 1. Setup Inicial
+    queries.install()  # Ganchos das consultas no esper, antes de qualquer mundo
     pygame.init()
     pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption(TITLE)
     clock = pygame.time.Clock()
+    fonts.load_all()  # Resolve as fontes do sistema uma única vez
 
     # 2. Inicializa Gerenciador e Cena Inicial
     # (Importante: Display já existe aqui, então SceneManager não vai dar erro)
-    manager = SceneManager()
+    # Em DEBUG_MODE o manager cronometra cada frame exibido (overlay F3)
+    manager = SceneManager(profiler=FrameProfiler() if DEBUG_MODE else None)
     manager.switch_to(MenuScene)
 
+    # Simulação em passo fixo: física/colisão não dependem do dt do sistema
+    timestep = FixedTimestep(1.0 / SIM_HZ, MAX_CATCHUP_STEPS)
+
     running = True
     while running:
-        # Calcular Delta Time em segundos (essencial para física estável)
-        dt = clock.tick(FPS) / 1000.0
+        # Tempo real do frame em segundos (alimenta o acumulador)
+        frame_dt = clock.tick(FPS) / 1000.0
 
         # 3. Processamento de Eventos
         for event in pygame.event.get():
@@ -31,12 +49,14 @@ async def main():
             # Delega inputs (cliques, teclas) para a cena ativa
             manager.process_input(event)
 
-        # 4. Update e Draw
+        # 4. Update (N passos fixos) e Draw (interpolado)
         # O manager chama update(dt) na cena atual e draw() em todas (pilha)
-        manager.run(dt)
+        for _ in range(timestep.advance(frame_dt)):
+            manager.update(timestep.step)
+        manager.draw(timestep.alpha)
 
-        # 5. Flip e Controle de Async (Web)
-        pygame.display.flip()
+        # 5. Flip (ou só as áreas alteradas no modo dirty-rect) e Async (Web)
+        manager.renderer.present(manager.dirty_rects)
         await asyncio.sleep(0)
 
     pygame.quit()
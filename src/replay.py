@@ -0,0 +1,196 @@
+"""
+Gravação e reprodução acelerada de replays (ver src/core/replay.py).
+
+`play` refaz a partida headless o mais rápido que a CPU permite (sem desenhar, por\
+    padrão), confere os checksums gravados e lista os frames mais lentos. Como a\
+        simulação é determinística, dá para pular direto ao trecho de um pico de\
+            frame (`--render-from`/`--until`) e medir só ele, em vez de jogar de novo.
+
+`record` grava uma partida com o roteiro de teclas do headless (útil para CI).
+
+Uso:
+    python -m src.replay play replays/partida.ssrp [--render] [--render-from 9000]
+    python -m src.replay record saida.ssrp --frames 3600 --seed 42
+"""
+
+import argparse
+import heapq
+import time
+from dataclasses import dataclass, field
+
+from src.core.input import STRAFE_SCRIPT, ScriptedInput
+from src.core.replay import Replay, ReplayInput, ReplayRecorder
+from src.core.scene import SceneManager
+from src.headless import setup_headless_display
+from src.scenes.game import GameScene
+from src.settings import FPS, REPLAY_CHECKSUM_INTERVAL
+
+
+@dataclass
+class PlaybackReport:
+    """Resultado da reprodução de um replay."""
+
+    frames: int  # Frames reproduzidos
+    recorded_frames: int
+    wall_time: float  # Segundos reais gastos no loop
+    checksums_ok: int = 0
+    # Primeiro frame em que o estado divergiu: (frame, esperado, obtido)
+    divergence: tuple[int, int, int] | None = None
+    slowest: list[tuple[float, int]] = field(default_factory=list)  # (ms, frame)
+
+    @property
+    def speedup(self) -> float:
+        """Quantas vezes mais rápido que o tempo real (a 1/FPS por frame)."""
+        game_time = self.frames / FPS
+        return game_time / self.wall_time if self.wall_time > 0 else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"frames: {self.frames}/{self.recorded_frames}  "
+            f"tempo real: {self.wall_time:.3f}s  ({self.speedup:.1f}x tempo de jogo)",
+        ]
+        if self.divergence is None:
+            lines.append(f"checksums: {self.checksums_ok} ok")
+        else:
+            frame, expected, got = self.divergence
+            lines.append(
+                f"DIVERGÊNCIA no frame {frame}: esperado {expected:08x}, "
+                f"obtido {got:08x} ({self.checksums_ok} ok antes)"
+            )
+        lines.append(f"{'frame':>8}{'ms':>10}")
+        for ms, frame in self.slowest:
+            lines.append(f"{frame:>8}{ms:>10.3f}")
+        return "\n".join(lines)
+
+
+def play_replay(
+    replay: Replay,
+    render: bool = False,
+    render_from: int | None = None,
+    until: int | None = None,
+    spikes: int = 10,
+) -> PlaybackReport:
+    """
+    Reproduz um replay headless e confere o estado nos frames com checksum.
+
+    Args:
+        replay (Replay): Partida gravada.
+        render (bool): Desenha todos os frames (mede também o custo do draw).
+        render_from (int | None): Desenha só a partir deste frame (avanço rápido
+            até lá sem render).
+        until (int | None): Para depois deste frame.
+        spikes (int): Quantos frames mais lentos listar.
+
+    Returns:
+        PlaybackReport: Divergência (se houver), tempos e frames mais lentos.
+    """
+    setup_headless_display()
+
+    manager = SceneManager()
+    # A reprodução grava de novo: os checksums saem do mesmo ponto do update
+    check = ReplayRecorder(replay.seed, replay.checksum_interval)
+    scene = GameScene(manager, ReplayInput(replay), seed=replay.seed, recorder=check)
+    if scene.debug_overlay is not None:
+        scene.debug_overlay.visible = False
+    manager.switch_to(scene)
+
+    if render:
+        render_from = 1
+    last = len(replay) if until is None else min(until, len(replay))
+    report = PlaybackReport(frames=0, recorded_frames=len(replay), wall_time=0.0)
+    expected_checksums = replay.checksums
+    frame_times: list[tuple[float, int]] = []
+    perf = time.perf_counter
+
+    start = perf()
+    for index in range(last):
+        frame = index + 1  # Frames contados a partir de 1, como nos checksums
+        frame_start = perf()
+        manager.update(replay.dts[index])
+        if render_from is not None and frame >= render_from:
+            manager.draw()
+        frame_times.append(((perf() - frame_start) * 1000, frame))
+
+        report.frames = frame
+        expected = expected_checksums.get(frame)
+        if expected is not None:
+            got = check.replay.checksums.get(frame)
+            if got != expected:
+                report.divergence = (frame, expected, -1 if got is None else got)
+                break
+            report.checksums_ok += 1
+        if manager.current_scene is not scene:
+            break  # Partida encerrou (GameOver/Vitória)
+    report.wall_time = perf() - start
+
+    report.slowest = heapq.nlargest(spikes, frame_times)
+    return report
+
+
+def record_scripted(frames: int, seed: int) -> Replay:
+    """
+    Grava uma partida com o roteiro de teclas do headless.
+
+    Args:
+        frames (int): Máximo de frames (para antes se a partida terminar).
+        seed (int): Semente do RNG do mundo.
+
+    Returns:
+        Replay: Partida gravada.
+    """
+    setup_headless_display()
+
+    manager = SceneManager()
+    recorder = ReplayRecorder(seed, REPLAY_CHECKSUM_INTERVAL)
+    scene = GameScene(
+        manager, ScriptedInput(STRAFE_SCRIPT), seed=seed, recorder=recorder
+    )
+    manager.switch_to(scene)
+
+    dt = 1.0 / FPS
+    for _ in range(frames):
+        manager.update(dt)
+        if manager.current_scene is not scene:
+            break
+    return recorder.replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gravação e reprodução de replays")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    play = sub.add_parser("play", help="Reproduz e confere um replay")
+    play.add_argument("path")
+    play.add_argument("--render", action="store_true", help="Desenha todos os frames")
+    play.add_argument("--render-from", type=int, help="Desenha a partir deste frame")
+    play.add_argument("--until", type=int, help="Para depois deste frame")
+    play.add_argument("--spikes", type=int, default=10, help="Frames lentos listados")
+
+    record = sub.add_parser("record", help="Grava uma partida roteirizada")
+    record.add_argument("path")
+    record.add_argument("--frames", type=int, default=3600)
+    record.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+    if args.command == "play":
+        report = play_replay(
+            Replay.load(args.path),
+            render=args.render,
+            render_from=args.render_from,
+            until=args.until,
+            spikes=args.spikes,
+        )
+        print(report.format())
+        if report.divergence is not None:
+            raise SystemExit(1)
+    else:
+        replay = record_scripted(args.frames, args.seed)
+        replay.save(args.path)
+        print(
+            f"{len(replay)} frames ({replay.duration:.1f}s de jogo), "
+            f"{len(replay.checksums)} checksums -> {args.path}"
+        )
+
+
+if __name__ == "__main__":
+    main()
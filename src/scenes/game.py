@@ -1,50 +1,100 @@
+import random
 import time
 
 import esper
 import pygame
 
+from src.core.commands import CommandBuffer
 from src.core.components import (
+    ALL_COMPONENTS,
+    EnemyAttack,
     EnemyTag,
     Gun,
     Health,
     Invincibility,
-    PlayerTag,
-    Projectile,
+    Score,
     Sprite,
     Transform,
     Velocity,
 )
+from src.core.input import InputSource, KeyboardInput
+from src.core.profiler import DebugOverlay
+from src.core.query import query
+from src.core.render import RenderBackend
+from src.core.replay import ReplayRecorder, world_checksum
+from src.core.resources import BOSS, PLAYER, world_resources
 from src.core.scene import Scene
 from src.core.systems import (
     AnimationProcessor,
     CollisionProcessor,
+    InterpolationProcessor,
+    LifetimeProcessor,
     MovementProcessor,
     RenderProcessor,
 )
+from src.core.text import render_text
+from src.core.worlds import destroy_world, new_world_name
 
 # Importamos as fábricas
 from src.entities import (
+    GAME_IMAGES,
     create_bg,
     create_enemy,
+    create_enemy_bullets,
     create_laser,
+    create_laser_pool,
     create_player,
+    enemy_volleys,
+    game_asset_steps,
     spawn_enemy_pattern,
 )
 from src.settings import (
     COLORS,
+    DEBUG_MODE,
+    DIRTY_RECT_RENDERING,
     ENEMY_SHOOT_COOLDOWN,
     PLAYER_SPEED,
+    REPLAY_CHECKSUM_INTERVAL,
+    REPLAY_DIR,
+    REPLAY_RECORDING,
+    SCENE_FADE_TIME,
     WINDOW_HEIGHT,
     WINDOW_WIDTH,
 )
+from src.utils import loader
 
 
 class GameScene(Scene):
-    def __init__(self, manager):
+    def __init__(
+        self,
+        manager,
+        input_source: InputSource | None = None,
+        seed: int | None = None,
+        recorder: ReplayRecorder | None = None,
+    ):
         super().__init__(manager)
 
-        # ID Único para evitar conflito de mundos
-        self.world_name = f"level_{time.time()}"
+        # Semente explícita: é ela que o replay guarda para refazer os golpes
+        self.seed = random.getrandbits(63) if seed is None else seed
+
+        # Gravação injetada (quem injeta salva) ou automática (REPLAY_RECORDING)
+        self.recorder = recorder
+        self._autosave_replay = recorder is None and REPLAY_RECORDING
+        if self._autosave_replay:
+            self.recorder = ReplayRecorder(self.seed, REPLAY_CHECKSUM_INTERVAL)
+        if self.recorder is not None and self.recorder.replay.seed != self.seed:
+            raise ValueError("A semente do replay difere da semente da partida")
+
+        # Teclado real por padrão; headless/replay injetam outra fonte
+        self.input = input_source or KeyboardInput()
+
+        # Instrumentação do manager (DEBUG_MODE no jogo, sempre no headless): é ele
+        # quem fecha cada frame exibido, independente de quantos updates houve
+        self.profiler = manager.profiler
+        self.debug_overlay: DebugOverlay | None = None
+
+        # ID Único para evitar conflito de mundos (destruído em on_destroy)
+        self.world_name = new_world_name("level")
         esper.switch_world(self.world_name)
 
         # Limpeza preventiva
@@ -53,35 +103,87 @@ class GameScene(Scene):
         except Exception:
             pass
 
-        self.camera = pygame.Vector2(0, 0)
+        # Singletons do mundo: acesso O(1) em vez de consultas por PlayerTag
+        self.resources = world_resources()
+        self.camera = self.resources.insert(pygame.Vector2(0, 0))
+        self.rng = self.resources.insert(random.Random(self.seed))
+        self.attack = self.resources.insert(EnemyAttack(ENEMY_SHOOT_COOLDOWN))
+        self.score = self.resources.insert(Score())
+        # Mudanças estruturais do frame, aplicadas juntas no fim do update
+        self.commands = self.resources.insert(CommandBuffer())
+
+        # Estado do modo dirty-rect (settings.DIRTY_RECT_RENDERING)
+        self._background: RenderBackend | None = None
+        self._drawn_rects: list[pygame.Rect] = []
+        self._full_redraw = True
         self._init_systems()
         self._init_level()
+        if self.profiler is not None:
+            self._init_profiling()
 
-        # Controle de Ataque do Inimigo
-        self.enemy_timer = 0.0
-        self.enemy_cooldown = ENEMY_SHOOT_COOLDOWN
-        self.current_pattern = 0
+    @classmethod
+    def preload(cls):
+        # Decode das imagens em thread; recortes/escalas/variantes no loop
+        return loader.preload(GAME_IMAGES, game_asset_steps())
 
     def _init_systems(self):
-        """Registra os processadores."""
+        """Registra os processadores e as consultas usadas pela cena."""
+        self._enemy_tags = query(EnemyTag)
+        self._enemy_bars = query(Transform, Sprite, Health, EnemyTag)
+
+        self.interpolation_processor = InterpolationProcessor()
         self.movement_processor = MovementProcessor()
         self.animation_processor = AnimationProcessor()
         self.collision_processor = CollisionProcessor()
-        self.render_processor = RenderProcessor(self.camera)
+        self.lifetime_processor = LifetimeProcessor()
+        self.render_processor = RenderProcessor(self.camera, self.display)
 
+        esper.add_processor(self.interpolation_processor)
         esper.add_processor(self.movement_processor)
         esper.add_processor(self.animation_processor)
         esper.add_processor(self.collision_processor)
+        esper.add_processor(self.lifetime_processor)
         esper.add_processor(self.render_processor)
 
+    def _init_profiling(self):
+        """Cronometra cada processador e as etapas de cena mais pesadas."""
+        for proc in (
+            self.interpolation_processor,
+            self.movement_processor,
+            self.animation_processor,
+            self.collision_processor,
+            self.lifetime_processor,
+            self.render_processor,
+        ):
+            self.profiler.instrument_processor(proc)
+
+        for step in ("_handle_auto_fire", "_check_victory"):
+            self.profiler.instrument_method(self, step)
+        self.profiler.instrument_method(self.commands, "flush")
+
+        if DEBUG_MODE:
+            self.debug_overlay = DebugOverlay(self.profiler, ALL_COMPONENTS)
+
     def _init_level(self):
         """Cria as entidades iniciais."""
+        # Pools primeiro: pré-alocam os projéteis antes da partida começar
+        self.laser_pool = create_laser_pool(self.world_name)
+        # Tiros do inimigo: slots do PatternEngine (recurso), não entidades
+        self.bullets = create_enemy_bullets(self.world_name)
+
         create_bg(self.world_name)
         create_player(self.world_name)
         create_enemy(self.world_name)
 
     def on_enter(self):
         esper.switch_world(self.world_name)
+        # Outra cena pode ter desenhado por cima: redesenha a tela inteira
+        self._full_redraw = True
+
+    def on_destroy(self):
+        # A partida acabou de vez: entidades, recursos e consultas do mundo saem
+        # da memória (senão cada reinício deixaria um mundo inteiro para trás)
+        destroy_world(self.world_name)
 
     def process_input(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
@@ -92,7 +194,10 @@ class GameScene(Scene):
             elif event.key == pygame.K_ESCAPE:
                 from src.scenes.menu import MenuScene
 
+                self._save_replay()
                 self.manager.switch_to(MenuScene)
+            elif event.key == pygame.K_F3 and self.debug_overlay:
+                self.debug_overlay.toggle()
 
         # Input contínuo de movimento é tratado no update para suavidade,
         # mas aqui podemos setar flags se quisermos.
@@ -100,26 +205,32 @@ class GameScene(Scene):
     def update(self, dt: float):
         esper.switch_world(self.world_name)
 
-        # Lógica de Tiro Inimigo
-        self.enemy_timer += dt
-        if self.enemy_timer >= self.enemy_cooldown:
-            self.enemy_timer = 0
+        # Estado anterior para a interpolação da renderização
+        self.interpolation_processor.process()
 
-            # Busca posição do inimigo
-            for ent, (trans, _) in esper.get_components(Transform, EnemyTag):
+        # Lógica de Tiro Inimigo
+        attack = self.attack
+        attack.timer += dt
+        if attack.timer >= attack.cooldown:
+            attack.timer = 0
+
+            # Posição do chefe direto pelo handle (None se já morreu)
+            boss = self.resources.components(BOSS, Transform)
+            if boss is not None:
+                trans = boss[0]
                 # Ajusta a posição para sair do centro/baixo do inimigo
                 cx = trans.x + 20
                 cy = trans.y + 50
 
-                spawn_enemy_pattern(self.world_name, cx, cy, self.current_pattern)
-                self.current_pattern = (self.current_pattern + 1) % 4
+                spawn_enemy_pattern(self.world_name, cx, cy, attack.pattern, self.rng)
+                attack.pattern = (attack.pattern + 1) % len(enemy_volleys())
 
         # 1. Inputs de Gameplay (Tiro e Movimento)
         self._handle_movement_input(dt)
         self._handle_auto_fire(dt)
 
-        # 2. Limpeza
-        self._cleanup_projectiles()
+        # 2. Limpeza: projéteis fora da tela ou velhos demais, em lote
+        self.lifetime_processor.process(dt)
 
         # 3. ECS Process
         self.movement_processor.process(dt)
@@ -127,19 +238,29 @@ class GameScene(Scene):
         self.animation_processor.process(dt)
         self.collision_processor.process(dt)
 
+        # Ponto de sincronização: spawns/despawns do frame entram no mundo
+        self.commands.flush()
+
+        if self.recorder is not None and self.recorder.wants_checksum():
+            self.recorder.record_checksum(world_checksum())
+
         # 4. Checagem de Estados
         self._check_game_over()
         self._check_victory()
 
     def _handle_movement_input(self, dt):
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
+        self.input.advance()
+        if self.recorder is not None:
+            self.recorder.record_frame(dt, keys)
 
         # Movimento
         dx = (keys[pygame.K_d] - keys[pygame.K_a]) * PLAYER_SPEED
         dy = (keys[pygame.K_s] - keys[pygame.K_w]) * PLAYER_SPEED
 
-        for ent, (vel, _) in esper.get_components(Velocity, PlayerTag):
-            vel.x, vel.y = dx, dy
+        player = self.resources.components(PLAYER, Velocity)
+        if player is not None:
+            player[0].x, player[0].y = dx, dy
 
     def _handle_auto_fire(self, dt: float):
         """Gerencia o tiro automático com delay inicial
@@ -147,87 +268,137 @@ class GameScene(Scene):
         Args:
             dt (float): date time
         """
-        for ent, (gun, trans, sprite, inv, _) in esper.get_components(
-            Gun, Transform, Sprite, Invincibility, PlayerTag
-        ):  # type: ignore
-            # REGRA 1: Se estiver invencível (tomou dano), não atira
-            if inv.is_active:
-                continue
-
-            # REGRA 2: Delay Inicial (os 2 segundos antes de começar)
-            if gun.start_delay > 0:
-                gun.start_delay -= dt
-                continue  # Ainda não pode atirar
-
-            # REGRA 3: Cooldown padrão (Tiro automático)
-            if gun.timer > 0:
-                gun.timer -= dt
-            else:
-                create_laser(self.world_name, trans, sprite)
-                gun.timer = gun.cooldown
-
-    def _cleanup_projectiles(self):
-        # Limpa tiros do player fora da tela
-        for ent, (trans, _) in esper.get_components(Transform, Projectile):
-            if trans.y < -50:
-                esper.delete_entity(ent)
-
-        # Limpa tiros do inimigo fora da tela
-        for ent, (trans, _) in esper.get_components(Transform, EnemyTag):
-            if (
-                trans.y > WINDOW_HEIGHT + 50
-                or trans.x < -50
-                or trans.x > WINDOW_WIDTH + 50
-            ):
-                esper.delete_entity(ent)
+        player = self.resources.components(
+            PLAYER, Gun, Transform, Sprite, Invincibility
+        )
+        if player is None:
+            return
+        gun, trans, sprite, inv = player
+
+        # REGRA 1: Se estiver invencível (tomou dano), não atira
+        if inv.is_active:
+            return
+
+        # REGRA 2: Delay Inicial (os 2 segundos antes de começar)
+        if gun.start_delay > 0:
+            gun.start_delay -= dt
+            return  # Ainda não pode atirar
+
+        # REGRA 3: Cooldown padrão (Tiro automático)
+        if gun.timer > 0:
+            gun.timer -= dt
+        else:
+            create_laser(self.world_name, trans, sprite, self.laser_pool, self.commands)
+            gun.timer = gun.cooldown
 
     def _constrain_player(self):
-        for ent, (trans, sprite, _) in esper.get_components(
-            Transform, Sprite, PlayerTag
-        ):
-            w, h = sprite.width, sprite.height
-            if trans.x < 0:
-                trans.x = 0
-            elif trans.x > WINDOW_WIDTH - w:
-                trans.x = WINDOW_WIDTH - w
-            if trans.y < 0:
-                trans.y = 0
-            elif trans.y > WINDOW_HEIGHT - h:
-                trans.y = WINDOW_HEIGHT - h
+        player = self.resources.components(PLAYER, Transform, Sprite)
+        if player is None:
+            return
+        trans, sprite = player
+        w, h = sprite.width, sprite.height
+        if trans.x < 0:
+            trans.x = 0
+        elif trans.x > WINDOW_WIDTH - w:
+            trans.x = WINDOW_WIDTH - w
+        if trans.y < 0:
+            trans.y = 0
+        elif trans.y > WINDOW_HEIGHT - h:
+            trans.y = WINDOW_HEIGHT - h
 
     def _check_game_over(self):
-        for ent, (hp, _) in esper.get_components(Health, PlayerTag):
-            if hp.current <= 0:
-                from src.scenes.game_over import GameOverScene
+        player = self.resources.components(PLAYER, Health)
+        if player is not None and player[0].current <= 0:
+            from src.scenes.game_over import GameOverScene
 
-                self.manager.switch_to(GameOverScene)
+            self._save_replay()
+            self.manager.switch_to(GameOverScene, fade=SCENE_FADE_TIME)
 
     def _check_victory(self):
-        # Coleta entidades marcadas como inimigo de forma segura
-        enemies_alive = [ent for ent, _ in esper.get_component(EnemyTag)]
-
-        # Filtra apenas entidades que ainda existem (evita 'fantasmas')
-        enemies_alive = [e for e in enemies_alive if esper.entity_exists(e)]
-
-        if len(enemies_alive) == 0:
+        # A consulta já exclui entidades deletadas (sem 'fantasmas')
+        if len(self._enemy_tags) == 0:
             from src.scenes.victory import VictoryScene
 
-            self.manager.switch_to(VictoryScene)
+            self._save_replay()
+            self.manager.switch_to(VictoryScene, fade=SCENE_FADE_TIME)
+
+    def _save_replay(self):
+        """Grava a partida encerrada em REPLAY_DIR (se a gravação estiver ligada)."""
+        if not self._autosave_replay or self.recorder.frames == 0:
+            return
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.recorder.replay.save(REPLAY_DIR / f"{stamp}_{self.seed}.ssrp")
+        self._autosave_replay = False
 
     def draw(self):
+        if DIRTY_RECT_RENDERING:
+            self._draw_dirty()
+            return
+
         self.display.fill(COLORS["background"])
 
-        ctx = {"camera": (self.camera.x, self.camera.y)}
+        ctx = {"camera": (self.camera.x, self.camera.y), "alpha": self.manager.alpha}
         self.render_processor.process(context=ctx)
 
         self._draw_enemy_hp()
         self._draw_ui()
 
-    def _draw_enemy_hp(self):
+        if self.debug_overlay is not None:
+            self.debug_overlay.draw(self.display)
+
+    def _static_background(self) -> pygame.Surface | None:
+        """Fundo pré-composto: cor de fundo + camada 0 (feito uma vez)."""
+        if self._background is None:
+            bg = self.display.offscreen()
+            bg.fill(COLORS["background"])
+            ctx = {
+                "camera": (self.camera.x, self.camera.y),
+                "target": bg,
+                "max_layer": 0,
+            }
+            self.render_processor.process(context=ctx)
+            self._background = bg
+        return self._background.surface
+
+    def _draw_dirty(self):
+        """
+        Modo dirty-rect: restaura do fundo só as áreas desenhadas no frame
+        anterior, desenha por cima e publica a lista de áreas alteradas.
+        """
+        background = self._static_background()
+
+        if self._full_redraw:
+            self.display.blit(background, (0, 0))
+            previous = [self.display.get_rect()]
+            self._full_redraw = False
+        else:
+            previous = self._drawn_rects
+            self.display.blits(
+                [(background, rect, rect) for rect in previous], doreturn=False
+            )
+
+        ctx = {
+            "camera": (self.camera.x, self.camera.y),
+            "alpha": self.manager.alpha,
+            "min_layer": 1,  # Camada 0 já está no fundo pré-composto
+            "collect_rects": True,
+        }
+        drawn = self.render_processor.process(context=ctx)
+        drawn.extend(self._draw_enemy_hp())
+        drawn.extend(self._draw_ui())
+        if self.debug_overlay is not None:
+            overlay_rect = self.debug_overlay.draw(self.display)
+            if overlay_rect is not None:
+                drawn.append(overlay_rect)
+
+        # Áreas antigas (apagadas) + novas (desenhadas) vão para display.update
+        self._drawn_rects = drawn
+        self.dirty_rects = previous + drawn
+
+    def _draw_enemy_hp(self) -> list[pygame.Rect]:
         """Desenha uma barra de vida pequena sobre cada inimigo."""
-        for ent, (trans, sprite, health, _) in esper.get_components(
-            Transform, Sprite, Health, EnemyTag
-        ):
+        drawn = []
+        for ent, (trans, sprite, health, _) in self._enemy_bars.get():
             # Configuração da Barrinha
             w = sprite.width
             h = 5
@@ -236,22 +407,20 @@ class GameScene(Scene):
 
             # Fundo Vermelho Escuro
             bg_rect = pygame.Rect(x, y, w, h)
-            pygame.draw.rect(self.display, (50, 0, 0), bg_rect)
+            drawn.append(self.display.draw_rect((50, 0, 0), bg_rect))
 
             # Frente Vermelho Claro
             pct = health.get_percentage()
             fill_rect = pygame.Rect(x, y, int(w * pct), h)
-            pygame.draw.rect(self.display, (255, 0, 0), fill_rect)
+            self.display.draw_rect((255, 0, 0), fill_rect)
+        return drawn
 
-    def _draw_ui(self):
+    def _draw_ui(self) -> list[pygame.Rect]:
         # 1. Busca os dados de vida do Player
-        player_health = None
-        for ent, (health, tag) in esper.get_components(Health, PlayerTag):
-            player_health = health
-            break
-
-        if not player_health:
-            return
+        player = self.resources.components(PLAYER, Health)
+        if player is None:
+            return []
+        player_health = player[0]
 
         # 2. Configurações da Barra
         bar_width = 200
@@ -261,20 +430,23 @@ class GameScene(Scene):
 
         # 3. Desenho Matemático
         bg_rect = pygame.Rect(x, y, bar_width, bar_height)
-        pygame.draw.rect(self.display, COLORS["ui_bg"], bg_rect)
+        self.display.draw_rect(COLORS["ui_bg"], bg_rect)
+        drawn = [bg_rect]
 
         fill_width = int(bar_width * player_health.get_percentage())
         fill_rect = pygame.Rect(x, y, fill_width, bar_height)
-        pygame.draw.rect(self.display, COLORS["ui_fill"], fill_rect)
+        self.display.draw_rect(COLORS["ui_fill"], fill_rect)
 
-        pygame.draw.rect(self.display, COLORS["ui_border"], bg_rect, width=3)
+        self.display.draw_rect(COLORS["ui_border"], bg_rect, width=3)
 
         # 4. Texto
+        # Só re-renderiza quando o valor muda (o texto é a chave do cache)
         if pygame.font.get_init():
-            f = pygame.font.SysFont("arial", 14, bold=True)
-            txt = f.render(
+            txt = render_text(
+                "hud",
                 f"HP: {player_health.current}/{player_health.maximum}",
-                True,
                 COLORS["text"],
             )
             self.display.blit(txt, (x + 10, y + 2))
+
+        return drawn
@@ -1,22 +1,21 @@
 import pygame
 
 from src.core.scene import Scene, SceneManager
-from src.settings import COLORS, WINDOW_HEIGHT, WINDOW_WIDTH
+from src.core.text import render_text
+from src.settings import COLORS, SCENE_FADE_TIME, WINDOW_HEIGHT, WINDOW_WIDTH
 
 
 class GameOverScene(Scene):
     def __init__(self, manager: SceneManager):
         super().__init__(manager)
-        self.font_big = pygame.font.SysFont("arial", 80, bold=True)
-        self.font_small = pygame.font.SysFont("arial", 30)
 
     def process_input(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
             # ENTER: Reinicia o jogo
-            if event.key == pygame.K_RETURN:
+            if event.key == pygame.K_RETURN and self.manager.pending_scene is None:
                 from src.scenes.game import GameScene
 
-                self.manager.switch_to(GameScene)
+                self.manager.switch_when_ready(GameScene, fade=SCENE_FADE_TIME)
 
             # ESC: Volta ao Menu
             elif event.key == pygame.K_ESCAPE:
@@ -32,20 +31,18 @@ class GameOverScene(Scene):
         self.display.fill((20, 0, 0))
 
         # Texto GAME OVER
-        text_go = self.font_big.render("GAME OVER", True, (255, 50, 50))
+        text_go = render_text("title_game_over", "GAME OVER", (255, 50, 50))
         rect_go = text_go.get_rect(center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2 - 50))
 
         # Opções
-        text_restart = self.font_small.render(
-            "Pressione ENTER para Tentar Novamente", True, COLORS["text"]
+        text_restart = render_text(
+            "option", "Pressione ENTER para Tentar Novamente", COLORS["text"]
         )
         rect_restart = text_restart.get_rect(
             center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2 + 50)
         )
 
-        text_menu = self.font_small.render(
-            "ESC para Menu Principal", True, (150, 150, 150)
-        )
+        text_menu = render_text("option", "ESC para Menu Principal", (150, 150, 150))
         rect_menu = text_menu.get_rect(
             center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2 + 90)
         )
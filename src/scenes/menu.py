@@ -1,36 +1,56 @@
 import pygame
 
-from src.core.scene import Scene, SceneManager
-from src.settings import COLORS, WINDOW_HEIGHT, WINDOW_WIDTH
+from src.core.scene import Preparation, Scene, SceneManager
+from src.core.text import render_text
+from src.settings import (
+    COLORS,
+    PRELOAD_FRAME_BUDGET,
+    SCENE_FADE_TIME,
+    WINDOW_HEIGHT,
+    WINDOW_WIDTH,
+)
 
 
 class MenuScene(Scene):
     def __init__(self, manager: SceneManager):
         super().__init__(manager)
-        self.title_font = pygame.font.SysFont("arial", 50, bold=True)
-        self.font = pygame.font.SysFont("arial", 24)
         self.blink_timer = 1
+        self._preload: Preparation | None = None
+
+    def on_enter(self):
+        from src.scenes.game import GameScene
+
+        # Adianta a partida: as imagens decodificam em thread enquanto o menu
+        # está na tela, e o ENTER encontra tudo (ou quase tudo) pronto
+        self._preload = GameScene.preload()
 
     def process_input(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_RETURN:
+            if event.key == pygame.K_RETURN and self.manager.pending_scene is None:
                 from src.scenes.game import GameScene
 
-                self.manager.switch_to(GameScene)
+                self.manager.switch_when_ready(GameScene, fade=SCENE_FADE_TIME)
 
     def update(self, dt: float):
         self.blink_timer += dt * 3
 
+    def on_frame(self):
+        # Uma fatia do preload por frame exibido, não por passo de simulação
+        if self._preload is not None and self._preload.poll(PRELOAD_FRAME_BUDGET):
+            self._preload = None
+
     def draw(self):
         self.display.fill(COLORS["background"])
 
         # Título
-        title = self.title_font.render("SHOOTER PYTHON", True, COLORS["ui_border"])
+        title = render_text("title", "SHOOTER PYTHON", COLORS["ui_border"])
         title_rect = title.get_rect(center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 3))
         self.display.blit(title, title_rect)
 
         # Texto Piscante
         if int(self.blink_timer) % 2 == 0:
-            msg = self.font.render("Pressione ENTER para Iniciar", True, COLORS["text"])
+            msg = render_text(
+                "option_menu", "Pressione ENTER para Iniciar", COLORS["text"]
+            )
             msg_rect = msg.get_rect(center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2))
             self.display.blit(msg, msg_rect)
@@ -1,14 +1,16 @@
 import pygame
 
 from src.core.scene import Scene, SceneManager
+from src.core.text import render_text
 from src.settings import COLORS, WINDOW_HEIGHT, WINDOW_WIDTH
 
 
 class PauseScene(Scene):
+    # Texto e overlay fixos sobre o jogo congelado: composto uma vez só
+    static = True
+
     def __init__(self, manager: SceneManager):
         super().__init__(manager)
-        self.font_title = pygame.font.SysFont("arial", 60, bold=True)
-        self.font_option = pygame.font.SysFont("arial", 30)
 
         # Cria uma superfície preta semi-transparente para o overlay
         self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
@@ -33,17 +35,17 @@ class PauseScene(Scene):
         self.display.blit(self.overlay, (0, 0))
 
         # 2. Textos Centralizados
-        text_paused = self.font_title.render("JOGO PAUSADO", True, COLORS["ui_border"])
+        text_paused = render_text("title_pause", "JOGO PAUSADO", COLORS["ui_border"])
         rect_paused = text_paused.get_rect(
             center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2 - 50)
         )
 
-        text_resume = self.font_option.render("ENTER: Continuar", True, COLORS["text"])
+        text_resume = render_text("option", "ENTER: Continuar", COLORS["text"])
         rect_resume = text_resume.get_rect(
             center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2 + 20)
         )
 
-        text_menu = self.font_option.render("ESC: Menu Principal", True, COLORS["text"])
+        text_menu = render_text("option", "ESC: Menu Principal", COLORS["text"])
         rect_menu = text_menu.get_rect(
             center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2 + 60)
         )
@@ -8,12 +8,45 @@ IMAGES_DIR = ASSETS_DIR / "images"
 SOUNDS_DIR = ASSETS_DIR / "sounds"
 FONTS_DIR = ASSETS_DIR / "fonts"
 
+# Limite de memória de pixels do cache de assets (bytes)
+ASSET_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Atlas de sprites: lado (px) de cada página e espaço entre regiões
+ATLAS_PAGE_SIZE = 512
+ATLAS_PADDING = 1
+
+# Pré-carregamento: threads de decode e tempo máximo por frame (s) gasto na
+# thread principal preparando a próxima cena
+PRELOAD_WORKERS = 2
+PRELOAD_FRAME_BUDGET = 0.004
+
 # --- Configurações de Display ---
 WINDOW_WIDTH = 900
 WINDOW_HEIGHT = 600
 TITLE = "SPACE SHOOTER"
 FPS = 60
 
+# Backend de render (src/core/render.py): "batched", "immediate", "recording"
+# (grava as chamadas) ou "null" (sem desenho: servidores/benchmarks de lógica)
+RENDER_BACKEND = "batched"
+
+# Renderização dirty-rect: redesenha/publica só o que mudou (bom para render por
+# software). Desligado = tela inteira a cada frame
+DIRTY_RECT_RENDERING = False
+
+# Duração (s) do fade entre cenas (feito com o último quadro congelado)
+SCENE_FADE_TIME = 0.4
+
+# Variantes de renderização (src/core/variants.py)
+BLINK_ALPHA = 50  # Opacidade do player piscando na invencibilidade
+FLASH_COLOR = (255, 255, 255)  # Silhueta do flash de acerto
+TINT_COLOR = (255, 90, 90)  # Multiplicador RGB da variante "tint"
+HIT_FLASH_TIME = 0.06  # Duração (s) do flash quando o inimigo é atingido
+
+# Simulação em passo fixo (independente do FPS de renderização)
+SIM_HZ = 60  # Passos de simulação por segundo (ex: 30 em máquinas fracas)
+MAX_CATCHUP_STEPS = 5  # Máximo de passos para recuperar um travamento
+
 # --- Paleta de Cores (Modern Dark Theme) ---
 # Usar dicionário facilita a troca de temas depois
 COLORS = {
@@ -27,6 +60,20 @@ COLORS = {
     "ui_fill": "#00ffff",
 }
 
+# --- Fontes (nome lógico -> família, tamanho, negrito) ---
+# Resolvidas uma única vez no startup pelo FontRegistry
+FONTS = {
+    "hud": ("arial", 14, True),
+    "debug": ("consolas,monospace", 14, False),
+    "title": ("arial", 50, True),
+    "title_pause": ("arial", 60, True),
+    "title_game_over": ("arial", 80, True),
+    "option": ("arial", 30, False),
+    "option_menu": ("arial", 24, False),
+    "option_small": ("arial", 20, False),
+}
+TEXT_CACHE_SIZE = 256  # Máximo de textos renderizados mantidos em cache
+
 # GAMEPLAY
 PLAYER_SPEED = 500
 PLAYER_HP = 100
@@ -36,22 +83,40 @@ PLAYER_START_DELAY = 2.0
 
 LASER_SPEED = -600
 LASER_DAMAGE = 5
+LASER_SIZE = (4, 10)
 
 ENEMY_HP = 200
 ENEMY_SHOOT_COOLDOWN = 0.5
+ENEMY_BULLET_SIZE = (8, 8)
+ENEMY_BULLET_COLOR = "#ffff00"  # Amarelo
+ENEMY_BULLET_DAMAGE = 10
+
+# Pools de projéteis (capacidade inicial e política quando esgota)
+# "grow": aloca mais | "drop": ignora o disparo | "recycle": reusa o mais antigo
+# Os tiros do inimigo são slots do PatternEngine: mesmas políticas, sem entidades.
+# "recycle" apaga tiros ainda na tela (muda o jogo): só como opção explícita
+LASER_POOL_SIZE = 32
+LASER_POOL_POLICY = "grow"
+ENEMY_BULLET_POOL_SIZE = 512
+ENEMY_BULLET_POOL_POLICY = "grow"
 
-# Padrões de tipo do inimigo (velocidade min/max)
-# Padrão 0: Leque linear
-PATTERN_0_SPEED = (100, 250)
+# Tempo de vida dos projéteis (segundos) e margem fora da tela para despawn (px)
+LASER_MAX_AGE = 3.0
+ENEMY_BULLET_MAX_AGE = 10.0
+DESPAWN_MARGIN = 50
 
-# Padrão 1: Círculo Zig-Zag
-PATTERN_1_SPEED = (50, 150)
+# Lado da célula da grade de colisão (px); maior que os tiros mais comuns
+COLLISION_CELL_SIZE = 64
 
-# Padrão 2: Leque Ondulado
-PATTERN_2_SPEED = (180, 280)
+# Golpes do inimigo (ângulos, velocidades, tipo): dados em TOML, compilados
+# uma vez na carga (ver src/core/patterns.py)
+PATTERNS_FILE = ASSETS_DIR / "patterns.toml"
 
-# Padrão 3: Espiral
-PATTERN_3_SPEED = (80, 120)
+# Replay: grava semente, dt e teclas de cada partida em REPLAY_DIR (desligado no
+# navegador). Checksum do mundo a cada N frames valida a reprodução
+REPLAY_RECORDING = False
+REPLAY_DIR = BASE_DIR / "replays"
+REPLAY_CHECKSUM_INTERVAL = 60
 
 # --- Configurações de Debug ---
 DEBUG_MODE = True  # Mostra hitboxes, FPS, etc.
@@ -0,0 +1,278 @@
+"""
+Simulações em lote para balanceamento (varredura de parâmetros).
+
+Cada combinação de valores de `settings` x semente vira uma partida headless da\
+    GameScene, jogada pelo roteiro do headless ou pelo `DodgeBot`, até a vitória, a\
+        derrota ou o limite de frames. As partidas rodam em um pool de processos\
+            (um por núcleo) e os resultados vão, na ordem das execuções, para um JSON.
+
+Cada partida roda em um processo novo ("spawn", uma tarefa por processo): os\
+    valores são aplicados em `src.settings` antes de qualquer módulo do jogo ser\
+        importado, então os `from src.settings import X` enxergam o valor da\
+            execução e nada vaza de uma partida para outra. A mesma semente com os\
+                mesmos valores dá sempre o mesmo resultado (só os tempos variam).
+
+Uso:
+    python -m src.sweep --set ENEMY_HP=150,200,300 --set ENEMY_SHOOT_COOLDOWN=0.3,0.5 \\
+        --seeds 8 --player bot --out sweep.json
+
+Velocidades dos golpes ficam em TOML: para variá-las, aponte `PATTERNS_FILE` para
+arquivos alternativos (`--set "PATTERNS_FILE='golpes_rapidos.toml'"`).
+"""
+
+import argparse
+import ast
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src import settings
+
+PLAYERS = ("strafe", "bot")
+
+# Aplicados a toda execução (podem ser sobrescritos por --set)
+BASE_OVERRIDES = {"DEBUG_MODE": False, "REPLAY_RECORDING": False}
+
+
+@dataclass
+class RunSpec:
+    """Parâmetros de uma partida simulada."""
+
+    index: int
+    seed: int
+    overrides: dict[str, Any] = field(default_factory=dict)
+    player: str = "bot"
+    max_frames: int = 7200
+    dt: float = 1.0 / settings.FPS
+
+
+@dataclass
+class RunResult:
+    """Métricas de uma partida simulada."""
+
+    index: int
+    seed: int
+    overrides: dict[str, Any]
+    player: str
+    outcome: str  # "victory", "defeat" ou "timeout"
+    frames: int
+    time_to_kill: float | None  # Segundos de jogo até a vitória
+    damage_taken: int
+    boss_hp_left: int
+    score: int
+    frame_ms_mean: float
+    frame_ms_p95: float
+    frame_ms_max: float
+
+
+def run_simulation(spec: RunSpec) -> RunResult:
+    """
+    Joga uma partida headless com os valores de `spec.overrides`.
+
+    Deve rodar em um processo novo: os valores só têm efeito se aplicados antes
+    da importação dos módulos do jogo.
+
+    Args:
+        spec (RunSpec): Semente, valores de settings, jogador e limite de frames.
+
+    Returns:
+        RunResult: Resultado e custo por frame da partida.
+    """
+    for name, value in {**BASE_OVERRIDES, **spec.overrides}.items():
+        setattr(settings, name, value)
+
+    # Importados só agora, já com os settings da execução
+    from src.core.components import Health
+    from src.core.input import STRAFE_SCRIPT, DodgeBot, ScriptedInput
+    from src.core.profiler import percentile
+    from src.core.resources import BOSS, PLAYER
+    from src.core.scene import SceneManager
+    from src.headless import setup_headless_display
+    from src.scenes.game import GameScene
+    from src.scenes.victory import VictoryScene
+
+    setup_headless_display()
+    player_input = DodgeBot() if spec.player == "bot" else ScriptedInput(STRAFE_SCRIPT)
+    manager = SceneManager()
+    scene = GameScene(manager, player_input, seed=spec.seed)
+    manager.switch_to(scene)
+
+    # Referências aos componentes: continuam legíveis depois que a partida acaba
+    (player_hp,) = scene.resources.components(PLAYER, Health)
+    (boss_hp,) = scene.resources.components(BOSS, Health)
+
+    perf = time.perf_counter
+    frame_ms: list[float] = []
+    outcome = "timeout"
+    for _ in range(spec.max_frames):
+        start = perf()
+        manager.update(spec.dt)
+        frame_ms.append((perf() - start) * 1000)
+        if manager.current_scene is not scene:
+            victory = isinstance(manager.current_scene, VictoryScene)
+            outcome = "victory" if victory else "defeat"
+            break
+
+    frames = len(frame_ms)
+    return RunResult(
+        index=spec.index,
+        seed=spec.seed,
+        overrides=spec.overrides,
+        player=spec.player,
+        outcome=outcome,
+        frames=frames,
+        time_to_kill=frames * spec.dt if outcome == "victory" else None,
+        damage_taken=player_hp.maximum - max(player_hp.current, 0),
+        boss_hp_left=max(boss_hp.current, 0),
+        score=scene.score.points,
+        frame_ms_mean=sum(frame_ms) / frames if frames else 0.0,
+        frame_ms_p95=percentile(frame_ms, 95),
+        frame_ms_max=max(frame_ms, default=0.0),
+    )
+
+
+def build_specs(
+    grid: dict[str, list[Any]],
+    seeds: int,
+    base_seed: int = 0,
+    player: str = "bot",
+    max_frames: int = 7200,
+) -> list[RunSpec]:
+    """
+    Produto cartesiano dos valores x sementes.
+
+    Args:
+        grid (dict[str, list[Any]]): Nome do setting -> valores a testar.
+        seeds (int): Sementes por combinação (base_seed, base_seed + 1, ...).
+        base_seed (int): Primeira semente.
+        player (str): "bot" ou "strafe".
+        max_frames (int): Limite de frames por partida.
+
+    Returns:
+        list[RunSpec]: Uma execução por combinação e semente.
+    """
+    unknown = [name for name in grid if not hasattr(settings, name)]
+    if unknown:
+        raise ValueError(f"Settings desconhecidos: {', '.join(unknown)}")
+    if player not in PLAYERS:
+        raise ValueError(f"Jogador desconhecido: {player}")
+
+    names = list(grid)
+    specs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        overrides = dict(zip(names, values))
+        for seed in range(base_seed, base_seed + seeds):
+            specs.append(
+                RunSpec(len(specs), seed, overrides, player, max_frames=max_frames)
+            )
+    return specs
+
+
+def run_sweep(specs: list[RunSpec], workers: int | None = None) -> list[RunResult]:
+    """
+    Executa as partidas em paralelo, uma por processo novo.
+
+    Args:
+        specs (list[RunSpec]): Execuções (ver `build_specs`).
+        workers (int | None): Processos simultâneos (padrão: todos os núcleos).
+
+    Returns:
+        list[RunResult]: Resultados na mesma ordem de `specs`.
+    """
+    # Não repete o banner do pygame em cada processo
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as executor:
+        return list(executor.map(run_simulation, specs))
+
+
+def summarize(results: list[RunResult]) -> list[dict[str, Any]]:
+    """Agrega as sementes de cada combinação (taxa de vitória, médias)."""
+    groups: dict[str, list[RunResult]] = {}
+    for result in results:
+        key = json.dumps(result.overrides, sort_keys=True, default=str)
+        groups.setdefault(key, []).append(result)
+
+    summary = []
+    for runs in groups.values():
+        kills = [r.time_to_kill for r in runs if r.time_to_kill is not None]
+        summary.append(
+            {
+                "overrides": runs[0].overrides,
+                "runs": len(runs),
+                "win_rate": len(kills) / len(runs),
+                "time_to_kill_mean": sum(kills) / len(kills) if kills else None,
+                "damage_taken_mean": sum(r.damage_taken for r in runs) / len(runs),
+                "frame_ms_mean": sum(r.frame_ms_mean for r in runs) / len(runs),
+                "frame_ms_max": max(r.frame_ms_max for r in runs),
+            }
+        )
+    return summary
+
+
+def _parse_set(text: str) -> tuple[str, list[Any]]:
+    """ "NOME=v1,v2" -> ("NOME", [v1, v2]) (valores como literais Python)."""
+    name, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"Esperado NOME=v1,v2,...: {text}")
+    parsed = ast.literal_eval(f"[{values}]")
+    return name.strip(), parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulações em lote (balanceamento)")
+    parser.add_argument(
+        "--set",
+        dest="grid",
+        type=_parse_set,
+        action="append",
+        default=[],
+        metavar="NOME=v1,v2",
+        help="Setting e valores a testar (repetível)",
+    )
+    parser.add_argument("--seeds", type=int, default=4, help="Sementes por combinação")
+    parser.add_argument("--seed", type=int, default=0, help="Primeira semente")
+    parser.add_argument("--player", choices=PLAYERS, default="bot")
+    parser.add_argument("--frames", type=int, default=7200, help="Limite por partida")
+    parser.add_argument("--workers", type=int, help="Processos (padrão: núcleos)")
+    parser.add_argument("--out", default="sweep.json", help="Arquivo de resultados")
+    args = parser.parse_args()
+
+    specs = build_specs(
+        dict(args.grid), args.seeds, args.seed, args.player, args.frames
+    )
+    start = time.perf_counter()
+    results = run_sweep(specs, args.workers)
+    wall_time = time.perf_counter() - start
+
+    summary = summarize(results)
+    data = {
+        "wall_time": wall_time,
+        "summary": summary,
+        "runs": [asdict(result) for result in results],
+    }
+    Path(args.out).write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+
+    print(f"{len(results)} partidas em {wall_time:.1f}s -> {args.out}")
+    for row in summary:
+        ttk = row["time_to_kill_mean"]
+        ttk_text = "-" if ttk is None else f"{ttk:.1f}s"
+        print(
+            f"{json.dumps(row['overrides'], default=str)}: "
+            f"vitórias {row['win_rate']:.0%}  TTK {ttk_text}  "
+            f"dano {row['damage_taken_mean']:.0f}  "
+            f"frame {row['frame_ms_mean']:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,177 @@
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import pygame
 
-from src.settings import IMAGES_DIR
+from src.settings import ASSET_CACHE_MAX_BYTES, IMAGES_DIR, PRELOAD_WORKERS
 
+# No navegador (pygbag/WebAssembly) não há threads: o decode acontece no poll
+THREADS_AVAILABLE = sys.platform not in ("emscripten", "wasi")
 
-def load_spritesheet(
-    filename: str, frame_height: int, frame_width: int = 0, num_frames: int = 0
-) -> list[pygame.Surface]:
-    """
-    Carrega PNG e recorta em frames.
 
-    Modo 1: Passar frame_width (recorta baseado no tamanho).
-    Modo 2: Passar num_frames (calcula o tamanho baseado na quantidade).
+def decode_image(filename: str) -> pygame.Surface:
+    """
+    Lê e decodifica uma imagem de IMAGES_DIR, sem `convert` (que precisa do
+    display): seguro fora da thread principal.
     """
     path = IMAGES_DIR / filename
-
     if not path.exists():
         raise FileNotFoundError(f"Asset não encontrado: {path}")
+    return pygame.image.load(path)
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Memória de pixels própria da Surface (subsurfaces compartilham a do pai)."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+class AssetCache:
+    """
+    Cache de assets do processo inteiro (compartilhado entre cenas e reinícios).
+
+    Cada asset é decodificado, convertido e escalado uma única vez, indexado pelo
+    arquivo e pelos parâmetros de carga/escala. As mesmas Surfaces são devolvidas
+    em todas as chamadas: quem recebe não deve alterá-las. Quando a memória passa
+    de `max_bytes`, os assets menos usados recentemente (LRU) são descartados.
+    """
+
+    def __init__(self, max_bytes: int = ASSET_CACHE_MAX_BYTES):
+        """
+        Args:
+            max_bytes (int): Limite aproximado de memória de pixels do cache.
+        """
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        # Imagens já decodificadas fora (ver AssetLoader), à espera do `convert`
+        self._decoded: dict[str, pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
 
-    sheet = pygame.image.load(path).convert_alpha()
+    def stats(self) -> dict[str, int]:
+        """Contadores para debug/telemetria."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        """Descarta todos os assets (os contadores são mantidos)."""
+        self._entries.clear()
+        self._decoded.clear()
+        self.bytes_used = 0
+
+    def has_image(self, filename: str) -> bool:
+        """Se a imagem original já está no cache (convertida ou à espera)."""
+        return (
+            filename in self._decoded
+            or ("image", filename, True, None) in self._entries
+            or ("image", filename, False, None) in self._entries
+        )
+
+    def stage(self, filename: str, surface: pygame.Surface):
+        """Entrega um decode feito fora; o próximo `image()` só converte."""
+        if not self.has_image(filename):
+            self._decoded[filename] = surface
+
+    def _get(self, key: Hashable, loader: Callable[[], object], size: Callable):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        value = loader()
+        nbytes = size(value)
+        self._entries[key] = (value, nbytes)
+        self.bytes_used += nbytes
+
+        # Despejo LRU (nunca o asset que acabou de entrar)
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes_used -= evicted
+            self.evictions += 1
+
+        return value
+
+    def image(
+        self, filename: str, alpha: bool = True, size: tuple[int, int] | None = None
+    ) -> pygame.Surface:
+        """
+        Carrega (uma vez) uma imagem de IMAGES_DIR, convertida e opcionalmente
+        escalada.
+
+        Args:
+            filename (str): Nome do arquivo em IMAGES_DIR.
+            alpha (bool): Usa convert_alpha (True) ou convert (False).
+            size (tuple[int, int] | None): Tamanho final, se precisar escalar.
+
+        Returns:
+            pygame.Surface: Surface compartilhada (não alterar).
+        """
+        if size is not None:
+            # A versão escalada deriva da original (também cacheada)
+            return self._get(
+                ("image", filename, alpha, size),
+                lambda: pygame.transform.scale(self.image(filename, alpha), size),
+                _surface_bytes,
+            )
+
+        def load():
+            surf = self._decoded.pop(filename, None)
+            if surf is None:
+                surf = decode_image(filename)
+            return surf.convert_alpha() if alpha else surf.convert()
+
+        return self._get(("image", filename, alpha, None), load, _surface_bytes)
+
+    def frames(
+        self,
+        filename: str,
+        frame_height: int,
+        frame_width: int = 0,
+        num_frames: int = 0,
+        scale: int = 1,
+    ) -> list[pygame.Surface]:
+        """
+        Recorta (uma vez) uma spritesheet em frames, opcionalmente escalados.
+
+        Returns:
+            list[pygame.Surface]: Lista cacheada (não alterar).
+        """
+        key = ("frames", filename, frame_height, frame_width, num_frames, scale)
+        return self._get(
+            key,
+            lambda: _slice_frames(
+                self.image(filename), frame_height, frame_width, num_frames, scale
+            ),
+            lambda frames: sum(_surface_bytes(f) for f in frames),
+        )
+
+
+def _slice_frames(
+    sheet: pygame.Surface,
+    frame_height: int,
+    frame_width: int,
+    num_frames: int,
+    scale: int,
+) -> list[pygame.Surface]:
     sheet_width = sheet.get_width()
 
     # Lógica Inteligente: Calcula largura se num_frames foi passado
@@ -44,4 +198,151 @@ def load_spritesheet(
     if not frames:
         raise ValueError("Nenhum frame carregado.")
 
+    if scale != 1:
+        frames = [
+            pygame.transform.scale(f, (f.get_width() * scale, f.get_height() * scale))
+            for f in frames
+        ]
+
     return frames
+
+
+class Preload:
+    """
+    Pré-carregamento em andamento: decodes (em thread) e depois os passos que
+    precisam da thread principal (convert, recortes, escalas), um pouco por frame.
+    """
+
+    def __init__(
+        self,
+        loader: "AssetLoader",
+        decodes: dict[str, Future | None],
+        steps: list[Callable[[], object]],
+    ):
+        self._loader = loader
+        self._decodes = decodes  # None = sem threads, decodifica no poll
+        self._steps = steps
+        self._total = len(decodes) + len(steps)
+
+    @property
+    def ready(self) -> bool:
+        return not self._decodes and not self._steps
+
+    @property
+    def progress(self) -> float:
+        """Fração concluída (0..1)."""
+        pending = len(self._decodes) + len(self._steps)
+        return 1.0 - pending / self._total if self._total else 1.0
+
+    def poll(self, budget: float) -> bool:
+        """
+        Avança o pré-carregamento sem passar (muito) de `budget` segundos.
+
+        Args:
+            budget (float): Tempo máximo gasto neste frame (ao menos um passo).
+
+        Returns:
+            bool: True quando tudo está pronto no cache.
+        """
+        deadline = time.perf_counter() + budget
+        for filename, future in list(self._decodes.items()):
+            if future is None:
+                if time.perf_counter() >= deadline:
+                    return False
+                self._loader.finish(filename, None)
+            elif future.done():
+                self._loader.finish(filename, future)
+            else:
+                continue
+            del self._decodes[filename]
+        if self._decodes:
+            return False
+
+        # Passos da thread principal só depois dos decodes (usam o que foi lido)
+        while self._steps:
+            self._steps.pop(0)()
+            if time.perf_counter() >= deadline:
+                break
+        return self.ready
+
+
+class AssetLoader:
+    """
+    Decodifica imagens em threads enquanto o jogo segue rodando.
+
+    Só o decode (PNG -> pixels) sai da thread principal; `convert`, recortes e
+    escalas continuam no loop do jogo, feitos pelos passos de cada `Preload`.
+    """
+
+    def __init__(self, cache: AssetCache, workers: int = PRELOAD_WORKERS):
+        self.cache = cache
+        self.workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._inflight: dict[str, Future] = {}
+
+    def preload(
+        self, filenames: Iterable[str], steps: Iterable[Callable[[], object]] = ()
+    ) -> Preload:
+        """
+        Começa a decodificar `filenames` (os que ainda não estão no cache).
+
+        Args:
+            filenames (Iterable[str]): Imagens em IMAGES_DIR.
+            steps (Iterable[Callable]): Passos na thread principal depois dos
+                decodes (ex: as mesmas chamadas ao cache que as fábricas fazem).
+
+        Returns:
+            Preload: Handle a ser avançado com `poll` a cada frame.
+        """
+        if THREADS_AVAILABLE and self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.workers, thread_name_prefix="assets"
+            )
+
+        decodes: dict[str, Future | None] = {}
+        for filename in dict.fromkeys(filenames):
+            if self.cache.has_image(filename):
+                continue
+            future = self._inflight.get(filename)
+            if future is None and self._executor is not None:
+                future = self._executor.submit(decode_image, filename)
+                self._inflight[filename] = future
+            decodes[filename] = future
+        return Preload(self, decodes, list(steps))
+
+    def finish(self, filename: str, future: Future | None):
+        """Leva um decode concluído (ou feito agora, sem threads) para o cache."""
+        if future is None:
+            try:
+                surface = decode_image(filename)
+            except (FileNotFoundError, pygame.error):
+                return  # A fábrica cai no fallback ao pedir a imagem
+        else:
+            if self._inflight.get(filename) is future:
+                del self._inflight[filename]
+            if future.exception() is not None:
+                return
+            surface = future.result()
+        self.cache.stage(filename, surface)
+
+
+# Cache único do processo
+assets = AssetCache()
+loader = AssetLoader(assets)
+
+
+def load_spritesheet(
+    filename: str,
+    frame_height: int,
+    frame_width: int = 0,
+    num_frames: int = 0,
+    scale: int = 1,
+) -> list[pygame.Surface]:
+    """
+    Carrega PNG e recorta em frames (via cache: o arquivo só é lido uma vez).
+
+    Modo 1: Passar frame_width (recorta baseado no tamanho).
+    Modo 2: Passar num_frames (calcula o tamanho baseado na quantidade).
+    """
+    # Cópia rasa: a lista é do chamador, as Surfaces continuam compartilhadas
+    return list(assets.frames(filename, frame_height, frame_width, num_frames, scale))
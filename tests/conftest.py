@@ -0,0 +1,34 @@
+"""
+Fixtures compartilhadas: pygame sem janela (com as consultas instaladas) e um
+mundo esper novo por teste.
+"""
+
+import esper
+import pygame
+import pytest
+
+from src.core.worlds import destroy_world, new_world_name
+from src.headless import setup_headless_display
+
+
+@pytest.fixture(scope="session", autouse=True)
+def headless():
+    """Drivers dummy, tela e `queries.install()`, uma vez por sessão."""
+    setup_headless_display()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def world() -> str:
+    """Mundo esper ativo durante o teste, apagado (com recursos e consultas) depois."""
+    name = new_world_name("test")
+    esper.switch_world(name)
+    yield name
+    destroy_world(name)
+
+
+@pytest.fixture
+def surface() -> pygame.Surface:
+    """Imagem 8x8 para sprites de teste."""
+    return pygame.Surface((8, 8))
@@ -0,0 +1,82 @@
+import esper
+
+from src.core.commands import CommandBuffer
+from src.core.components import Health, Transform, Velocity
+from src.core.query import query
+
+
+def test_nothing_changes_before_flush(world):
+    commands = CommandBuffer()
+    ent = esper.create_entity(Transform(0, 0))
+    commands.spawn(Transform(1, 1))
+    commands.add(ent, Velocity())
+    commands.despawn(ent)
+
+    assert len(commands) == 3
+    assert len(query(Transform)) == 1
+    assert not esper.has_component(ent, Velocity)
+
+
+def test_ops_apply_in_order(world):
+    commands = CommandBuffer()
+    ent = esper.create_entity(Transform(0, 0))
+    commands.add(ent, Health(10, 10))
+    commands.remove(ent, Health)
+    commands.add(ent, Health(5, 10))
+
+    assert commands.flush() == 3
+    assert esper.component_for_entity(ent, Health).current == 5
+
+
+def test_spawns_keep_queue_order(world):
+    commands = CommandBuffer()
+    for x in range(3):
+        commands.spawn(Transform(x, 0))
+    commands.flush()
+
+    assert [trans.x for _, trans in query(Transform)] == [0, 1, 2]
+
+
+def test_despawns_run_last_and_once(world):
+    commands = CommandBuffer()
+    ent = esper.create_entity(Transform(0, 0))
+    commands.despawn(ent)
+    commands.despawn(ent)
+    commands.add(ent, Velocity())  # Enfileirado depois, aplicado antes
+
+    assert commands.flush() == 2
+    assert not esper.entity_exists(ent)
+    assert len(query(Velocity)) == 0
+
+
+def test_ops_on_missing_entities_are_skipped(world):
+    commands = CommandBuffer()
+    ent = esper.create_entity(Transform(0, 0))
+    esper.delete_entity(ent, immediate=True)
+    commands.add(ent, Velocity())
+    commands.remove(ent, Transform)
+    commands.despawn(ent)
+
+    commands.flush()
+    assert len(query(Velocity)) == 0
+
+
+def test_cancel_despawn(world):
+    commands = CommandBuffer()
+    ent = esper.create_entity(Transform(0, 0))
+    commands.despawn(ent)
+    commands.cancel_despawn(ent)
+
+    assert commands.flush() == 0
+    assert esper.entity_exists(ent)
+
+
+def test_flush_resets_the_queue(world):
+    commands = CommandBuffer()
+    commands.spawn(Transform(0, 0))
+    commands.flush()
+
+    assert len(commands) == 0
+    assert commands.applied_last_flush == 1
+    assert commands.flush() == 0
+    assert commands.applied_last_flush == 0
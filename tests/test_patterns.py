@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from src.core.patterns import PATTERN_KINDS, PatternEngine, exit_times
+
+BOUNDS = (-20.0, -20.0, 920.0, 620.0)
+DT = 1 / 240
+
+
+def _random_engine(seed: int, count: int, **kwargs) -> PatternEngine:
+    rng = np.random.default_rng(seed)
+    engine = PatternEngine(capacity=count, **kwargs)
+    for kind in rng.choice(list(PATTERN_KINDS), size=count):
+        engine.add(
+            str(kind),
+            float(rng.uniform(100, 800)),
+            float(rng.uniform(100, 500)),
+            float(rng.uniform(-np.pi, np.pi)),
+            float(rng.uniform(40, 300)),
+            frequency=float(rng.uniform(1, 8)),
+            amplitude=float(rng.uniform(0, 60)),
+        )
+    return engine
+
+
+def _exit_times(engine: PatternEngine) -> np.ndarray:
+    n = len(engine)
+    return exit_times(
+        engine.kind[:n],
+        engine.start_x[:n],
+        engine.start_y[:n],
+        engine.cos_a[:n],
+        engine.sin_a[:n],
+        engine.speed[:n],
+        engine.amplitude[:n],
+        BOUNDS,
+    )
+
+
+def _last_inside(engine: PatternEngine, duration: float) -> np.ndarray:
+    """Último instante (passo a passo) em que cada tiro esteve dentro de BOUNDS."""
+    min_x, min_y, max_x, max_y = BOUNDS
+    last = np.zeros(len(engine))
+    for _ in range(int(duration / DT)):
+        xs, ys = engine.step(DT)
+        inside = (xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)
+        last[inside] = engine.clock
+    return last
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_exit_times_never_early(seed):
+    engine = _random_engine(seed, 300)
+    exits = _exit_times(engine)
+    last = _last_inside(engine, 20.0)
+
+    # Nenhum tiro vence enquanto ainda está (ou vai voltar) para dentro
+    assert np.all(exits >= last - 1e-9)
+
+
+def test_linear_exit_times_are_tight():
+    engine = _random_engine(3, 200)
+    engine.kind[: len(engine)] = PATTERN_KINDS["linear"]
+    exits = _exit_times(engine)
+    last = _last_inside(engine, 20.0)
+
+    assert np.all(exits - last <= DT + 1e-9)
+
+
+def test_expire_matches_exit_times():
+    reference = _random_engine(4, 300)
+    engine = _random_engine(4, 300, bounds=BOUNDS, max_age=8.0)
+    due = np.minimum(_exit_times(reference), 8.0)
+
+    for _ in range(int(10.0 / DT)):
+        engine.step(DT)
+        engine.expire()
+        assert len(engine) == np.count_nonzero(due > engine.clock)
+    assert len(engine) == 0
+
+
+def test_remove_keeps_spawn_order():
+    engine = PatternEngine(capacity=8)
+    for x in range(6):
+        engine.add("linear", float(x), 0.0, 0.0, 0.0)
+    engine.remove([1, 4])
+
+    xs, _ = engine.positions()
+    assert xs.tolist() == [0.0, 2.0, 3.0, 5.0]
+
+
+@pytest.mark.parametrize(
+    ("policy", "capacity", "live", "dropped"),
+    [("grow", 8, 6, 0), ("drop", 4, 4, 2), ("recycle", 4, 4, 0)],
+)
+def test_full_policies(policy, capacity, live, dropped):
+    engine = PatternEngine(capacity=4, on_full=policy)
+    for x in range(6):
+        engine.add("linear", float(x), 0.0, 0.0, 0.0)
+
+    assert engine.capacity == capacity
+    assert len(engine) == live
+    assert engine.dropped == dropped
+    if policy == "recycle":
+        # Os mais antigos saem primeiro
+        assert engine.positions()[0].tolist() == [2.0, 3.0, 4.0, 5.0]
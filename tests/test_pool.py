@@ -0,0 +1,101 @@
+import esper
+import pytest
+
+from src.core.commands import CommandBuffer
+from src.core.components import Pooled, Transform, Velocity
+from src.core.pool import ProjectilePool, despawn
+from src.core.query import query
+
+
+def _pool(world: str, capacity: int, policy: str) -> ProjectilePool:
+    return ProjectilePool(
+        world, lambda: (Transform(0, 0), Velocity()), capacity, policy
+    )
+
+
+def test_preallocated_entities_are_inactive(world):
+    pool = _pool(world, 4, "drop")
+
+    assert pool.free_count == 4
+    assert pool.active_count == 0
+    assert len(query(Transform, Velocity)) == 0
+    assert len(query(Pooled)) == 4
+
+
+def test_acquire_and_release_reuse_the_same_components(world):
+    pool = _pool(world, 1, "drop")
+    ent, components = pool.acquire()
+    assert len(query(Transform, Velocity)) == 1
+
+    pool.release(ent)
+    pool.release(ent)  # Repetido: ignorado
+    assert len(query(Transform, Velocity)) == 0
+    assert pool.free_count == 1
+
+    again, reused = pool.acquire()
+    assert again == ent
+    assert all(a is b for a, b in zip(components, reused))
+
+
+def test_grow(world):
+    pool = _pool(world, 2, "grow")
+    acquired = [pool.acquire() for _ in range(5)]
+
+    assert None not in acquired
+    assert pool.capacity == 5
+    assert pool.active_count == 5
+    assert len(query(Transform, Velocity)) == 5
+
+
+def test_drop(world):
+    pool = _pool(world, 2, "drop")
+    acquired = [pool.acquire() for _ in range(3)]
+
+    assert acquired[2] is None
+    assert pool.dropped == 1
+    assert pool.capacity == 2
+    assert pool.acquire_many(4) == []
+
+
+def test_recycle_takes_the_oldest(world):
+    pool = _pool(world, 2, "recycle")
+    first, _ = pool.acquire()
+    second, _ = pool.acquire()
+
+    third, _ = pool.acquire()
+    assert third == first
+    assert pool.active_count == 2
+    # O próximo reciclado é o que agora ficou mais antigo
+    assert pool.acquire()[0] == second
+
+
+def test_recycle_cancels_a_pending_despawn(world):
+    pool = _pool(world, 1, "recycle")
+    commands = CommandBuffer()
+    ent, _ = pool.acquire(commands)
+    commands.flush()
+
+    commands.despawn(ent)
+    again, _ = pool.acquire(commands)
+    assert again == ent
+    assert not commands.is_pending_despawn(ent)
+    commands.flush()
+    assert len(query(Transform, Velocity)) == 1
+
+
+def test_despawn_returns_to_the_pool(world):
+    pool = _pool(world, 2, "drop")
+    ent, _ = pool.acquire()
+    plain = esper.create_entity(Transform(0, 0))
+
+    despawn(ent)
+    despawn(plain)
+
+    assert pool.free_count == 2
+    assert esper.entity_exists(ent)
+    assert not esper.entity_exists(plain)
+
+
+def test_unknown_policy(world):
+    with pytest.raises(ValueError):
+        _pool(world, 1, "explode")
@@ -0,0 +1,113 @@
+import esper
+import pytest
+
+from src.core.components import Health, Sprite, Transform, Velocity
+from src.core.query import QueryCache, add_components, queries, query
+
+
+def _expected(*types):
+    if len(types) == 1:
+        return dict(esper.get_component(types[0]))
+    return {ent: tuple(comps) for ent, comps in esper.get_components(*types)}
+
+
+def _as_dict(q):
+    return dict(q.get())
+
+
+def test_matches_esper_after_structural_changes(world):
+    movers = query(Transform, Velocity)
+    transforms = query(Transform)
+    assert movers.get() == []
+
+    a = esper.create_entity(Transform(0, 0), Velocity())
+    b = esper.create_entity(Transform(1, 1))
+    esper.add_component(b, Velocity(1, 0))
+    c = esper.create_entity(Transform(2, 2), Velocity())
+    esper.remove_component(a, Velocity)
+    esper.delete_entity(c, immediate=True)
+    add_components(a, (Velocity(2, 0), Health(1, 1)))
+
+    assert _as_dict(movers) == _expected(Transform, Velocity)
+    assert _as_dict(transforms) == _expected(Transform)
+    assert len(movers) == 2
+    assert set(_as_dict(movers)) == {a, b}
+
+
+def test_list_is_updated_in_place(world):
+    movers = query(Transform, Velocity)
+    result = movers.get()
+    ent = esper.create_entity(Transform(0, 0), Velocity())
+    esper.create_entity(Transform(1, 1), Velocity())
+
+    assert movers.get() is result
+    assert len(result) == 2
+
+    esper.delete_entity(ent, immediate=True)
+    assert movers.get() is result
+    assert [e for e, _ in result] != [ent]
+    assert len(result) == 1
+
+
+def test_unrelated_component_does_not_touch_the_entry(world):
+    movers = query(Transform, Velocity)
+    ent = esper.create_entity(Transform(0, 0), Velocity())
+    events = []
+    movers.watch(lambda e, value: events.append((e, value)))
+
+    esper.add_component(ent, Health(1, 1))
+    assert events == []
+
+    new_velocity = Velocity(5, 0)
+    esper.add_component(ent, new_velocity)
+    assert events == [(ent, (esper.component_for_entity(ent, Transform), new_velocity))]
+
+    esper.remove_component(ent, Transform)
+    assert events[-1] == (ent, None)
+
+
+def test_watch_is_idempotent(world):
+    sprites = query(Sprite)
+    events = []
+
+    def listener(ent, value):
+        events.append(ent)
+
+    assert sprites.watch(listener)
+    assert not sprites.watch(listener)
+    esper.create_entity(Transform(0, 0), Velocity())
+    assert events == []
+
+
+def test_clear_database_drops_the_index(world):
+    movers = query(Transform, Velocity)
+    esper.create_entity(Transform(0, 0), Velocity())
+    listener = lambda ent, value: None  # noqa: E731
+    movers.watch(listener)
+    assert queries.signatures(world) > 0
+
+    esper.clear_database()
+    assert queries.signatures(world) == 0
+    assert movers.get() == []
+    assert movers.watch(listener)  # Índice novo: inscrição nova
+
+
+def test_worlds_are_independent(world):
+    healths = query(Health)
+    esper.create_entity(Health(1, 1))
+    esper.switch_world("test_other")
+    try:
+        assert healths.get() == []
+        esper.create_entity(Health(2, 2))
+        esper.create_entity(Health(3, 3))
+        assert len(healths) == 2
+    finally:
+        esper.switch_world(world)
+        esper.delete_world("test_other")
+    assert len(healths) == 1
+
+
+def test_requires_install(world):
+    cache = QueryCache()
+    with pytest.raises(RuntimeError):
+        cache.register(Health).get()
@@ -0,0 +1,107 @@
+import esper
+import pygame
+
+from src.core.components import RenderState, Sprite, Transform
+from src.core.patterns import PatternEngine
+from src.core.render import RecordingBackend
+from src.core.resources import world_resources
+from src.core.systems import RenderProcessor
+
+
+def _frame(processor: RenderProcessor, backend: RecordingBackend, **context):
+    backend.begin_frame()
+    processor.process(context=context)
+    backend.end_frame()
+
+
+def test_one_blits_per_layer(world, surface):
+    backend = RecordingBackend()
+    processor = RenderProcessor(target=backend)
+    for i in range(5):
+        esper.create_entity(Transform(10 * i, 10), Sprite(surface, layer=0))
+    for i in range(3):
+        esper.create_entity(Transform(10 * i, 50), Sprite(surface, layer=2))
+
+    _frame(processor, backend)
+
+    assert backend.count("blits") == 2
+    assert backend.count("blit") == 0
+    sizes = [len(call.args[0]) for call in backend.calls]
+    assert sizes == [5, 3]  # Camada 0 primeiro (fundo)
+    assert processor.draw_calls == 2
+
+
+def test_offscreen_sprites_are_culled(world, surface):
+    backend = RecordingBackend()
+    processor = RenderProcessor(target=backend)
+    esper.create_entity(Transform(10, 10), Sprite(surface))
+    esper.create_entity(Transform(-50, 10), Sprite(surface))
+    esper.create_entity(Transform(10, 10_000), Sprite(surface))
+
+    _frame(processor, backend)
+
+    assert len(backend.calls[0].args[0]) == 1
+    assert processor.culled == 2
+
+
+def test_buckets_follow_spawns_despawns_and_layer_changes(world, surface):
+    backend = RecordingBackend()
+    processor = RenderProcessor(target=backend)
+    a = esper.create_entity(Transform(1, 1), Sprite(surface, layer=0))
+    b = esper.create_entity(Transform(2, 2), Sprite(surface, layer=1))
+    _frame(processor, backend)
+    assert backend.count("blits") == 2
+
+    esper.delete_entity(b, immediate=True)
+    esper.create_entity(Transform(3, 3), Sprite(surface, layer=0))
+    _frame(processor, backend)
+    assert [len(call.args[0]) for call in backend.calls] == [2]
+
+    esper.component_for_entity(a, Sprite).layer = 5
+    processor.mark_dirty()
+    _frame(processor, backend)
+    batches = [[item[1] for item in call.args[0]] for call in backend.calls]
+    assert batches == [[(3, 3)], [(1, 1)]]
+
+
+def test_render_state_variant_is_drawn(world, surface):
+    backend = RecordingBackend()
+    processor = RenderProcessor(target=backend)
+    ent = esper.create_entity(Transform(1, 1), Sprite(surface))
+    _frame(processor, backend)
+    assert backend.calls[0].args[0][0][0] is surface
+
+    esper.add_component(ent, RenderState(flash_timer=1.0))
+    _frame(processor, backend)
+    assert backend.calls[0].args[0][0][0] is not surface
+
+
+def test_engine_bullets_join_their_layer_batch(world, surface):
+    backend = RecordingBackend()
+    processor = RenderProcessor(target=backend)
+    esper.create_entity(Transform(1, 1), Sprite(surface, layer=1))
+    bullets = world_resources().insert(PatternEngine(sprite=Sprite(surface, layer=1)))
+    for x in (100, 200, -500):
+        bullets.add("linear", x, 100, 0.0, 0.0)
+
+    _frame(processor, backend)
+
+    assert backend.count("blits") == 1
+    assert len(backend.calls[0].args[0]) == 3
+    assert processor.culled == 1
+
+
+def test_totals_and_frames(surface):
+    backend = RecordingBackend()
+    for _ in range(3):
+        backend.begin_frame()
+        backend.fill((0, 0, 0))
+        backend.blit(surface, (0, 0))
+        backend.present()
+    backend.begin_frame()
+
+    assert backend.frames == 4
+    assert backend.calls == []
+    assert backend.totals == {"fill": 3, "blit": 3, "present": 3}
+    assert isinstance(backend.draw_rect((255, 0, 0), (0, 0, 4, 4)), pygame.Rect)
+    assert backend.count("draw_rect") == 1
@@ -0,0 +1,81 @@
+from src.core.render import NullBackend
+from src.core.scene import Scene, SceneManager
+
+
+class _Work:
+    """Preparação que termina depois de `steps` chamadas de `poll`."""
+
+    def __init__(self, steps: int):
+        self.steps = steps
+        self.polls = 0
+
+    def poll(self, budget: float) -> bool:
+        self.polls += 1
+        return self.polls >= self.steps
+
+
+class _Idle(Scene):
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.frames = 0
+
+    def process_input(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self):
+        pass
+
+    def on_frame(self):
+        self.frames += 1
+
+
+class _Next(_Idle):
+    built = 0
+    work: _Work | None = None
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        type(self).built += 1
+
+    @classmethod
+    def preload(cls):
+        return cls.work
+
+
+def _frame(manager: SceneManager, updates: int):
+    """Frame do loop principal: N passos fixos e um draw."""
+    for _ in range(updates):
+        manager.update(1 / 120)
+    manager.draw()
+
+
+def test_pending_switch_advances_once_per_frame_during_catch_up():
+    manager = SceneManager(NullBackend())
+    manager.switch_to(_Idle)
+    _Next.built = 0
+    _Next.work = _Work(2)
+    manager.switch_when_ready(_Next)
+
+    _frame(manager, 5)  # Preload: 1ª fatia
+    assert _Next.work.polls == 1
+    _frame(manager, 5)  # Preload termina
+    assert _Next.built == 0
+    _frame(manager, 5)  # Construção, ainda fora da pilha
+    assert _Next.built == 1
+    assert not isinstance(manager.current_scene, _Next)
+    _frame(manager, 5)  # Troca
+    assert isinstance(manager.current_scene, _Next)
+    assert manager.pending_scene is None
+
+
+def test_on_frame_runs_once_per_drawn_frame():
+    manager = SceneManager(NullBackend())
+    manager.switch_to(_Idle)
+    scene = manager.current_scene
+
+    _frame(manager, 4)
+    _frame(manager, 0)
+    assert scene.frames == 2